@@ -0,0 +1,67 @@
+from typing import (List,
+                    Tuple)
+
+from martinez.boolean import (OperationType,
+                              compute)
+from martinez.cache import ComputeCache
+from martinez.contour import Contour
+from martinez.point import Point
+from martinez.polygon import Polygon
+from .utils import (best_time,
+                    report,
+                    to_star_polygon)
+
+
+def to_tiles(size: int) -> List[Polygon]:
+    # grid is shifted off the axes,
+    # so tiles do not pass through star's center
+    start, step = -1.01, 2. / size
+    return [Polygon([Contour([Point(start + x * step, start + y * step),
+                              Point(start + (x + 1) * step,
+                                    start + y * step),
+                              Point(start + (x + 1) * step,
+                                    start + (y + 1) * step),
+                              Point(start + x * step,
+                                    start + (y + 1) * step)],
+                             [], True)])
+            for x in range(size)
+            for y in range(size)]
+
+
+def to_calls(layers_count: int, tiles_size: int, vertices_count: int
+             ) -> List[Tuple[Polygon, Polygon]]:
+    # masks same shape by tiles in every style layer,
+    # alternating operands order
+    shape = to_star_polygon(vertices_count)
+    tiles = to_tiles(tiles_size)
+    return [(shape, tile) if layer % 2 else (tile, shape)
+            for layer in range(layers_count)
+            for tile in tiles]
+
+
+def run_plain(calls: List[Tuple[Polygon, Polygon]]) -> None:
+    for left, right in calls:
+        compute(left, right, OperationType.INTERSECTION)
+
+
+def run_cached(calls: List[Tuple[Polygon, Polygon]]) -> ComputeCache:
+    cache = ComputeCache(10 ** 6)
+    for left, right in calls:
+        cache.compute(left, right, OperationType.INTERSECTION)
+    return cache
+
+
+def main() -> None:
+    for layers_count in (2, 8):
+        calls = to_calls(layers_count, 8, 1000)
+        cache = run_cached(calls)
+        report('masking by tiles, {} layers ({} hits, {} misses)'
+               .format(layers_count, cache.hits, cache.misses),
+               best_time(lambda: run_plain(calls),
+                         repeat=3),
+               best_time(lambda: run_cached(calls),
+                         repeat=3))
+
+
+if __name__ == '__main__':
+    main()
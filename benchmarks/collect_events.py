@@ -0,0 +1,58 @@
+import random
+from typing import List
+
+from martinez.boolean import (EventsQueueKey,
+                              Operation,
+                              OperationType,
+                              SweepEvent)
+from .utils import (best_time,
+                    report,
+                    to_overlapping_stars_pair)
+
+
+def bubble_collect_events(events: List[SweepEvent]) -> List[SweepEvent]:
+    result = [event
+              for event in events
+              if event.is_left and event.in_result
+              or not event.is_left and event.other_event.in_result]
+    is_sorted = False
+    while not is_sorted:
+        is_sorted = True
+        for index in range(len(result) - 1):
+            if (EventsQueueKey(result[index])
+                    < EventsQueueKey(result[index + 1])):
+                result[index], result[index + 1] = (result[index + 1],
+                                                    result[index])
+                is_sorted = False
+    for index, event in enumerate(result):
+        event.position = index
+        if not event.is_left:
+            event.position, event.other_event.position = (
+                event.other_event.position, event.position)
+    return result
+
+
+def to_swept_events(vertices_count: int) -> List[SweepEvent]:
+    left, right = to_overlapping_stars_pair(vertices_count)
+    operation = Operation(left, right, OperationType.UNION)
+    operation.process_segments()
+    return operation.sweep()
+
+
+def main() -> None:
+    for vertices_count in (100, 1000, 10000):
+        events = to_swept_events(vertices_count)
+        report('sweep order, {} vertices'.format(vertices_count),
+               best_time(lambda: bubble_collect_events(events)),
+               best_time(lambda: Operation.collect_events(events)))
+    for vertices_count in (100, 200, 400):
+        shuffled_events = to_swept_events(vertices_count)
+        random.Random(vertices_count).shuffle(shuffled_events)
+        report('shuffled, {} vertices'.format(vertices_count),
+               best_time(lambda: bubble_collect_events(shuffled_events),
+                         repeat=1),
+               best_time(lambda: Operation.collect_events(shuffled_events)))
+
+
+if __name__ == '__main__':
+    main()
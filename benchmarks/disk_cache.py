@@ -0,0 +1,26 @@
+import tempfile
+
+from martinez.boolean import (OperationType,
+                              compute)
+from martinez.cache import DiskCache
+from .utils import (best_time,
+                    report,
+                    to_overlapping_stars_pair)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        for vertices_count in (100, 1000):
+            left, right = to_overlapping_stars_pair(vertices_count)
+            # cache is instantiated per call like in restarted workers
+            DiskCache(directory, 10 ** 8).compute(left, right,
+                                                  OperationType.UNION)
+            report('union of stars with {} vertices'.format(vertices_count),
+                   best_time(lambda: compute(left, right,
+                                             OperationType.UNION)),
+                   best_time(lambda: DiskCache(directory, 10 ** 8)
+                             .compute(left, right, OperationType.UNION)))
+
+
+if __name__ == '__main__':
+    main()
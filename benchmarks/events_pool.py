@@ -0,0 +1,118 @@
+import gc
+import tracemalloc
+from typing import (List,
+                    Tuple,
+                    Type)
+
+from martinez.boolean import (EdgeType,
+                              EventsQueueKey,
+                              Operation,
+                              OperationType,
+                              SweepEvent,
+                              dismantle_events)
+from martinez.contour import Contour
+from martinez.point import Point
+from martinez.polygon import Polygon
+from .utils import (best_time,
+                    report,
+                    to_star_polygon)
+
+# events of finished operations shared by all operations in the process
+events_pool = []  # type: List[SweepEvent]
+# only events of divided segments are taken from the pool,
+# so it is capped to keep it from growing with each operation
+MAX_EVENTS_POOL_SIZE = 10000
+
+
+class PoolingOperation(Operation):
+    # prototype of the declined sweep events pool,
+    # kept to reproduce measurements of the decision
+    __slots__ = ()
+
+    def divide_segment(self, event: SweepEvent, point: Point) -> None:
+        left_event = to_pooled_event(True, point, event.other_event,
+                                     event.polygon_type)
+        right_event = to_pooled_event(False, point, event,
+                                      event.polygon_type)
+        if EventsQueueKey(left_event) < EventsQueueKey(event.other_event):
+            event.other_event.is_left = True
+            self._events_queue.update(event.other_event)
+            left_event.is_left = False
+        event.other_event.other_event = left_event
+        event.other_event.reset_coordinates()
+        event.other_event = right_event
+        event.reset_coordinates()
+        self._events_queue.push(left_event)
+        self._events_queue.push(right_event)
+
+    @staticmethod
+    def _dismantle(events: List[SweepEvent]) -> None:
+        dismantle_events(events)
+        events_pool.extend(events[:MAX_EVENTS_POOL_SIZE - len(events_pool)])
+
+
+def to_pooled_event(is_left: bool, point: Point,
+                    other_event: SweepEvent,
+                    polygon_type: int) -> SweepEvent:
+    if not events_pool:
+        return SweepEvent(is_left, point, other_event, polygon_type,
+                          EdgeType.NORMAL)
+    result = events_pool.pop()
+    result.__init__(is_left, point, other_event, polygon_type,
+                    EdgeType.NORMAL)
+    return result
+
+
+def to_near_coincident_pair(vertices_count: int) -> Tuple[Polygon, Polygon]:
+    # boundaries cross at almost every edge
+    left = to_star_polygon(vertices_count)
+    right = Polygon([Contour([Point(point.x + 1e-3, point.y + 1e-3)
+                              for point in contour.points],
+                             [], True)
+                     for contour in left.contours])
+    return left, right
+
+
+def run_batch(cls: Type[Operation], left: Polygon, right: Polygon,
+              count: int) -> None:
+    for _ in range(count):
+        cls(left, right, OperationType.UNION).run()
+
+
+def to_peak_size(cls: Type[Operation], left: Polygon, right: Polygon,
+                 count: int) -> int:
+    # pool is emptied before tracing starts,
+    # so events it allocates are counted as well
+    events_pool.clear()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run_batch(cls, left, right, count)
+        _, result = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result
+
+
+def main() -> None:
+    batch_size = 10
+    for vertices_count in (100, 1000):
+        left, right = to_near_coincident_pair(vertices_count)
+        report('batch of {} unions, {} vertices'
+               .format(batch_size, vertices_count),
+               best_time(lambda: run_batch(Operation, left, right,
+                                           batch_size)),
+               best_time(lambda: run_batch(PoolingOperation, left, right,
+                                           batch_size)))
+        print('peak memory, batch of {} unions, {} vertices: '
+              '{:.2f}MB -> {:.2f}MB'
+              .format(batch_size, vertices_count,
+                      to_peak_size(Operation, left, right, batch_size)
+                      / 2 ** 20,
+                      to_peak_size(PoolingOperation, left, right,
+                                   batch_size)
+                      / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
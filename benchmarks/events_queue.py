@@ -0,0 +1,46 @@
+import random
+from typing import List
+
+from martinez.boolean import (EventsQueue,
+                              Operation,
+                              OperationType,
+                              SweepEvent)
+from .utils import (best_time,
+                    report,
+                    to_overlapping_stars_pair)
+
+
+def to_initial_events(vertices_count: int) -> List[SweepEvent]:
+    left, right = to_overlapping_stars_pair(vertices_count)
+    operation = Operation(left, right, OperationType.UNION)
+    operation.process_segments()
+    result = operation.events
+    random.Random(vertices_count).shuffle(result)
+    return result
+
+
+def drain_pushed(events: List[SweepEvent]) -> None:
+    events_queue = EventsQueue()
+    for event in events:
+        events_queue.push(event)
+    while events_queue:
+        events_queue.pop()
+
+
+def drain_loaded(events: List[SweepEvent]) -> None:
+    events_queue = EventsQueue()
+    events_queue.load(events)
+    while events_queue:
+        events_queue.pop()
+
+
+def main() -> None:
+    for vertices_count in (1000, 10000, 100000):
+        events = to_initial_events(vertices_count)
+        report('{} vertices'.format(vertices_count),
+               best_time(lambda: drain_pushed(events)),
+               best_time(lambda: drain_loaded(events)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+import gc
+import tracemalloc
+from typing import Type
+
+from martinez.boolean import (Operation,
+                              OperationType)
+from martinez.events_store import StoredOperation
+from martinez.polygon import Polygon
+from .utils import (best_time,
+                    report,
+                    to_overlapping_stars_pair)
+
+
+def run(cls: Type[Operation], left: Polygon, right: Polygon) -> Operation:
+    result = cls(left, right, OperationType.XOR)
+    result.run()
+    return result
+
+
+def to_peak_size(cls: Type[Operation], left: Polygon, right: Polygon) -> int:
+    tracemalloc.start()
+    try:
+        operation = run(cls, left, right)
+        _, result = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del operation
+    return result
+
+
+def to_tracked_objects_count(cls: Type[Operation],
+                             left: Polygon, right: Polygon) -> int:
+    gc.collect()
+    initial_count = len(gc.get_objects())
+    operation = run(cls, left, right)
+    result = len(gc.get_objects()) - initial_count
+    del operation
+    return result
+
+
+def main() -> None:
+    for vertices_count in (100, 1000, 3000):
+        left, right = to_overlapping_stars_pair(vertices_count)
+        report('xor, {} vertices'.format(vertices_count),
+               best_time(lambda: run(Operation, left, right)),
+               best_time(lambda: run(StoredOperation, left, right)))
+        baseline_size, size = (to_peak_size(Operation, left, right),
+                               to_peak_size(StoredOperation, left, right))
+        print('peak memory, {} vertices: {:.2f}MB -> {:.2f}MB ({:.1f}x)'
+              .format(vertices_count, baseline_size / 2 ** 20,
+                      size / 2 ** 20, baseline_size / size))
+        baseline_count, count = (
+            to_tracked_objects_count(Operation, left, right),
+            to_tracked_objects_count(StoredOperation, left, right))
+        print('gc-tracked objects, {} vertices: {} -> {} ({:.1f}x)'
+              .format(vertices_count, baseline_count, count,
+                      baseline_count / count))
+
+
+if __name__ == '__main__':
+    main()
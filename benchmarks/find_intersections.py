@@ -0,0 +1,42 @@
+import random
+from typing import (List,
+                    Tuple)
+
+from martinez.point import Point
+from martinez.segment import Segment
+from martinez.utilities import (find_intersections,
+                                find_intersections_by_endpoints)
+from .utils import (best_time,
+                    report)
+
+
+def to_segments_pairs(count: int,
+                      *,
+                      length: float,
+                      seed: int = 0) -> List[Tuple[Segment, Segment]]:
+    generator = random.Random(seed)
+
+    def to_segment() -> Segment:
+        x, y = generator.random(), generator.random()
+        return Segment(Point(x, y),
+                       Point(x + generator.uniform(-length, length),
+                             y + generator.uniform(-length, length)))
+
+    return [(to_segment(), to_segment()) for _ in range(count)]
+
+
+def main() -> None:
+    for length in (0.01, 0.1, 1.):
+        pairs = to_segments_pairs(10000,
+                                  length=length)
+        report('segments of length up to {}'.format(length),
+               best_time(lambda: [find_intersections(first, second)
+                                  for first, second in pairs]),
+               best_time(lambda: [find_intersections_by_endpoints(
+                       first.source, first.target,
+                       second.source, second.target)
+                   for first, second in pairs]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+from typing import List
+
+from martinez.contour import Contour
+from martinez.frozen import freeze
+from martinez.point import Point
+from martinez.polygon import Polygon
+from .utils import (best_time,
+                    report,
+                    to_star_polygon)
+
+
+def to_batch(polygons_count: int, vertices_count: int) -> List[Polygon]:
+    # polygons differing only in last vertex with every one repeated twice,
+    # so equality checks have to scan them to the end
+    star = to_star_polygon(vertices_count)
+    points = star.contours[0].points
+    result = []
+    for index in range(polygons_count // 2):
+        contour_points = points[:-1] + [Point(float(index), 0.)]
+        result.append(Polygon([Contour(contour_points, [], True)]))
+        result.append(Polygon([Contour([Point(point.x, point.y)
+                                        for point in contour_points],
+                                       [], True)]))
+    return result
+
+
+def deduplicate_by_equality(polygons: List[Polygon]) -> int:
+    unique = []
+    for polygon in polygons:
+        if polygon not in unique:
+            unique.append(polygon)
+    return len(unique)
+
+
+def deduplicate_by_fingerprints(polygons: List[Polygon]) -> int:
+    return len({freeze(polygon) for polygon in polygons})
+
+
+def main() -> None:
+    for polygons_count, vertices_count in ((100, 1000), (1000, 100)):
+        polygons = to_batch(polygons_count, vertices_count)
+        assert (deduplicate_by_equality(polygons)
+                == deduplicate_by_fingerprints(polygons))
+        report('deduplicating {} polygons of {} vertices'
+               .format(polygons_count, vertices_count),
+               best_time(lambda: deduplicate_by_equality(polygons)),
+               best_time(lambda: deduplicate_by_fingerprints(polygons)))
+
+
+if __name__ == '__main__':
+    main()
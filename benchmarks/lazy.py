@@ -0,0 +1,74 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import (List,
+                    Optional,
+                    Tuple)
+
+from martinez.boolean import (Operation,
+                              OperationType)
+from martinez.lazy import (LazyOperation,
+                           prefetch)
+from martinez.polygon import Polygon
+from .utils import (best_time,
+                    report,
+                    to_overlapping_stars_pair)
+
+
+def to_candidates(count: int, vertices_count: int
+                  ) -> List[Tuple[Polygon, Polygon]]:
+    return [to_overlapping_stars_pair(vertices_count,
+                                      seed=index)
+            for index in range(count)]
+
+
+def read_eagerly(candidates: List[Tuple[Polygon, Polygon]],
+                 step: int) -> None:
+    operations = [Operation(left, right, OperationType.INTERSECTION)
+                  for left, right in candidates]
+    for operation in operations:
+        operation.run()
+    for operation in operations[::step]:
+        operation.resultant.area
+
+
+def read_lazily(candidates: List[Tuple[Polygon, Polygon]],
+                step: int) -> None:
+    operations = [LazyOperation(Operation(left, right,
+                                          OperationType.INTERSECTION))
+                  for left, right in candidates]
+    for operation in operations[::step]:
+        operation.area
+
+
+def run_lazy_operations(candidates: List[Tuple[Polygon, Polygon]],
+                        executor: Optional[ProcessPoolExecutor] = None
+                        ) -> None:
+    operations = [LazyOperation(Operation(left, right,
+                                          OperationType.INTERSECTION))
+                  for left, right in candidates]
+    if executor is None:
+        prefetch(operations)
+    else:
+        prefetch(operations, executor.map)
+
+
+def main() -> None:
+    candidates = to_candidates(20, 300)
+    step = 10
+    report('reading every {}-th of {} intersections'.format(step,
+                                                            len(candidates)),
+           best_time(lambda: read_eagerly(candidates, step),
+                     repeat=3),
+           best_time(lambda: read_lazily(candidates, step),
+                     repeat=3))
+    with ProcessPoolExecutor(4) as executor:
+        run_lazy_operations(candidates[:4], executor)
+        report('prefetching {} intersections with 4 worker processes'
+               .format(len(candidates)),
+               best_time(lambda: run_lazy_operations(candidates),
+                         repeat=3),
+               best_time(lambda: run_lazy_operations(candidates, executor),
+                         repeat=3))
+
+
+if __name__ == '__main__':
+    main()
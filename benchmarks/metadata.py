@@ -0,0 +1,41 @@
+from functools import reduce
+from operator import add
+
+from martinez.bounding_box import BoundingBox
+from martinez.polygon import Polygon
+from .utils import (best_time,
+                    report,
+                    to_overlapping_stars_pair)
+
+
+def to_uncached_bounding_box(polygon: Polygon) -> BoundingBox:
+    return reduce(add, [point.bounding_box
+                        for contour in polygon.contours
+                        for point in contour.points])
+
+
+def to_uncached_orientations(polygon: Polygon) -> list:
+    result = []
+    for contour in polygon.contours:
+        points = contour.points
+        result.append(sum(points[index].x * points[(index + 1) % len(points)].y
+                          - points[(index + 1) % len(points)].x
+                          * points[index].y
+                          for index in range(len(points))) >= 0)
+    return result
+
+
+def main() -> None:
+    for vertices_count in (1000, 10000, 100000):
+        left, _ = to_overlapping_stars_pair(vertices_count)
+        report('bounding box, {} vertices'.format(vertices_count),
+               best_time(lambda: to_uncached_bounding_box(left)),
+               best_time(lambda: left.bounding_box))
+        report('orientation, {} vertices'.format(vertices_count),
+               best_time(lambda: to_uncached_orientations(left)),
+               best_time(lambda: [contour.is_counterclockwise
+                                  for contour in left.contours]))
+
+
+if __name__ == '__main__':
+    main()
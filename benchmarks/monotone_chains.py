@@ -0,0 +1,29 @@
+from martinez.boolean import (Operation,
+                              OperationType,
+                              compute)
+from .utils import (best_time,
+                    report,
+                    to_overlapping_strips_pair)
+
+
+def main() -> None:
+    for vertices_count in (1000, 10000, 50000):
+        left, right = to_overlapping_strips_pair(vertices_count)
+        for monotone_chains in (False, True):
+            operation = Operation(left, right, OperationType.UNION,
+                                  monotone_chains=monotone_chains)
+            operation.process_segments()
+            print('{} vertices, {}: {} initially queued events'
+                  .format(vertices_count,
+                          'monotone chains' if monotone_chains else 'edges',
+                          len(operation.events)))
+        report('{} vertices'.format(vertices_count),
+               best_time(lambda: compute(left, right, OperationType.UNION),
+                         repeat=3),
+               best_time(lambda: compute(left, right, OperationType.UNION,
+                                         monotone_chains=True),
+                         repeat=3))
+
+
+if __name__ == '__main__':
+    main()
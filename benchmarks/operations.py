@@ -0,0 +1,19 @@
+from martinez.boolean import (OperationType,
+                              compute)
+from .utils import (best_time,
+                    to_overlapping_stars_pair)
+
+
+def main() -> None:
+    for vertices_count in (10, 100, 1000):
+        left, right = to_overlapping_stars_pair(vertices_count)
+        for operation_type in OperationType:
+            print('{}, {} vertices: {:.6f}s'
+                  .format(operation_type.name.lower(), vertices_count,
+                          best_time(lambda: compute(left, right,
+                                                    operation_type),
+                                    number=max(1000 // vertices_count, 1))))
+
+
+if __name__ == '__main__':
+    main()
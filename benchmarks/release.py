@@ -0,0 +1,85 @@
+import gc
+import time
+import tracemalloc
+from typing import (List,
+                    Tuple,
+                    Type)
+
+from martinez.boolean import (Operation,
+                              OperationType,
+                              SweepEvent)
+from martinez.polygon import Polygon
+from .utils import (best_time,
+                    report,
+                    to_overlapping_stars_pair)
+
+
+class RetainingOperation(Operation):
+    # leaves events graph to cyclic garbage collector
+    __slots__ = ()
+
+    def release(self) -> None:
+        pass
+
+    @staticmethod
+    def _dismantle(events: List[SweepEvent]) -> None:
+        pass
+
+
+def run_overlays(cls: Type[Operation], left: Polygon, right: Polygon,
+                 count: int,
+                 *,
+                 suspend_gc: bool = False) -> None:
+    for _ in range(count):
+        operation = cls(left, right, OperationType.XOR,
+                        suspend_gc=suspend_gc)
+        operation.run()
+
+
+def to_garbage_stats(cls: Type[Operation], left: Polygon, right: Polygon,
+                     count: int) -> Tuple[int, int, float]:
+    # memory held until the next collection, peak memory & collection pause
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        run_overlays(cls, left, right, count)
+        size, peak_size = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        gc.collect()
+        pause = time.perf_counter() - start
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+    return size, peak_size, pause
+
+
+def main() -> None:
+    overlays_count = 10
+    for vertices_count in (100, 1000):
+        left, right = to_overlapping_stars_pair(vertices_count)
+        baseline_size, baseline_peak_size, baseline_pause = (
+            to_garbage_stats(RetainingOperation, left, right,
+                             overlays_count))
+        size, peak_size, pause = to_garbage_stats(Operation, left, right,
+                                                  overlays_count)
+        print('uncollected memory, {} overlays of {} vertices: '
+              '{:.2f}MB -> {:.2f}MB'
+              .format(overlays_count, vertices_count,
+                      baseline_size / 2 ** 20, size / 2 ** 20))
+        print('peak memory, {} overlays of {} vertices: '
+              '{:.2f}MB -> {:.2f}MB'
+              .format(overlays_count, vertices_count,
+                      baseline_peak_size / 2 ** 20, peak_size / 2 ** 20))
+        report('collection pause, {} overlays of {} vertices'
+               .format(overlays_count, vertices_count),
+               baseline_pause, pause)
+        report('xor with suspended collector, {} vertices'
+               .format(vertices_count),
+               best_time(lambda: run_overlays(Operation, left, right, 1)),
+               best_time(lambda: run_overlays(Operation, left, right, 1,
+                                              suspend_gc=True)))
+
+
+if __name__ == '__main__':
+    main()
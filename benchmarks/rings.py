@@ -0,0 +1,76 @@
+from typing import List
+
+from martinez.boolean import (Operation,
+                              OperationType,
+                              SweepEvent,
+                              compute)
+from martinez.contour import Contour
+from martinez.point import Point
+from martinez.polygon import Polygon
+from .utils import (best_time,
+                    report,
+                    to_overlapping_stars_pair)
+
+
+def to_perforated_polygon(size: int) -> Polygon:
+    # square with a hole in every unit cell
+    contours = [Contour([Point(0., 0.), Point(size, 0.), Point(size, size),
+                         Point(0., size)],
+                        list(range(1, size * size + 1)), True)]
+    for x in range(size):
+        for y in range(size):
+            contours.append(Contour([Point(x + 0.25, y + 0.25),
+                                     Point(x + 0.25, y + 0.75),
+                                     Point(x + 0.75, y + 0.75),
+                                     Point(x + 0.75, y + 0.25)], [],
+                                    False))
+    return Polygon(contours)
+
+
+def to_events(left: Polygon, right: Polygon,
+              operation_type: OperationType) -> List[SweepEvent]:
+    operation = Operation(left, right, operation_type)
+    operation.process_segments()
+    return operation.collect_events(operation.sweep())
+
+
+def connect(left: Polygon, right: Polygon, operation_type: OperationType,
+            events: List[SweepEvent],
+            *,
+            flat: bool) -> None:
+    operation = Operation(left, right, operation_type,
+                          flat=flat)
+    operation.process_events(events)
+
+
+def main() -> None:
+    for size in (10, 30):
+        left = to_perforated_polygon(size)
+        right = Polygon([Contour([Point(0.5, -1.), Point(size + 1., -1.),
+                                  Point(size + 1., size - 0.5)], [], True)])
+        events = to_events(left, right, OperationType.XOR)
+        report('connecting edges, {} holes'.format(size * size),
+               best_time(lambda: connect(left, right, OperationType.XOR,
+                                         events,
+                                         flat=False)),
+               best_time(lambda: connect(left, right, OperationType.XOR,
+                                         events,
+                                         flat=True)))
+        report('xor, {} holes'.format(size * size),
+               best_time(lambda: compute(left, right, OperationType.XOR)),
+               best_time(lambda: compute(left, right, OperationType.XOR,
+                                         flat=True)))
+    for vertices_count in (100, 1000):
+        left, right = to_overlapping_stars_pair(vertices_count)
+        events = to_events(left, right, OperationType.UNION)
+        report('connecting edges, {} vertices'.format(vertices_count),
+               best_time(lambda: connect(left, right, OperationType.UNION,
+                                         events,
+                                         flat=False)),
+               best_time(lambda: connect(left, right, OperationType.UNION,
+                                         events,
+                                         flat=True)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+from typing import (Callable,
+                    List)
+
+from martinez.boolean import (EventsQueueKey,
+                              EventsQueueTiebreaker,
+                              Operation,
+                              OperationType,
+                              SweepEvent,
+                              SweepLineKey)
+from martinez.sweep_line import SweepLine
+from martinez.utilities import sign
+from .utils import (best_time,
+                    report,
+                    to_overlapping_stars_pair)
+
+
+class UncachedSweepLineKey(SweepLineKey):
+    __slots__ = ()
+
+    def __lt__(self, other: 'UncachedSweepLineKey') -> bool:
+        if self is other:
+            return False
+        if not (sign(self.event.point, self.event.other_event.point,
+                     other.event.point)
+                or sign(self.event.point, self.event.other_event.point,
+                        other.event.other_event.point)):
+            return (EventsQueueKey(self.event) < EventsQueueKey(other.event)
+                    if self.event.polygon_type is other.event.polygon_type
+                    else self.event.polygon_type < other.event.polygon_type)
+        elif self.event.point == other.event.point:
+            return uncached_is_below(self.event,
+                                     other.event.other_event.point)
+        elif self.event.point.x == other.event.point.x:
+            return self.event.point.y < other.event.point.y
+        elif EventsQueueKey(self.event) < EventsQueueKey(other.event):
+            return not uncached_is_below(other.event, self.event.point)
+        else:
+            return uncached_is_below(self.event, other.event.point)
+
+
+class UncachedEventsQueueTiebreaker(EventsQueueTiebreaker):
+    __slots__ = ()
+
+    def __lt__(self, other: 'UncachedEventsQueueTiebreaker') -> bool:
+        event, other_event = self.event, other.event
+        if sign(other_event.point, other_event.other_event.point,
+                event.other_event.point):
+            return not uncached_is_below(other_event,
+                                         event.other_event.point)
+        else:
+            return other_event.polygon_type > event.polygon_type
+
+
+def uncached_is_below(event: SweepEvent, point) -> bool:
+    event.validate()
+    return (sign(event.point, event.other_event.point, point) == 1
+            if event.is_left
+            else sign(event.other_event.point, event.point, point) == 1)
+
+
+def replay(events: List[SweepEvent],
+           key: Callable[[SweepEvent], SweepLineKey]) -> None:
+    for event in events:
+        event.reset_coordinates()
+    sweep_line = SweepLine(key)
+    for event in events:
+        if event.is_left:
+            sweep_line.add(event)
+        else:
+            node = sweep_line.find(event.other_event)
+            if node is not None:
+                sweep_line.remove(node)
+
+
+def sort_events(events: List[SweepEvent],
+                tiebreaker: Callable[[SweepEvent],
+                                     EventsQueueTiebreaker]) -> None:
+    for event in events:
+        event.reset_coordinates()
+    sorted(events,
+           key=lambda event: (event.point.x, event.point.y, event.is_left,
+                              tiebreaker(event)))
+
+
+def to_swept_events(vertices_count: int) -> List[SweepEvent]:
+    left, right = to_overlapping_stars_pair(vertices_count)
+    operation = Operation(left, right, OperationType.UNION)
+    operation.process_segments()
+    return operation.sweep()
+
+
+def main() -> None:
+    for vertices_count in (100, 300, 1000):
+        events = to_swept_events(vertices_count)
+        report('sweep line, {} vertices'.format(vertices_count),
+               best_time(lambda: replay(events, UncachedSweepLineKey)),
+               best_time(lambda: replay(events, SweepLineKey)))
+        report('events ordering, {} vertices'.format(vertices_count),
+               best_time(lambda: sort_events(events,
+                                             UncachedEventsQueueTiebreaker)),
+               best_time(lambda: sort_events(events, EventsQueueTiebreaker)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+from martinez.boolean import (OperationType,
+                              compute)
+from martinez.contour import Contour
+from martinez.polygon import Polygon
+from .utils import (best_time,
+                    report,
+                    to_star_polygon)
+
+
+def to_stars_collection(stars_count: int, vertices_count: int,
+                        *,
+                        offset: float = 0.) -> Polygon:
+    result = Polygon([])
+    for index in range(stars_count):
+        result.join(to_star_polygon(vertices_count,
+                                    center=(3. * index, offset),
+                                    seed=index))
+    return result
+
+
+def copy_polygon(polygon: Polygon) -> Polygon:
+    # copies vertices storage the way results were isolated from inputs
+    return Polygon([Contour(contour.points[:], contour.holes[:],
+                            contour.is_external)
+                    for contour in polygon.contours])
+
+
+def copying_union(left: Polygon, right: Polygon) -> Polygon:
+    result = copy_polygon(left)
+    result.join(copy_polygon(right))
+    return result
+
+
+def main() -> None:
+    for stars_count, vertices_count in ((10, 10000), (1000, 100)):
+        left = to_stars_collection(stars_count, vertices_count)
+        right = to_stars_collection(stars_count, vertices_count,
+                                    offset=10.)
+        title = '{} stars of {} vertices'.format(stars_count,
+                                                 vertices_count)
+        report('disjoint union, ' + title,
+               best_time(lambda: copying_union(left, right)),
+               best_time(lambda: compute(left, right, OperationType.UNION)))
+        report('join, ' + title,
+               best_time(lambda: copy_polygon(left).join(right)),
+               best_time(lambda: left.share().join(right)))
+
+
+if __name__ == '__main__':
+    main()
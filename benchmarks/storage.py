@@ -0,0 +1,70 @@
+import tracemalloc
+from typing import Callable
+
+from martinez.boolean import (OperationType,
+                              compute)
+from martinez.contour import Contour
+from martinez.polygon import Polygon
+from .utils import (best_time,
+                    report,
+                    to_overlapping_strips_pair,
+                    to_star_polygon)
+
+
+def to_packed_polygon(polygon: Polygon, typecode: str = 'd') -> Polygon:
+    return Polygon([Contour.from_coordinates(contour.coordinates,
+                                             contour.holes,
+                                             contour.is_external,
+                                             typecode=typecode)
+                    for contour in polygon.contours])
+
+
+def to_allocated_size(factory: Callable[[], Polygon]) -> int:
+    tracemalloc.start()
+    try:
+        polygon = factory()
+        result, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del polygon
+    return result
+
+
+def main() -> None:
+    vertices_count = 10 ** 6
+    polygon = to_star_polygon(vertices_count)
+    coordinates = polygon.contours[0].coordinates
+    baseline_size = to_allocated_size(
+            lambda: to_packed_polygon(polygon).contours[0].points)
+    for typecode in ('d', 'f'):
+        size = to_allocated_size(
+                lambda: Polygon([Contour.from_coordinates(coordinates, [],
+                                                          True,
+                                                          typecode=typecode)]))
+        print('memory, {} vertices, {!r}: {:.1f}MB -> {:.1f}MB ({:.1f}x)'
+              .format(vertices_count, typecode, baseline_size / 2 ** 20,
+                      size / 2 ** 20, baseline_size / size))
+    packed_polygon = to_packed_polygon(polygon)
+    report('bounding box & orientation, {} vertices'.format(vertices_count),
+           best_time(lambda: Polygon([Contour(polygon.contours[0].points, [],
+                                              True)]).contours[0]
+                     .is_counterclockwise),
+           best_time(lambda: Polygon([packed_polygon.contours[0]
+                                      .with_holes([])]).contours[0]
+                     .is_counterclockwise))
+    # live points are traversed by garbage collector
+    del polygon, packed_polygon
+    for vertices_count in (1000, 10000):
+        left, right = to_overlapping_strips_pair(vertices_count)
+        packed_left, packed_right = (to_packed_polygon(left),
+                                     to_packed_polygon(right))
+        report('intersection, {} vertices'.format(vertices_count),
+               best_time(lambda: compute(left, right,
+                                         OperationType.INTERSECTION)),
+               best_time(lambda: compute(packed_left, packed_right,
+                                         OperationType.INTERSECTION,
+                                         typecode='d')))
+
+
+if __name__ == '__main__':
+    main()
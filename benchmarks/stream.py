@@ -0,0 +1,67 @@
+import time
+import tracemalloc
+from typing import (Callable,
+                    Tuple)
+
+from martinez.boolean import (OperationType,
+                              compute,
+                              stream)
+from martinez.contour import Contour
+from martinez.polygon import Polygon
+from .utils import to_overlapping_strips_pair
+
+
+def serialize(contour: Contour) -> bytes:
+    return repr(contour.coordinates).encode()
+
+
+def consume_computed(left: Polygon, right: Polygon) -> float:
+    # returns time to the first contour
+    start = time.perf_counter()
+    result = compute(left, right, OperationType.XOR)
+    first_contour_time = time.perf_counter() - start
+    for contour in result.contours:
+        serialize(contour)
+    return first_contour_time
+
+
+def consume_streamed(left: Polygon, right: Polygon) -> float:
+    start = time.perf_counter()
+    first_contour_time = None
+    for _, _, contour in stream(left, right, OperationType.XOR):
+        if first_contour_time is None:
+            first_contour_time = time.perf_counter() - start
+        serialize(contour)
+    return first_contour_time
+
+
+def to_stats(consume: Callable[[Polygon, Polygon], float],
+             left: Polygon, right: Polygon) -> Tuple[float, float, int]:
+    # time to the first contour, total time & peak memory
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        first_contour_time = consume(left, right)
+        total_time = time.perf_counter() - start
+        _, peak_size = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return first_contour_time, total_time, peak_size
+
+
+def main() -> None:
+    for vertices_count in (1000, 10000):
+        left, right = to_overlapping_strips_pair(vertices_count)
+        for name, consume in [('computed', consume_computed),
+                              ('streamed', consume_streamed)]:
+            first_contour_time, total_time, peak_size = to_stats(consume,
+                                                                 left, right)
+            print('xor of strips with {} vertices, {}: '
+                  'first contour after {:.3f}s, total {:.3f}s, '
+                  'peak memory {:.2f}MB'
+                  .format(vertices_count, name, first_contour_time,
+                          total_time, peak_size / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+import math
+from typing import List
+
+from martinez.boolean import (EdgeType,
+                              Operation,
+                              OperationType,
+                              PolygonType,
+                              SweepEvent,
+                              UnprocessedPositions)
+from martinez.contour import Contour
+from martinez.point import Point
+from martinez.polygon import Polygon
+from .utils import (best_time,
+                    report)
+
+
+def to_next_position(position: int, events: List[SweepEvent],
+                     processed: List[bool]) -> int:
+    result = position + 1
+    while (result < len(events)
+           and events[result].point == events[position].point):
+        if not processed[result]:
+            return result
+        else:
+            result += 1
+    if not position:
+        return 0
+    result = position - 1
+    while processed[result]:
+        if not result:
+            break
+        result -= 1
+    return result
+
+
+class ScanningOperation(Operation):
+    __slots__ = ()
+
+    def process_events(self, events: List[SweepEvent]) -> None:
+        # baseline with linear scans over processed flags
+        depth, hole_of = [], []
+        processed = [False] * len(events)
+        contours = self._resultant.contours
+        for index, event in enumerate(events):
+            if processed[index]:
+                continue
+            contour = Contour([], [], True)
+            contour_id = len(contours)
+            contours.append(contour)
+            depth.append(0)
+            hole_of.append(-1)
+            if event.prev_in_result_event is not None:
+                lower_contour_id = event.prev_in_result_event.contour_id
+                if not event.prev_in_result_event.result_in_out:
+                    contours[lower_contour_id].add_hole(contour_id)
+                    hole_of[contour_id] = lower_contour_id
+                    depth[contour_id] = depth[lower_contour_id] + 1
+                    contour.is_external = False
+                elif not contours[lower_contour_id].is_external:
+                    contours[hole_of[lower_contour_id]].add_hole(contour_id)
+                    hole_of[contour_id] = hole_of[lower_contour_id]
+                    depth[contour_id] = depth[lower_contour_id]
+                    contour.is_external = False
+            position = index
+            initial = event.point
+            contour.add(initial)
+            event = events[position]
+            while event.other_event.point != initial:
+                processed[position] = True
+                if event.is_left:
+                    event.result_in_out = False
+                    event.contour_id = contour_id
+                else:
+                    event.other_event.result_in_out = True
+                    event.other_event.contour_id = contour_id
+                position = event.position
+                processed[position] = True
+                contour.add(events[position].point)
+                position = to_next_position(position, events, processed)
+                event = events[position]
+            processed[position] = processed[event.position] = True
+            event.other_event.result_in_out = True
+            event.other_event.contour_id = contour_id
+            if depth[contour_id] & 1:
+                contour.reverse()
+
+
+def to_fan_polygon(sectors_count: int) -> Polygon:
+    # every other sector of a disk, all of them touch at the center
+    center = Point(0., 0.)
+    points = [Point(math.cos(2 * math.pi * index / sectors_count),
+                    math.sin(2 * math.pi * index / sectors_count))
+              for index in range(sectors_count)]
+    return Polygon([Contour([center, points[index], points[index + 1]], [],
+                            True)
+                    for index in range(0, sectors_count - 1, 2)])
+
+
+def to_events(left: Polygon, right: Polygon) -> List[SweepEvent]:
+    operation = Operation(left, right, OperationType.UNION)
+    operation.process_segments()
+    return operation.collect_events(operation.sweep())
+
+
+def connect(operation_cls: type, left: Polygon, right: Polygon,
+            events: List[SweepEvent]) -> None:
+    operation = operation_cls(left, right, OperationType.UNION)
+    operation.process_events(events)
+
+
+def to_coincident_events(count: int) -> List[SweepEvent]:
+    point = Point(0., 0.)
+    return [SweepEvent(True, point, None, PolygonType.SUBJECT,
+                       EdgeType.NORMAL)
+            for _ in range(count)]
+
+
+def scan_successors(events: List[SweepEvent]) -> None:
+    # arrivals are visited in reverse order,
+    # so every lookup skips all previously processed events
+    middle = len(events) // 2
+    processed = [False] * len(events)
+    for offset in range(middle):
+        processed[middle - 1 - offset] = True
+        position = to_next_position(middle - 1 - offset, events, processed)
+        processed[position] = True
+
+
+def find_successors(events: List[SweepEvent]) -> None:
+    middle = len(events) // 2
+    unprocessed = UnprocessedPositions([event.point for event in events])
+    for offset in range(middle):
+        unprocessed.discard(middle - 1 - offset)
+        unprocessed.discard(unprocessed.to_next(middle - 1 - offset))
+
+
+def main() -> None:
+    # distant triangle keeps operation from being trivial
+    right = Polygon([Contour([Point(0.9, 0.9), Point(0.95, 0.9),
+                              Point(0.9, 0.95)], [], True)])
+    for sectors_count in (100, 1000, 10000):
+        left = to_fan_polygon(sectors_count)
+        events = to_events(left, right)
+        report('connecting edges, {} sectors sharing vertex'
+               .format(sectors_count),
+               best_time(lambda: connect(ScanningOperation, left, right,
+                                         events)),
+               best_time(lambda: connect(Operation, left, right, events)))
+    for degree in (100, 1000, 10000):
+        events = to_coincident_events(degree)
+        report('successors lookups, vertex of degree {}'.format(degree),
+               best_time(lambda: scan_successors(events)),
+               best_time(lambda: find_successors(events)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+from typing import List
+
+from dendroid import red_black
+
+from martinez.boolean import (Operation,
+                              OperationType,
+                              SweepEvent,
+                              SweepLineKey)
+from martinez.sweep_line import SweepLine
+from .utils import (best_time,
+                    report,
+                    to_overlapping_stars_pair)
+
+
+def replay_with_dendroid(events: List[SweepEvent]) -> None:
+    sweep_line = red_black.set_(key=SweepLineKey)
+    for event in events:
+        if event.is_left:
+            sweep_line.add(event)
+            try:
+                sweep_line.next(event)
+            except ValueError:
+                pass
+            try:
+                sweep_line.prev(event)
+            except ValueError:
+                pass
+        else:
+            event = event.other_event
+            if event not in sweep_line:
+                continue
+            try:
+                sweep_line.next(event)
+            except ValueError:
+                pass
+            try:
+                sweep_line.prev(event)
+            except ValueError:
+                pass
+            sweep_line.remove(event)
+
+
+def replay_with_threaded_tree(events: List[SweepEvent]) -> None:
+    sweep_line = SweepLine(SweepLineKey)
+    for event in events:
+        if event.is_left:
+            node = sweep_line.add(event)
+            node.successor, node.predecessor
+        else:
+            node = sweep_line.find(event.other_event)
+            if node is None:
+                continue
+            node.successor, node.predecessor
+            sweep_line.remove(node)
+
+
+def to_swept_events(vertices_count: int) -> List[SweepEvent]:
+    left, right = to_overlapping_stars_pair(vertices_count)
+    operation = Operation(left, right, OperationType.UNION)
+    operation.process_segments()
+    return operation.sweep()
+
+
+def main() -> None:
+    for vertices_count in (100, 300, 1000):
+        events = to_swept_events(vertices_count)
+        report('{} vertices'.format(vertices_count),
+               best_time(lambda: replay_with_dendroid(events)),
+               best_time(lambda: replay_with_threaded_tree(events)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import math
+import random
+import timeit
+from typing import (Callable,
+                    Tuple)
+
+from martinez.contour import Contour
+from martinez.point import Point
+from martinez.polygon import Polygon
+
+
+def to_star_polygon(vertices_count: int,
+                    *,
+                    center: Tuple[float, float] = (0., 0.),
+                    radius: float = 1.,
+                    seed: int = 0) -> Polygon:
+    generator = random.Random(seed)
+    center_x, center_y = center
+    points = []
+    for index in range(vertices_count):
+        angle = 2 * math.pi * index / vertices_count
+        distance = generator.uniform(radius / 2, radius)
+        points.append(Point(center_x + distance * math.cos(angle),
+                            center_y + distance * math.sin(angle)))
+    return Polygon([Contour(points, [], True)])
+
+
+def to_overlapping_stars_pair(vertices_count: int,
+                              *,
+                              seed: int = 0) -> Tuple[Polygon, Polygon]:
+    return (to_star_polygon(vertices_count,
+                            seed=seed),
+            to_star_polygon(vertices_count,
+                            center=(0.5, 0.),
+                            seed=seed + 1))
+
+
+def to_strip_polygon(vertices_count: int,
+                     *,
+                     offset: float = 0.,
+                     seed: int = 0) -> Polygon:
+    # mostly monotone coastline-like boundaries
+    generator = random.Random(seed)
+    half_count = vertices_count // 2
+    upper_points = [Point(index / half_count,
+                          offset + 1. + generator.uniform(-0.2, 0.2))
+                    for index in range(half_count)]
+    lower_points = [Point(index / half_count,
+                          offset + generator.uniform(-0.2, 0.2))
+                    for index in reversed(range(half_count))]
+    return Polygon([Contour(lower_points[::-1] + upper_points[::-1], [],
+                            True)])
+
+
+def to_overlapping_strips_pair(vertices_count: int,
+                               *,
+                               seed: int = 0) -> Tuple[Polygon, Polygon]:
+    return (to_strip_polygon(vertices_count,
+                             seed=seed),
+            to_strip_polygon(vertices_count,
+                             offset=0.5,
+                             seed=seed + 1))
+
+
+def best_time(function: Callable[[], None],
+              *,
+              number: int = 1,
+              repeat: int = 5) -> float:
+    return min(timeit.repeat(function,
+                             number=number,
+                             repeat=repeat)) / number
+
+
+def report(title: str, baseline: float, candidate: float) -> None:
+    print('{}: {:.6f}s -> {:.6f}s ({:.1f}x)'
+          .format(title, baseline, candidate, baseline / candidate))
@@ -0,0 +1,59 @@
+import gc
+import tracemalloc
+from typing import (Callable,
+                    List,
+                    Optional)
+
+from martinez.boolean import (OperationType,
+                              compute)
+from martinez.polygon import Polygon
+from martinez.vertices import VertexTable
+from .cache import to_tiles
+from .utils import (best_time,
+                    report,
+                    to_star_polygon)
+
+
+def cover(shape: Polygon, tiles: List[Polygon],
+          vertex_table: Optional[VertexTable]) -> List[Polygon]:
+    # neighbouring pieces share vertices along tiles' edges
+    return [compute(shape, tile, OperationType.INTERSECTION,
+                    vertex_table=vertex_table)
+            for tile in tiles]
+
+
+def to_retained_size(function: Callable[[], List[Polygon]]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    for tiles_size, vertices_count in ((4, 1000), (8, 1000)):
+        shape = to_star_polygon(vertices_count)
+        tiles = to_tiles(tiles_size)
+        pieces = cover(shape, tiles, None)
+        vertex_table = VertexTable()
+        cover(shape, tiles, vertex_table)
+        title = 'covering by {} tiles'.format(tiles_size * tiles_size)
+        print('{}: {} points -> {} points, {} bytes -> {} bytes'
+              .format(title,
+                      sum(piece.vertices_count for piece in pieces),
+                      len(vertex_table),
+                      to_retained_size(lambda: cover(shape, tiles, None)),
+                      to_retained_size(lambda: cover(shape, tiles,
+                                                     VertexTable()))))
+        report(title,
+               best_time(lambda: cover(shape, tiles, None),
+                         repeat=3),
+               best_time(lambda: cover(shape, tiles, VertexTable()),
+                         repeat=3))
+
+
+if __name__ == '__main__':
+    main()
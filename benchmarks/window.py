@@ -0,0 +1,54 @@
+from martinez.boolean import (OperationType,
+                              compute)
+from martinez.contour import Contour
+from martinez.point import Point
+from martinez.polygon import Polygon
+from .utils import (best_time,
+                    report,
+                    to_star_polygon,
+                    to_strip_polygon)
+
+
+def to_islands_polygon(side: int, vertices_count: int) -> Polygon:
+    return Polygon([contour
+                    for row in range(side)
+                    for column in range(side)
+                    for contour in to_star_polygon(vertices_count,
+                                                   center=(4. * column,
+                                                           4. * row),
+                                                   seed=row * side + column)
+                    .contours])
+
+
+def to_window(x_min: float, y_min: float, x_max: float, y_max: float
+              ) -> Polygon:
+    return Polygon([Contour([Point(x_min, y_min), Point(x_max, y_min),
+                             Point(x_max, y_max), Point(x_min, y_max)], [],
+                            True)])
+
+
+def main() -> None:
+    for side in (10, 20, 40):
+        islands = to_islands_polygon(side, 50)
+        center = 2. * (side - 1)
+        window = to_window(center - 3., center - 3., center + 3., center + 3.)
+        for operation_type in OperationType:
+            report('{}, {} islands'.format(operation_type.name, side * side),
+                   best_time(lambda: compute(window, islands,
+                                             operation_type)),
+                   best_time(lambda: compute(window, islands, operation_type,
+                                             prefilter=True)))
+    for vertices_count in (1000, 10000, 20000):
+        strip = to_strip_polygon(vertices_count)
+        window = to_window(0.45, 0.25, 0.55, 0.75)
+        for operation_type in (OperationType.INTERSECTION,
+                               OperationType.DIFFERENCE):
+            report('{}, {} vertices, simple'.format(operation_type.name,
+                                                    vertices_count),
+                   best_time(lambda: compute(window, strip, operation_type)),
+                   best_time(lambda: compute(window, strip, operation_type,
+                                             simple=True)))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,27 +1,39 @@
 import enum
 from copy import copy
 from functools import partial
-from operator import attrgetter
+from heapq import (heappop,
+                   heappush)
+from itertools import count
+from operator import (attrgetter,
+                      is_)
 from reprlib import recursive_repr
-from typing import (Callable,
+from typing import (Any,
+                    Callable,
                     Dict,
+                    Iterable,
+                    Iterator,
                     List,
                     Optional,
+                    Sequence,
                     Tuple,
                     TypeVar)
 
-from dendroid import red_black
-from prioq.base import PriorityQueue
 from reprit import seekers
 from reprit.base import generate_repr
 
 from .contour import Contour
+from .hints import Scalar
 from .point import Point
 from .polygon import Polygon
 from .segment import Segment
-from .utilities import (find_intersections,
+from .sweep_line import SweepLine
+from .utilities import (find_intersections_by_endpoints,
                         sign,
-                        to_segments)
+                        suspended_gc,
+                        to_monotone_chains,
+                        to_segments,
+                        with_suspended_gc)
+from .vertices import VertexTable
 
 Domain = TypeVar('Domain')
 
@@ -101,7 +113,7 @@ class SweepEvent:
     __slots__ = ('is_left', 'point', 'other_event', 'polygon_type',
                  'edge_type', 'in_out', 'other_in_out', 'in_result',
                  'result_in_out', 'position', 'contour_id',
-                 'prev_in_result_event')
+                 'prev_in_result_event', 'queue_entry', '_coordinates')
 
     def __init__(self, is_left: bool, point: Point,
                  other_event: Optional['SweepEvent'],
@@ -125,6 +137,7 @@ class SweepEvent:
         self.position = position
         self.contour_id = contour_id
         self.prev_in_result_event = prev_in_result_event
+        self.queue_entry = self._coordinates = None
 
     def __getstate__(self) -> SweepEventState:
         left_links, right_links = {}, {}
@@ -142,6 +155,7 @@ class SweepEvent:
          self.in_out, self.other_in_out, self.in_result, self.result_in_out,
          self.position, self.contour_id) = events_states[0]
         self.other_event, self.prev_in_result_event = None, None
+        self.queue_entry = self._coordinates = None
         events = [self] + [SweepEvent(event_state[0], event_state[1], None,
                                       event_state[2], event_state[3],
                                       event_state[4], event_state[5],
@@ -192,10 +206,22 @@ class SweepEvent:
                     to_left=attrgetter('other_event'),
                     to_right=attrgetter('prev_in_result_event')))
 
+    @property
+    def coordinates(self) -> Tuple[Scalar, Scalar, Scalar, Scalar]:
+        # coordinates of the point & the other event's point,
+        # cached until ``reset_coordinates`` call on ``other_event`` rewiring
+        result = self._coordinates
+        if result is None:
+            self.validate()
+            point, other_point = self.point, self.other_event.point
+            result = self._coordinates = (point.x, point.y,
+                                          other_point.x, other_point.y)
+        return result
+
     @property
     def is_vertical(self) -> bool:
-        self.validate()
-        return self.point.x == self.other_event.point.x
+        x, _, other_x, _ = self.coordinates
+        return x == other_x
 
     @property
     def segment(self) -> Segment:
@@ -206,10 +232,18 @@ class SweepEvent:
         return not self.is_below(point)
 
     def is_below(self, point: Point) -> bool:
-        self.validate()
-        return (sign(self.point, self.other_event.point, point) == 1
+        x, y, other_x, other_y = self.coordinates
+        point_x, point_y = point.x, point.y
+        # same as ``sign`` of the segment's endpoints & the point,
+        # swapping endpoints negates it exactly
+        determinant = ((x - point_x) * (other_y - point_y)
+                       - (other_x - point_x) * (y - point_y))
+        return (determinant > 0
                 if self.is_left
-                else sign(self.other_event.point, self.point, point) == 1)
+                else determinant < 0)
+
+    def reset_coordinates(self) -> None:
+        self._coordinates = None
 
     def validate(self) -> None:
         if self.other_event is None:
@@ -259,6 +293,278 @@ class EventsQueueKey:
             return self._event.polygon_type > other._event.polygon_type
 
 
+_tiebreakers_orders = count()
+
+
+class EventsQueueTiebreaker:
+    __slots__ = 'event', 'order'
+
+    def __init__(self, event: SweepEvent) -> None:
+        self.event = event
+        # events which are equal otherwise are popped in insertion order
+        self.order = next(_tiebreakers_orders)
+
+    __repr__ = generate_repr(__init__)
+
+    def __lt__(self, other: 'EventsQueueTiebreaker') -> bool:
+        # same point, both events are left endpoints
+        # or both are right endpoints
+        event, other_event = self.event, other.event
+        x, y, other_x, other_y = other_event.coordinates
+        _, _, end_x, end_y = event.coordinates
+        determinant = ((x - end_x) * (other_y - end_y)
+                       - (other_x - end_x) * (y - end_y))
+        if determinant > 0 or determinant < 0:  # not collinear
+            # the event associate to the bottom segment is processed first
+            return (determinant < 0) is other_event.is_left
+        elif other_event.polygon_type is not event.polygon_type:
+            return other_event.polygon_type > event.polygon_type
+        else:
+            return self.order < other.order
+
+
+EventsQueueEntry = List[Any]
+# contour id, parent contour id (``-1`` for external ones) & contour itself
+ResultContour = Tuple[int, int, Contour]
+MonotoneChain = Tuple[PolygonType, Sequence[Segment]]
+
+
+def to_events_queue_entry(event: SweepEvent) -> EventsQueueEntry:
+    # orders events in the same way as ``EventsQueueKey`` does,
+    # but falls back to Python-level comparison only for collinearity check
+    return [event.point.x, event.point.y, event.is_left,
+            EventsQueueTiebreaker(event)]
+
+
+def to_segment_events(segment: Segment,
+                      polygon_type: PolygonType
+                      ) -> Tuple[SweepEvent, SweepEvent]:
+    source_event = SweepEvent(True, segment.source, None, polygon_type,
+                              EdgeType.NORMAL)
+    target_event = SweepEvent(True, segment.target, source_event,
+                              polygon_type, EdgeType.NORMAL)
+    source_event.other_event = target_event
+    if segment.min == segment.source:
+        target_event.is_left = False
+    else:
+        source_event.is_left = False
+    return source_event, target_event
+
+
+def to_monotone_chain_entries(polygon_type: PolygonType,
+                              segments: Sequence[Segment],
+                              index: int
+                              ) -> Tuple[EventsQueueEntry, EventsQueueEntry]:
+    source_event, target_event = to_segment_events(segments[index],
+                                                   polygon_type)
+    source_entry, target_entry = (to_events_queue_entry(source_event),
+                                  to_events_queue_entry(target_event))
+    if index + 1 < len(segments):
+        # tiebreakers of different entries always differ,
+        # so the rest of the chain does not take part in comparisons
+        (source_entry
+         if source_event.is_left
+         else target_entry).append((polygon_type, segments, index + 1))
+    return source_entry, target_entry
+
+
+class EventsQueue:
+    # initial events are bulk-loaded into the sorted run,
+    # events pushed afterwards go to the dynamic heap,
+    # both are merged on popping
+    __slots__ = '_sorted_entries', '_entries'
+
+    def __init__(self, *events: SweepEvent) -> None:
+        # in descending order, so the least entry is popped from the end
+        self._sorted_entries = []
+        self._entries = []
+        self.load(events)
+
+    @property
+    def events(self) -> List[SweepEvent]:
+        return [entry[3].event
+                for entry in sorted(self._sorted_entries + self._entries)]
+
+    __repr__ = generate_repr(__init__)
+
+    def __bool__(self) -> bool:
+        return bool(self._sorted_entries or self._entries)
+
+    def __copy__(self) -> 'EventsQueue':
+        result = EventsQueue()
+        result._sorted_entries = self._sorted_entries[:]
+        result._entries = self._entries[:]
+        return result
+
+    def __len__(self) -> int:
+        return len(self._sorted_entries) + len(self._entries)
+
+    def load(self, events: Iterable[SweepEvent]) -> None:
+        self._load_entries([to_events_queue_entry(event)
+                            for event in events])
+
+    def _load_entries(self, entries: List[EventsQueueEntry]) -> None:
+        if not entries:
+            return
+        for entry in entries:
+            entry[3].event.queue_entry = entry
+        entries += self._sorted_entries
+        entries.sort(reverse=True)
+        self._sorted_entries = entries
+
+    def load_monotone_chains(self, chains: Iterable[MonotoneChain]) -> None:
+        # only events of the first segment of each chain are queued,
+        # the next segment's ones are pushed
+        # when the left event of the previous one gets popped
+        entries = []
+        for polygon_type, segments in chains:
+            entries.extend(to_monotone_chain_entries(polygon_type, segments,
+                                                     0))
+        self._load_entries(entries)
+
+    def peek(self) -> SweepEvent:
+        sorted_entries, entries = self._sorted_entries, self._entries
+        if sorted_entries and not (entries
+                                   and entries[0] < sorted_entries[-1]):
+            return sorted_entries[-1][3].event
+        elif entries:
+            return entries[0][3].event
+        else:
+            raise ValueError('Events queue is empty')
+
+    def pop(self) -> SweepEvent:
+        sorted_entries, entries = self._sorted_entries, self._entries
+        if sorted_entries and not (entries
+                                   and entries[0] < sorted_entries[-1]):
+            entry = sorted_entries.pop()
+        elif entries:
+            entry = heappop(entries)
+        else:
+            raise ValueError('Events queue is empty')
+        if len(entry) > 4:
+            for next_entry in to_monotone_chain_entries(*entry[4]):
+                next_entry[3].event.queue_entry = next_entry
+                heappush(entries, next_entry)
+        return entry[3].event
+
+    def push(self, event: SweepEvent) -> None:
+        event.queue_entry = entry = to_events_queue_entry(event)
+        heappush(self._entries, entry)
+
+    @staticmethod
+    def update(event: SweepEvent) -> None:
+        # endpoint type of queued event has changed
+        if event.queue_entry is not None:
+            event.queue_entry[2] = event.is_left
+
+
+events_order_key = attrgetter('point.x', 'point.y', 'is_left')
+
+
+def dismantle_events(events: Iterable[SweepEvent]) -> None:
+    # breaks reference cycles between events
+    # & their queue entries,
+    # so they are freed by reference counting
+    # without waiting for cyclic garbage collection
+    for event in events:
+        event.other_event = event.prev_in_result_event = None
+        event.queue_entry = None
+
+
+def _sort_events(events: List[SweepEvent], start: int, stop: int) -> None:
+    # stable, so events which are equal by comparison keep their order,
+    # reversed since ``EventsQueueKey`` of the later queued event is less
+    events[start:stop] = sorted(events[start:stop],
+                                key=EventsQueueKey,
+                                reverse=True)
+
+
+def collect_result_events(operation: 'Operation', events: List[Domain]
+                          ) -> List[Domain]:
+    # events of segments in result ordered as ``EventsQueue`` pops them,
+    # with positions of their other events,
+    # operation gives access to events' fields
+    is_left, to_other_event, is_in_result = (operation._is_left,
+                                             operation._to_other_event,
+                                             operation._is_in_result)
+    result = [event
+              for event in events
+              if (is_in_result(event)
+                  if is_left(event)
+                  else is_in_result(to_other_event(event)))]
+    # stable sort gives the same order as adjacent swapping would
+    # for events which differ in point or endpoint type,
+    # the rest are sorted within groups with full comparison
+    keys = list(map(operation._to_order_key, result))
+    order = sorted(range(len(result)),
+                   key=keys.__getitem__)
+    result, keys = ([result[index] for index in order],
+                    [keys[index] for index in order])
+    start = 0
+    for stop in range(1, len(result) + 1):
+        if stop == len(result) or keys[stop] != keys[start]:
+            if stop - start > 1:
+                operation._sort_tied_events(result, start, stop)
+            start = stop
+    to_position, set_position = operation._to_position, operation._set_position
+    for index, event in enumerate(result):
+        set_position(event, index)
+        if not is_left(event):
+            other_event = to_other_event(event)
+            position = to_position(other_event)
+            set_position(other_event, index)
+            set_position(event, position)
+    return result
+
+
+class UnprocessedPositions:
+    # positions of events sorted by points
+    # which are not yet connected into result contours,
+    # next & previous unprocessed ones are found
+    # with path-compressed links in amortized constant time
+    __slots__ = '_points', '_nexts', '_prevs'
+
+    def __init__(self, points: List[Point]) -> None:
+        self._points = points
+        # ``self._nexts[position]`` links to an unprocessed position
+        # which is not less than ``position``,
+        # ``self._prevs[position + 1]`` links to one
+        # which is not greater than ``position``,
+        # sentinels are ``len(points)`` and ``-1`` respectively
+        self._nexts = list(range(len(points) + 1))
+        self._prevs = list(range(-1, len(points)))
+
+    __repr__ = generate_repr(__init__)
+
+    def __contains__(self, position: int) -> bool:
+        return self._nexts[position] == position
+
+    def discard(self, position: int) -> None:
+        nexts = self._nexts
+        if nexts[position] == position:
+            nexts[position] = position + 1
+            self._prevs[position + 1] = position - 1
+
+    def to_next(self, position: int) -> int:
+        # next unprocessed position with the same point,
+        # otherwise the closest unprocessed one before,
+        # events with the same point are adjacent
+        nexts = self._nexts
+        result = position + 1
+        while nexts[result] != result:
+            nexts[result] = result = nexts[nexts[result]]
+        points = self._points
+        if result < len(points) and points[result] == points[position]:
+            return result
+        if not position:
+            return 0
+        prevs = self._prevs
+        result = position - 1
+        while prevs[result + 1] != result:
+            prevs[result + 1] = result = prevs[prevs[result + 1] + 1]
+        return max(result, 0)
+
+
 class SweepLineKey:
     __slots__ = '_event',
 
@@ -281,44 +587,276 @@ class SweepLineKey:
             return NotImplemented
         if self is other:
             return False
-        if not (sign(self.event.point, self.event.other_event.point,
-                     other.event.point)
-                or sign(self.event.point, self.event.other_event.point,
-                        other.event.other_event.point)):
+        event, other_event = self._event, other._event
+        x, y, end_x, end_y = event.coordinates
+        other_x, other_y, other_end_x, other_end_y = other_event.coordinates
+        # signs of determinants are the same as ``sign`` gives
+        start_determinant = ((x - other_x) * (end_y - other_y)
+                             - (end_x - other_x) * (y - other_y))
+        end_determinant = ((x - other_end_x) * (end_y - other_end_y)
+                           - (end_x - other_end_x) * (y - other_end_y))
+        if not (start_determinant > 0 or start_determinant < 0
+                or end_determinant > 0 or end_determinant < 0):
             # segments are collinear
-            return (EventsQueueKey(self.event) < EventsQueueKey(other.event)
-                    if self.event.polygon_type is other.event.polygon_type
-                    else self.event.polygon_type < other.event.polygon_type)
+            return (EventsQueueKey(event) < EventsQueueKey(other_event)
+                    if event.polygon_type is other_event.polygon_type
+                    else event.polygon_type < other_event.polygon_type)
         # segments are not collinear
-        elif self.event.point == other.event.point:
+        elif x == other_x and y == other_y:
             # same left endpoint, use the right endpoint to sort
-            return self.event.is_below(other.event.other_event.point)
+            return (end_determinant > 0
+                    if event.is_left
+                    else end_determinant < 0)
         # different left endpoint, use the left endpoint to sort
-        elif self.event.point.x == other.event.point.x:
-            return self.event.point.y < other.event.point.y
-        elif EventsQueueKey(self.event) < EventsQueueKey(other.event):
+        elif x == other_x:
+            return y < other_y
+        elif x > other_x:
             # has the line segment associated to `self` been inserted
             # into sweep line after the line segment associated to `other`?
-            return other.event.is_above(self.event.point)
+            return other_event.is_above(event.point)
         else:
             # the line segment associated to `other` has been inserted
             # into sweep line after the line segment associated to `self`
-            return self.event.is_below(other.event.point)
+            return (start_determinant > 0
+                    if event.is_left
+                    else start_determinant < 0)
+
+
+# whether event is in result,
+# indexed by polygon type & event's ``other_in_out`` flag
+_NEVER = (False, False), (False, False)
+_ALWAYS = (True, True), (True, True)
+_IF_OTHER_IN_OUT = (False, True), (False, True)
+_UNLESS_OTHER_IN_OUT = (True, False), (True, False)
+# indexed by edge type, then as above
+IN_RESULT_TABLES = {
+    OperationType.INTERSECTION: (_UNLESS_OTHER_IN_OUT, _NEVER, _ALWAYS,
+                                 _NEVER),
+    OperationType.UNION: (_IF_OTHER_IN_OUT, _NEVER, _ALWAYS, _NEVER),
+    OperationType.DIFFERENCE: (((False, True), (True, False)), _NEVER, _NEVER,
+                               _ALWAYS),
+    OperationType.XOR: (_ALWAYS, _NEVER, _NEVER, _NEVER)
+}
+
+
+def to_interaction_flags(left_contours: List[Contour],
+                         right_contours: List[Contour]
+                         ) -> Tuple[List[bool], List[bool]]:
+    # contour interacts with the rest
+    # if its bounding box overlaps any other one (nested or not),
+    # since contours are not necessarily convex
+    # and holes are not necessarily marked,
+    # so only isolated contours are left out
+    contours = left_contours + right_contours
+    flags = [False] * len(contours)
+    bounding_boxes = [contour.bounding_box for contour in contours]
+    active = []
+    for index in sorted(range(len(contours)),
+                        key=lambda index: bounding_boxes[index].x_min):
+        bounding_box = bounding_boxes[index]
+        active = [other_index
+                  for other_index in active
+                  if bounding_boxes[other_index].x_max >= bounding_box.x_min]
+        for other_index in active:
+            other_bounding_box = bounding_boxes[other_index]
+            if not (other_bounding_box.y_min > bounding_box.y_max
+                    or bounding_box.y_min > other_bounding_box.y_max):
+                flags[index] = flags[other_index] = True
+        active.append(index)
+    return flags[:len(left_contours)], flags[len(left_contours):]
+
+
+def to_stacking_flags(contours: List[Contour],
+                      flags: List[bool]) -> List[bool]:
+    # contours with overlapping abscissas ranges
+    # meet each other on the sweep line,
+    # which gives nesting & orientation of their result contours
+    # through the edges right below them,
+    # so each cluster of such contours is swept as a whole
+    # if any of its contours interacts with the rest
+    bounding_boxes = [contour.bounding_box for contour in contours]
+    clusters_ids = [0] * len(contours)
+    cluster_id, cluster_x_max = -1, None
+    for index in sorted(range(len(contours)),
+                        key=lambda index: bounding_boxes[index].x_min):
+        bounding_box = bounding_boxes[index]
+        if cluster_x_max is None or bounding_box.x_min > cluster_x_max:
+            cluster_id += 1
+            cluster_x_max = bounding_box.x_max
+        else:
+            cluster_x_max = max(cluster_x_max, bounding_box.x_max)
+        clusters_ids[index] = cluster_id
+    swept_clusters_ids = {cluster_id
+                          for cluster_id, is_interacting in zip(clusters_ids,
+                                                                flags)
+                          if is_interacting}
+    return [cluster_id in swept_clusters_ids for cluster_id in clusters_ids]
+
+
+def to_passed_contours(contours: List[Contour],
+                       flags: List[bool]) -> List[Contour]:
+    # non-interacting contours as the sweep would assemble them
+    return [to_swept_contour(contour)
+            for contour, is_interacting in zip(contours, flags)
+            if not is_interacting and contour.vertices_count]
+
+
+def to_swept_contour(contour: Contour) -> Contour:
+    # isolated contour as the sweep would assemble it:
+    # external, counterclockwise & starting from its least vertex
+    points = list(contour)
+    start = min(range(len(points)),
+                key=lambda index: (points[index].x, points[index].y))
+    if contour.is_counterclockwise:
+        if not start:
+            result = contour.with_holes([])
+            result.is_external = True
+            return result
+        points = points[start:] + points[:start]
+    else:
+        points = points[start::-1] + points[:start:-1]
+    return (Contour(points, [], True)
+            if contour.typecode is None
+            else Contour.from_coordinates([coordinate
+                                           for point in points
+                                           for coordinate in (point.x,
+                                                              point.y)],
+                                          [], True,
+                                          typecode=contour.typecode))
+
+
+def merge_passed_contours(result_contours: Iterable[ResultContour],
+                          passed: List[Contour]) -> Iterator[ResultContour]:
+    # swept contours come in order of their least vertices
+    # they start from, so passed ones are placed among them
+    # the same way with contours & parents ids shifted
+    passed = sorted(passed, key=_to_start_key)
+    ids = {}
+    contour_id = index = 0
+    for swept_id, parent_id, contour in result_contours:
+        start_key = _to_start_key(contour)
+        while index < len(passed) and _to_start_key(passed[index]) < start_key:
+            yield contour_id, -1, passed[index]
+            contour_id += 1
+            index += 1
+        ids[swept_id] = contour_id
+        yield contour_id, -1 if parent_id == -1 else ids[parent_id], contour
+        contour_id += 1
+    for contour in passed[index:]:
+        yield contour_id, -1, contour
+        contour_id += 1
+
+
+def _to_start_key(contour: Contour) -> Tuple[Scalar, Scalar]:
+    start = next(iter(contour))
+    return start.x, start.y
+
+
+def to_flat_polygon(polygon: Polygon) -> Polygon:
+    # contours' rings without holes assignment
+    result = Polygon([contour.with_holes([]) for contour in polygon.contours])
+    for contour in result.contours:
+        contour.is_external = True
+    return result
+
+
+def to_result_contours(polygon: Polygon,
+                       start: int = 0) -> Iterator[ResultContour]:
+    # polygon's contours with holes assignment given by parents ids
+    parents = {}
+    for index, contour in enumerate(polygon.contours):
+        for hole in contour.holes:
+            parents[hole] = index
+    for index, contour in enumerate(polygon.contours):
+        yield (start + index,
+               start + parents[index] if index in parents else -1,
+               contour.with_holes([]))
+
+
+def _to_min_x_max(left: Polygon, right: Polygon) -> Scalar:
+    return min(left.bounding_box.x_max, right.bounding_box.x_max)
+
+
+def _to_left_x_max(left: Polygon, right: Polygon) -> Scalar:
+    return left.bounding_box.x_max
+
+
+def _to_max_x_min(left: Polygon, right: Polygon) -> Scalar:
+    return max(left.bounding_box.x_min, right.bounding_box.x_min)
+
+
+def _to_left_x_min(left: Polygon, right: Polygon) -> Scalar:
+    return left.bounding_box.x_min
+
+
+# abscissas beyond which events do not affect result
+SWEEP_LIMITS_FACTORIES = {
+    OperationType.INTERSECTION: _to_min_x_max,
+    OperationType.DIFFERENCE: _to_left_x_max
+}
+# abscissas before which events belong to a single polygon
+# and do not get into result
+SWEEP_STARTS_FACTORIES = {
+    OperationType.INTERSECTION: _to_max_x_min,
+    OperationType.DIFFERENCE: _to_left_x_min
+}
+
+
+def _to_unclosed_contour_error(start: Point) -> ValueError:
+    # each step of contour traversal visits new event,
+    # so the one starting over is caught in a cycle
+    return ValueError('Contour starting at {!r} does not close, '
+                      'events are possibly processed twice.'.format(start))
 
 
 class Operation:
-    __slots__ = ('_left', '_right', '_type', '_events_queue', '_resultant',
-                 '_already_run')
+    __slots__ = ('_left', '_right', '_type', '_monotone_chains', '_prefilter',
+                 '_simple', '_typecode', '_suspend_gc', '_flat',
+                 '_vertex_table', '_vertices_indices', '_in_result_table',
+                 '_to_sweep_limit', '_to_sweep_start',
+                 '_events_queue', '_segments_processed', '_resultant',
+                 '_is_trivial', '_already_run', '_is_streamed')
 
     def __init__(self, left: Polygon, right: Polygon,
-                 type_: OperationType) -> None:
+                 type_: OperationType,
+                 *,
+                 monotone_chains: bool = False,
+                 prefilter: bool = False,
+                 simple: bool = False,
+                 typecode: Optional[str] = None,
+                 suspend_gc: bool = False,
+                 flat: bool = False,
+                 vertex_table: Optional[VertexTable] = None) -> None:
         self._left = left
         self._right = right
         self._type = type_
-        self._events_queue = PriorityQueue(key=EventsQueueKey,
-                                           reverse=True)
+        self._monotone_chains = monotone_chains
+        self._prefilter = prefilter
+        self._simple = simple
+        # resultant contours are array-backed if typecode is specified
+        self._typecode = typecode
+        # events graph is dismantled after run,
+        # so cyclic garbage collector is not needed during it
+        self._suspend_gc = suspend_gc
+        # resultant contours are closed rings of arbitrary orientation
+        # without holes assignment
+        self._flat = flat
+        # resultant contours reference vertices interned in the table
+        self._vertex_table = vertex_table
+        self._vertices_indices = []  # type: List[List[int]]
+        self._in_result_table = IN_RESULT_TABLES[type_]
+        self._to_sweep_limit = SWEEP_LIMITS_FACTORIES.get(type_)
+        self._to_sweep_start = SWEEP_STARTS_FACTORIES.get(type_)
+        self._events_queue = EventsQueue()
+        self._segments_processed = False
         self._resultant = Polygon([])
+        # trivial resultant is computed by the test,
+        # but gets finished by ``run``
+        self._is_trivial = None  # type: Optional[bool]
         self._already_run = False
+        # streamed contours are not collected,
+        # so operation has no resultant afterwards
+        self._is_streamed = False
 
     __repr__ = generate_repr(__init__,
                              field_seeker=seekers.complex_)
@@ -345,25 +883,38 @@ class Operation:
 
     @property
     def resultant(self) -> Polygon:
+        self._validate_not_streamed()
         return self._resultant
 
+    @property
+    def vertices_indices(self) -> List[List[int]]:
+        # of resultant contours' vertices in the vertex table
+        self._validate_not_streamed()
+        return self._vertices_indices
+
     @property
     def type(self) -> OperationType:
         return self._type
 
     @property
     def is_trivial(self) -> bool:
+        if self._is_trivial is None:
+            self._is_trivial = self._compute_trivial()
+        return self._is_trivial
+
+    def _compute_trivial(self) -> bool:
         # test 1 for trivial result case
         if not (self._left.contours and self._right.contours):
             # at least one of the polygons is empty
             if self._type is OperationType.DIFFERENCE:
-                self._resultant = self._left
+                self._resultant = self._left.share()
             if (self._type is OperationType.UNION
                     or self._type is OperationType.XOR):
                 self._resultant = (self._left
                                    if self._left.contours
-                                   else self._right)
-            self._already_run = True
+                                   else self._right).share()
+            if self._flat:
+                self._resultant = to_flat_polygon(self._resultant)
             return True
         # test 2 for trivial result case
         left_bounding_box = self._left.bounding_box
@@ -374,36 +925,58 @@ class Operation:
                 or right_bounding_box.y_min > left_bounding_box.y_max):
             # the bounding boxes do not overlap
             if self._type is OperationType.DIFFERENCE:
-                self._resultant = self._left
+                self._resultant = self._left.share()
             elif (self._type is OperationType.UNION
                   or self._type is OperationType.XOR):
-                self._resultant = self._left
+                self._resultant = self._left.share()
                 self._resultant.join(self._right)
-            self._already_run = True
+            if self._flat:
+                self._resultant = to_flat_polygon(self._resultant)
             return True
         return False
 
+    # access to events' fields & links for the algorithms below,
+    # operations which keep events not as ``SweepEvent`` objects
+    # bind these to their storage
+    _to_point = staticmethod(attrgetter('point'))
+    _to_x = staticmethod(attrgetter('point.x'))
+    _is_left = staticmethod(attrgetter('is_left'))
+    _is_in_result = staticmethod(attrgetter('in_result'))
+    _to_other_event = staticmethod(attrgetter('other_event'))
+    _to_polygon_type = staticmethod(attrgetter('polygon_type'))
+    _to_in_out = staticmethod(attrgetter('in_out'))
+    _to_position = staticmethod(attrgetter('position'))
+    _to_prev_in_result_event = staticmethod(
+            attrgetter('prev_in_result_event'))
+    _to_result_in_out = staticmethod(attrgetter('result_in_out'))
+    _to_contour_id = staticmethod(attrgetter('contour_id'))
+    _to_order_key = staticmethod(events_order_key)
+    _sort_tied_events = staticmethod(_sort_events)
+    _are_same_events = staticmethod(is_)
+    _sweep_line_key = SweepLineKey
+    _to_segment_events = staticmethod(to_segment_events)
+
+    @staticmethod
+    def _is_queued_after(event: SweepEvent, other_event: SweepEvent) -> bool:
+        return EventsQueueKey(event) < EventsQueueKey(other_event)
+
+    @staticmethod
+    def _set_position(event: SweepEvent, position: int) -> None:
+        event.position = position
+
+    @staticmethod
+    def _set_edge_type(event: SweepEvent, edge_type: EdgeType) -> None:
+        event.edge_type = edge_type
+
+    @staticmethod
+    def _set_result_fields(event: SweepEvent, result_in_out: bool,
+                           contour_id: int) -> None:
+        event.result_in_out = result_in_out
+        event.contour_id = contour_id
+
     @staticmethod
     def collect_events(events: List[SweepEvent]) -> List[SweepEvent]:
-        result = [event
-                  for event in events
-                  if event.is_left and event.in_result
-                  or not event.is_left and event.other_event.in_result]
-        is_sorted = False
-        while not is_sorted:
-            is_sorted = True
-            for index in range(len(result) - 1):
-                if (EventsQueueKey(result[index])
-                        < EventsQueueKey(result[index + 1])):
-                    result[index], result[index + 1] = (result[index + 1],
-                                                        result[index])
-                    is_sorted = False
-        for index, event in enumerate(result):
-            event.position = index
-            if not event.is_left:
-                event.position, event.other_event.position = (
-                    event.other_event.position, event.position)
-        return result
+        return collect_result_events(Operation, events)
 
     def connect_edges(self, events: List[SweepEvent]) -> None:
         self.process_events(self.collect_events(events))
@@ -422,212 +995,335 @@ class Operation:
             # avoid a rounding error,
             # the left event would be processed after the right event
             event.other_event.is_left = True
+            self._events_queue.update(event.other_event)
             left_event.is_left = False
         event.other_event.other_event = left_event
+        event.other_event.reset_coordinates()
         event.other_event = right_event
+        event.reset_coordinates()
         self._events_queue.push(left_event)
         self._events_queue.push(right_event)
 
     def in_result(self, event: SweepEvent) -> bool:
-        operation_type = self._type
-        edge_type = event.edge_type
-        if edge_type is EdgeType.NORMAL:
-            if operation_type is OperationType.INTERSECTION:
-                return not event.other_in_out
-            elif operation_type is OperationType.UNION:
-                return event.other_in_out
-            elif operation_type is OperationType.DIFFERENCE:
-                return (event.polygon_type is PolygonType.SUBJECT
-                        and event.other_in_out
-                        or event.polygon_type is PolygonType.CLIPPING
-                        and not event.other_in_out)
-            else:
-                return operation_type is OperationType.XOR
-        elif edge_type is EdgeType.SAME_TRANSITION:
-            return (operation_type is OperationType.INTERSECTION
-                    or operation_type is OperationType.UNION)
-        elif edge_type is EdgeType.DIFFERENT_TRANSITION:
-            return operation_type is OperationType.DIFFERENCE
-        else:
-            return False
+        return (self._in_result_table
+                [event.edge_type][event.polygon_type][event.other_in_out])
 
     def possible_intersection(self,
                               first_event: SweepEvent,
                               second_event: SweepEvent) -> int:
-        intersections_count, first_point, second_point = find_intersections(
-                first_event.segment, second_event.segment)
+        to_point, to_other_event = self._to_point, self._to_other_event
+        first_other_event, second_other_event = (
+            to_other_event(first_event), to_other_event(second_event))
+        first_start, first_end, second_start, second_end = (
+            to_point(first_event), to_point(first_other_event),
+            to_point(second_event), to_point(second_other_event))
+        (intersections_count, first_point,
+         second_point) = find_intersections_by_endpoints(
+                first_start, first_end, second_start, second_end)
 
         if not intersections_count:
             # no intersection
             return 0
 
         if ((intersections_count == 1) and
-                (first_event.point == second_event.point or
-                 (first_event.other_event.point
-                  == second_event.other_event.point))):
+                (first_start == second_start or first_end == second_end)):
             # the line segments intersect at an endpoint of both line segments
             return 0
 
         if (intersections_count == 2
-                and first_event.polygon_type is second_event.polygon_type):
+                and (self._to_polygon_type(first_event)
+                     == self._to_polygon_type(second_event))):
             raise ValueError("Edges of the same polygon should not overlap.")
 
         # The line segments associated to le1 and le2 intersect
         if intersections_count == 1:
-            if (first_event.point != first_point
-                    and first_event.other_event.point != first_point):
+            if first_start != first_point and first_end != first_point:
                 # if the intersection point is not an endpoint of le1.segment
                 self.divide_segment(first_event, first_point)
-            if (second_event.point != first_point
-                    and second_event.other_event.point != first_point):
+            if second_start != first_point and second_end != first_point:
                 # if the intersection point is not an endpoint of le2.segment
                 self.divide_segment(second_event, first_point)
             return 1
 
         # The line segments associated to le1 and le2 overlap
+        is_queued_after = self._is_queued_after
         sorted_events = []
-        if first_event.point == second_event.point:
+        if first_start == second_start:
             sorted_events.append(None)
-        elif EventsQueueKey(first_event) < EventsQueueKey(second_event):
+        elif is_queued_after(first_event, second_event):
             sorted_events.append(second_event)
             sorted_events.append(first_event)
         else:
             sorted_events.append(first_event)
             sorted_events.append(second_event)
 
-        if first_event.other_event.point == second_event.other_event.point:
+        if first_end == second_end:
             sorted_events.append(None)
-        elif (EventsQueueKey(first_event.other_event)
-              < EventsQueueKey(second_event.other_event)):
-            sorted_events.append(second_event.other_event)
-            sorted_events.append(first_event.other_event)
+        elif is_queued_after(first_other_event, second_other_event):
+            sorted_events.append(second_other_event)
+            sorted_events.append(first_other_event)
         else:
-            sorted_events.append(first_event.other_event)
-            sorted_events.append(second_event.other_event)
+            sorted_events.append(first_other_event)
+            sorted_events.append(second_other_event)
 
         if (len(sorted_events) == 2
-                or len(sorted_events) == 3 and sorted_events[2]):
+                or len(sorted_events) == 3 and sorted_events[2] is not None):
             # both line segments are equal or share the left endpoint
-            first_event.edge_type = EdgeType.NON_CONTRIBUTING
-            second_event.edge_type = (
-                EdgeType.SAME_TRANSITION
-                if first_event.in_out is second_event.in_out
-                else EdgeType.DIFFERENT_TRANSITION)
+            self._set_edge_type(first_event, EdgeType.NON_CONTRIBUTING)
+            self._set_edge_type(second_event,
+                                EdgeType.SAME_TRANSITION
+                                if (self._to_in_out(first_event)
+                                    == self._to_in_out(second_event))
+                                else EdgeType.DIFFERENT_TRANSITION)
             if len(sorted_events) == 3:
-                self.divide_segment(sorted_events[2].other_event,
-                                    sorted_events[1].point)
+                self.divide_segment(to_other_event(sorted_events[2]),
+                                    to_point(sorted_events[1]))
             return 2
         if len(sorted_events) == 3:
             # the line segments share the right endpoint
-            self.divide_segment(sorted_events[0], sorted_events[1].point)
+            self.divide_segment(sorted_events[0], to_point(sorted_events[1]))
             return 3
 
-        if sorted_events[0] is not sorted_events[3].other_event:
+        if not self._are_same_events(sorted_events[0],
+                                     to_other_event(sorted_events[3])):
             # no line segment includes totally the other one
-            self.divide_segment(sorted_events[0], sorted_events[1].point)
-            self.divide_segment(sorted_events[1], sorted_events[2].point)
+            self.divide_segment(sorted_events[0], to_point(sorted_events[1]))
+            self.divide_segment(sorted_events[1], to_point(sorted_events[2]))
             return 3
 
         # one line segment includes the other one
-        self.divide_segment(sorted_events[0], sorted_events[1].point)
-        self.divide_segment(sorted_events[3].other_event,
-                            sorted_events[2].point)
+        self.divide_segment(sorted_events[0], to_point(sorted_events[1]))
+        self.divide_segment(to_other_event(sorted_events[3]),
+                            to_point(sorted_events[2]))
         return 3
 
     def process_events(self, events: List[SweepEvent]) -> None:
+        for _ in self._collect_result_contours(self.generate_contours(events)):
+            pass
+
+    def _collect_result_contours(self,
+                                 result_contours: Iterable[ResultContour]
+                                 ) -> Iterator[ResultContour]:
+        # adds contours to resultant with holes assignment
+        # & yields them without holes, since those get assigned later
+        resultant = self._resultant
+        contours = resultant.contours
+        offset = len(contours)
+        for contour_id, parent_id, contour in result_contours:
+            if parent_id != -1:
+                contours[offset + parent_id].add_hole(offset + contour_id)
+            resultant.add(contour)
+            yield contour_id, parent_id, contour.with_holes([])
+
+    def generate_contours(self, events: List[SweepEvent]
+                          ) -> Iterator[ResultContour]:
+        # yields contours as soon as they are closed,
+        # holes assignment is given by parents ids
+        if self._flat:
+            yield from self._generate_rings(events)
+            return
+        to_point, to_other_event, to_position, is_left = (
+            self._to_point, self._to_other_event, self._to_position,
+            self._is_left)
+        set_result_fields = self._set_result_fields
         depth, hole_of = [], []
-        processed = [False] * len(events)
-        contours = self._resultant.contours
+        unprocessed = UnprocessedPositions(list(map(to_point, events)))
         for index, event in enumerate(events):
-            if processed[index]:
+            if index not in unprocessed:
                 continue
-            contour = Contour([], [], True)
-            contour_id = len(contours)
-            contours.append(contour)
+            contour = self._create_contour()
+            contour_id = len(depth)
             depth.append(0)
             hole_of.append(-1)
-            if event.prev_in_result_event is not None:
-                lower_contour_id = event.prev_in_result_event.contour_id
-                if not event.prev_in_result_event.result_in_out:
-                    contours[lower_contour_id].add_hole(contour_id)
+            prev_in_result_event = self._to_prev_in_result_event(event)
+            if prev_in_result_event is not None:
+                lower_contour_id = self._to_contour_id(prev_in_result_event)
+                if not self._to_result_in_out(prev_in_result_event):
                     hole_of[contour_id] = lower_contour_id
                     depth[contour_id] = depth[lower_contour_id] + 1
                     contour.is_external = False
-                elif not contours[lower_contour_id].is_external:
-                    contours[hole_of[lower_contour_id]].add_hole(contour_id)
+                elif hole_of[lower_contour_id] != -1:
                     hole_of[contour_id] = hole_of[lower_contour_id]
                     depth[contour_id] = depth[lower_contour_id]
                     contour.is_external = False
             position = index
-            initial = event.point
+            initial = to_point(event)
             contour.add(initial)
-            event = events[position]
-            while event.other_event.point != initial:
-                processed[position] = True
-                if event.is_left:
-                    event.result_in_out = False
-                    event.contour_id = contour_id
+            steps_left = len(events)
+            while to_point(to_other_event(event)) != initial:
+                if not steps_left:
+                    raise _to_unclosed_contour_error(initial)
+                steps_left -= 1
+                unprocessed.discard(position)
+                if is_left(event):
+                    set_result_fields(event, False, contour_id)
                 else:
-                    event.other_event.result_in_out = True
-                    event.other_event.contour_id = contour_id
-                position = event.position
-                processed[position] = True
-                contour.add(events[position].point)
-                position = self.to_next_position(position, events, processed)
+                    set_result_fields(to_other_event(event), True,
+                                      contour_id)
+                position = to_position(event)
+                unprocessed.discard(position)
+                contour.add(to_point(events[position]))
+                position = unprocessed.to_next(position)
                 event = events[position]
-            processed[position] = processed[event.position] = True
-            event.other_event.result_in_out = True
-            event.other_event.contour_id = contour_id
+            unprocessed.discard(position)
+            unprocessed.discard(to_position(event))
+            set_result_fields(to_other_event(event), True, contour_id)
             if depth[contour_id] & 1:
                 contour.reverse()
+            yield contour_id, hole_of[contour_id], contour
+
+    def _create_contour(self) -> Contour:
+        return (Contour([], [], True)
+                if self._typecode is None
+                else Contour.from_coordinates([], [], True,
+                                              typecode=self._typecode))
+
+    def _generate_rings(self, events: List[SweepEvent]
+                        ) -> Iterator[ResultContour]:
+        # same traversal as ``generate_contours``
+        # without nesting & orientation bookkeeping
+        to_point, to_other_event, to_position = (
+            self._to_point, self._to_other_event, self._to_position)
+        unprocessed = UnprocessedPositions(list(map(to_point, events)))
+        contour_id = 0
+        for index, event in enumerate(events):
+            if index not in unprocessed:
+                continue
+            contour = self._create_contour()
+            position = index
+            initial = to_point(event)
+            contour.add(initial)
+            steps_left = len(events)
+            while to_point(to_other_event(event)) != initial:
+                if not steps_left:
+                    raise _to_unclosed_contour_error(initial)
+                steps_left -= 1
+                unprocessed.discard(position)
+                position = to_position(event)
+                unprocessed.discard(position)
+                contour.add(to_point(events[position]))
+                position = unprocessed.to_next(position)
+                event = events[position]
+            unprocessed.discard(position)
+            unprocessed.discard(to_position(event))
+            yield contour_id, -1, contour
+            contour_id += 1
 
     def process_segments(self) -> None:
-        for contour in self._left.contours:
-            for segment in to_segments(contour.points):
-                self._process_segment(segment, PolygonType.SUBJECT)
-        for contour in self._right.contours:
-            for segment in to_segments(contour.points):
-                self._process_segment(segment, PolygonType.CLIPPING)
-
-    def _process_segment(self, segment: Segment,
-                         polygon_type: PolygonType) -> None:
-        source_event = SweepEvent(True, segment.source, None, polygon_type,
-                                  EdgeType.NORMAL)
-        target_event = SweepEvent(True, segment.target, source_event,
-                                  polygon_type, EdgeType.NORMAL)
-        source_event.other_event = target_event
-        if segment.min == segment.source:
-            target_event.is_left = False
+        self._process_contours(self._left.contours, self._right.contours)
+
+    def _process_contours(self, left_contours: List[Contour],
+                          right_contours: List[Contour],
+                          sweep_limit: Optional[Scalar] = None,
+                          sweep_start: Optional[Scalar] = None) -> None:
+        if self._segments_processed:
+            # events of segments are queued already
+            return
+        self._segments_processed = True
+        if self._monotone_chains:
+            self._events_queue.load_monotone_chains(
+                    [(PolygonType.SUBJECT, chain)
+                     for contour in left_contours
+                     for chain in to_monotone_chains(contour.points)]
+                    + [(PolygonType.CLIPPING, chain)
+                       for contour in right_contours
+                       for chain in to_monotone_chains(contour.points)])
+            return
+        to_segment_events = self._to_segment_events
+        events = []
+        for contours, polygon_type in [(left_contours, PolygonType.SUBJECT),
+                                       (right_contours,
+                                        PolygonType.CLIPPING)]:
+            for contour in contours:
+                for segment in to_segments(contour.points):
+                    if (sweep_limit is not None
+                            and segment.source.x > sweep_limit
+                            and segment.target.x > sweep_limit):
+                        # segment's events would never be swept
+                        continue
+                    if (sweep_start is not None
+                            and segment.source.x < sweep_start
+                            and segment.target.x < sweep_start):
+                        # segment would leave sweep line before the start
+                        continue
+                    events.extend(to_segment_events(segment, polygon_type))
+        self._events_queue.load(events)
+
+    def _process_swept_segments(self) -> None:
+        # skips segments which would never be swept
+        # or would be swept only before the sweep start
+        self._process_contours(self._left.contours, self._right.contours,
+                               self._to_sweep_limit(self._left, self._right),
+                               self._find_sweep_start())
+
+    def _find_sweep_start(self) -> Optional[Scalar]:
+        # segments of simple polygons do not cross each other,
+        # so the ones before the start do not affect the rest
+        # except for in/out flags
+        return (None
+                if not self._simple or self._to_sweep_start is None
+                else self._to_sweep_start(self._left, self._right))
+
+    def _prefilter_contours(self) -> List[Contour]:
+        # contours not interacting with the rest
+        # do not get into result of intersection
+        # (of difference for clipping ones),
+        # are passed to result as the sweep would assemble them otherwise
+        # and do not change in/out flags of the rest
+        # unless they share abscissas with swept ones
+        left_contours, right_contours = (self._left.contours,
+                                         self._right.contours)
+        left_flags, right_flags = to_interaction_flags(left_contours,
+                                                       right_contours)
+        flags = to_stacking_flags(left_contours + right_contours,
+                                  left_flags + right_flags)
+        left_flags, right_flags = (flags[:len(left_contours)],
+                                   flags[len(left_contours):])
+        if self._type is OperationType.INTERSECTION:
+            passed = []
         else:
-            source_event.is_left = False
-        self._events_queue.push(source_event)
-        self._events_queue.push(target_event)
+            passed = to_passed_contours(left_contours, left_flags)
+            if self._type is not OperationType.DIFFERENCE:
+                passed += to_passed_contours(right_contours, right_flags)
+        self._process_contours(
+                [contour
+                 for contour, is_interacting in zip(left_contours, left_flags)
+                 if is_interacting],
+                [contour
+                 for contour, is_interacting in zip(right_contours,
+                                                    right_flags)
+                 if is_interacting],
+                None
+                if self._to_sweep_limit is None
+                else self._to_sweep_limit(self._left, self._right),
+                self._find_sweep_start())
+        return passed
 
     def sweep(self) -> List[SweepEvent]:
-        min_max_x = min(self._left.bounding_box.x_max,
-                        self._right.bounding_box.x_max)
+        sweep_limit = (None
+                       if self._to_sweep_limit is None
+                       else self._to_sweep_limit(self._left, self._right))
+        sweep_start = self._find_sweep_start()
+        to_x, is_left, to_other_event = (self._to_x, self._is_left,
+                                         self._to_other_event)
         result = []
         events_queue = self._events_queue
-        sweep_line = red_black.set_(key=SweepLineKey)
+        sweep_line = SweepLine(self._sweep_line_key)
+        if sweep_start is not None:
+            self._skim(sweep_line, result, sweep_start)
         while events_queue:
-            event = events_queue.peek()
-            if (self._type is OperationType.INTERSECTION
-                    and event.point.x > min_max_x
-                    or self._type is OperationType.DIFFERENCE
-                    and event.point.x > self._left.bounding_box.x_max):
+            if (sweep_limit is not None
+                    and to_x(events_queue.peek()) > sweep_limit):
                 break
+            event = events_queue.pop()
             result.append(event)
-            events_queue.pop()
-            if event.is_left:
-                sweep_line.add(event)
-                try:
-                    next_event = sweep_line.next(event)
-                except ValueError:
-                    next_event = None
-                try:
-                    previous_event = sweep_line.prev(event)
-                except ValueError:
-                    previous_event = None
+            if is_left(event):
+                node = sweep_line.add(event)
+                next_node, previous_node = node.successor, node.predecessor
+                next_event = None if next_node is None else next_node.value
+                previous_event = (None
+                                  if previous_node is None
+                                  else previous_node.value)
                 self.compute_fields(event, previous_event)
                 if next_event is not None:
                     if self.possible_intersection(event, next_event) == 2:
@@ -635,30 +1331,49 @@ class Operation:
                         self.compute_fields(next_event, event)
                 if previous_event is not None:
                     if self.possible_intersection(previous_event, event) == 2:
-                        try:
-                            pre_previous_event = sweep_line.prev(
-                                    previous_event)
-                        except ValueError:
-                            pre_previous_event = None
-                        self.compute_fields(previous_event, pre_previous_event)
+                        pre_previous_node = previous_node.predecessor
+                        self.compute_fields(previous_event,
+                                            None
+                                            if pre_previous_node is None
+                                            else pre_previous_node.value)
                         self.compute_fields(event, previous_event)
             else:
-                event = event.other_event
-                if event not in sweep_line:
+                node = sweep_line.find(to_other_event(event))
+                if node is None:
                     continue
-                try:
-                    next_event = sweep_line.next(event)
-                except ValueError:
-                    next_event = None
-                try:
-                    previous_event = sweep_line.prev(event)
-                except ValueError:
-                    previous_event = None
-                sweep_line.remove(event)
-                if next_event is not None and previous_event is not None:
-                    self.possible_intersection(previous_event, next_event)
+                next_node, previous_node = node.successor, node.predecessor
+                sweep_line.remove(node)
+                if next_node is not None and previous_node is not None:
+                    self.possible_intersection(previous_node.value,
+                                               next_node.value)
+        sweep_line.clear()
         return result
 
+    def _skim(self, sweep_line: SweepLine, result: List[SweepEvent],
+              sweep_start: Scalar) -> None:
+        # events before the start belong to a single simple polygon
+        # and lie outside of the other one,
+        # so intersections are not checked
+        # and none of the edges is in result,
+        # in/out flags are needed only for segments crossing the start,
+        # so they are computed once the start is reached
+        to_x, is_left, to_other_event = (self._to_x, self._is_left,
+                                         self._to_other_event)
+        events_queue = self._events_queue
+        while events_queue and to_x(events_queue.peek()) < sweep_start:
+            event = events_queue.pop()
+            result.append(event)
+            if is_left(event):
+                sweep_line.add(event)
+            else:
+                node = sweep_line.find(to_other_event(event))
+                if node is not None:
+                    sweep_line.remove(node)
+        previous_event = None
+        for event in sweep_line:
+            self.compute_fields(event, previous_event)
+            previous_event = event
+
     def compute_fields(self, event: SweepEvent,
                        previous_event: Optional[SweepEvent]) -> None:
         if previous_event is None:
@@ -680,37 +1395,157 @@ class Operation:
                 else previous_event)
         event.in_result = self.in_result(event)
 
+    def release(self) -> None:
+        # drops queued events,
+        # so operation kept after run holds only the resultant,
+        # entries are visited in storage order since it does not matter
+        events_queue = self._events_queue
+        dismantle_events(entry[3].event
+                         for entries in (events_queue._sorted_entries,
+                                         events_queue._entries)
+                         for entry in entries)
+        self._events_queue = EventsQueue()
+
     def run(self) -> None:
+        self._validate_not_streamed()
         if self._already_run:
             return
-        if self.is_trivial:
-            return
-        self.process_segments()
-        self.connect_edges(self.sweep())
+        if not self.is_trivial:
+            if self._suspend_gc:
+                with suspended_gc():
+                    self._run()
+            else:
+                self._run()
+        self._adopt(self._resultant)
+
+    def _adopt(self, resultant: Polygon) -> None:
+        # finishes run with the resultant,
+        # which may be computed by a copy of operation (e.g. in other process)
+        self._resultant = resultant
         self._already_run = True
+        if self._vertex_table is not None:
+            self._vertices_indices = self._vertex_table.intern_polygon(
+                    resultant)
+
+    def stream(self) -> Iterator[ResultContour]:
+        # yields resultant contours as soon as they are closed,
+        # so consumer may process them while assembly goes on,
+        # they are not collected, so operation can be streamed only once
+        # & can not be run afterwards
+        if self._already_run or self.is_trivial:
+            self.run()
+            return to_result_contours(self._resultant)
+        self._validate_not_streamed()
+        self._is_streamed = True
+        result = self._stream()
+        return (with_suspended_gc(result)
+                if self._suspend_gc
+                else result)
+
+    def _stream(self) -> Iterator[ResultContour]:
+        events, passed = self._sweep_contours()
+        try:
+            yield from self._intern_result_contours(
+                    self._to_result_contours(events, passed))
+        finally:
+            # also when consumer stops early
+            self._finish(events)
+
+    def _intern_result_contours(self, result_contours: Iterable[ResultContour]
+                                ) -> Iterator[ResultContour]:
+        vertex_table = self._vertex_table
+        if vertex_table is None:
+            yield from result_contours
+            return
+        for contour_id, parent_id, contour in result_contours:
+            contour, _ = vertex_table.intern_contour(contour)
+            yield contour_id, parent_id, contour
+
+    def _validate_not_streamed(self) -> None:
+        if self._is_streamed:
+            raise ValueError('Operation is streamed, '
+                             'so it has no resultant.')
+
+    def _run(self) -> None:
+        events, passed = self._sweep_contours()
+        for _ in self._collect_result_contours(
+                self._to_result_contours(events, passed)):
+            pass
+        self._finish(events)
+
+    def _to_result_contours(self, events: List[SweepEvent],
+                            passed: Optional[List[Contour]]
+                            ) -> Iterator[ResultContour]:
+        result = self.generate_contours(self.collect_events(events))
+        return (result
+                if passed is None
+                else merge_passed_contours(result, passed))
+
+    def _sweep_contours(self) -> Tuple[List[SweepEvent],
+                                       Optional[List[Contour]]]:
+        # returns swept events & contours passed through to the result
+        if self._segments_processed:
+            # all of the segments are queued by explicit processing,
+            # so none of the contours is passed
+            return self.sweep(), None
+        passed = None
+        if self._prefilter:
+            passed = self._prefilter_contours()
+        elif self._to_sweep_limit is None:
+            self.process_segments()
+        else:
+            self._process_swept_segments()
+        return self.sweep(), passed
+
+    def _finish(self, events: List[SweepEvent]) -> None:
+        self._dismantle(events)
+        self.release()
 
     @staticmethod
-    def to_next_position(position: int, events: List[SweepEvent],
-                         processed: List[bool]) -> int:
-        result = position + 1
-        while (result < len(events)
-               and events[result].point == events[position].point):
-            if not processed[result]:
-                return result
-            else:
-                result += 1
-        if not position:
-            return 0
-        result = position - 1
-        while processed[result]:
-            if not result:
-                break
-            result -= 1
-        return result
+    def _dismantle(events: List[SweepEvent]) -> None:
+        # the rest of events are either queued or linked only to these
+        dismantle_events(events)
 
 
 def compute(left: Polygon, right: Polygon,
-            operation_type: OperationType) -> Polygon:
-    operation = Operation(left, right, operation_type)
+            operation_type: OperationType,
+            *,
+            monotone_chains: bool = False,
+            prefilter: bool = False,
+            simple: bool = False,
+            typecode: Optional[str] = None,
+            suspend_gc: bool = False,
+            flat: bool = False,
+            vertex_table: Optional[VertexTable] = None) -> Polygon:
+    operation = Operation(left, right, operation_type,
+                          monotone_chains=monotone_chains,
+                          prefilter=prefilter,
+                          simple=simple,
+                          typecode=typecode,
+                          suspend_gc=suspend_gc,
+                          flat=flat,
+                          vertex_table=vertex_table)
     operation.run()
     return operation.resultant
+
+
+def stream(left: Polygon, right: Polygon,
+           operation_type: OperationType,
+           *,
+           monotone_chains: bool = False,
+           prefilter: bool = False,
+           simple: bool = False,
+           typecode: Optional[str] = None,
+           suspend_gc: bool = False,
+           flat: bool = False,
+           vertex_table: Optional[VertexTable] = None
+           ) -> Iterator[ResultContour]:
+    operation = Operation(left, right, operation_type,
+                          monotone_chains=monotone_chains,
+                          prefilter=prefilter,
+                          simple=simple,
+                          typecode=typecode,
+                          suspend_gc=suspend_gc,
+                          flat=flat,
+                          vertex_table=vertex_table)
+    return operation.stream()
@@ -39,6 +39,9 @@ class BoundingBox:
                 if isinstance(other, BoundingBox)
                 else NotImplemented)
 
+    def __hash__(self) -> int:
+        return hash((self._x_min, self._y_min, self._x_max, self._y_max))
+
     def __add__(self, other: 'BoundingBox') -> 'BoundingBox':
         return BoundingBox(min(self._x_min, other._x_min),
                            min(self._y_min, other._y_min),
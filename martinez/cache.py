@@ -0,0 +1,438 @@
+import hashlib
+import os
+import struct
+import tempfile
+import time
+from array import array
+from collections import OrderedDict
+from typing import (Hashable,
+                    List,
+                    Optional,
+                    Tuple)
+
+from reprit.base import generate_repr
+
+from . import __version__
+from .boolean import (OperationType,
+                      compute)
+from .contour import Contour
+from .frozen import (FrozenContour,
+                     FrozenPolygon)
+from .point import Point
+from .polygon import Polygon
+
+COMMUTATIVE_OPERATIONS_TYPES = (OperationType.INTERSECTION,
+                                OperationType.UNION,
+                                OperationType.XOR)
+# binary format stores coordinates as machine-native floats,
+# so it is meant for caches local to the machine
+SIGNATURE = b'MRTZ\x01'
+_POLYGON_HEADER = struct.Struct('=I')
+_CONTOUR_HEADER = struct.Struct('=?cII')
+_HOLES_TYPECODE = 'q'
+_MAX_HOLE = 2 ** 63 - 1
+_POINTS_TYPECODE = b'\x00'
+ENTRY_EXTENSION = '.polygon'
+TEMPORARY_EXTENSION = '.tmp'
+# of temporary files left by crashed writers in seconds,
+# writing an entry takes much less
+STALE_TEMPORARY_AGE = 60 * 60
+
+
+def to_canonical_contour(contour: Contour) -> Contour:
+    # rotates vertices to start from the lowest one,
+    # so contours which differ only in start vertex become equal
+    coordinates = contour.coordinates
+    pairs = list(zip(coordinates[0::2], coordinates[1::2]))
+    if not pairs:
+        return contour.with_holes(contour.holes[:])
+    minimum = min(pairs)
+    start = pairs.index(minimum)
+    if pairs.count(minimum) > 1:
+        start = min((index
+                     for index, pair in enumerate(pairs)
+                     if pair == minimum),
+                    key=lambda index: pairs[index:] + pairs[:index])
+    if contour.typecode is None:
+        points = contour.points
+        return Contour(points[start:] + points[:start], contour.holes[:],
+                       contour.is_external)
+    return Contour.from_coordinates(coordinates[2 * start:]
+                                    + coordinates[:2 * start],
+                                    contour.holes[:], contour.is_external,
+                                    typecode=contour.typecode)
+
+
+def canonicalize(polygon: Polygon) -> FrozenPolygon:
+    # hash of canonical form is the fingerprint of polygon
+    return FrozenPolygon([FrozenContour.from_contour(
+            to_canonical_contour(contour))
+        for contour in polygon.contours])
+
+
+class ComputeCache:
+    # memoizes results of ``compute`` in least-recently-used order,
+    # cached results are equivalent to computed ones
+    # up to start vertices & order of contours
+    __slots__ = ('_max_vertices_count', '_entries', '_vertices_count',
+                 '_hits', '_misses', '_evictions')
+
+    def __init__(self, max_vertices_count: int) -> None:
+        if max_vertices_count < 0:
+            raise ValueError('Vertices count should be non-negative, '
+                             'but found: {}.'.format(max_vertices_count))
+        self._max_vertices_count = max_vertices_count
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._vertices_count = 0
+        self._hits = self._misses = self._evictions = 0
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def max_vertices_count(self) -> int:
+        return self._max_vertices_count
+
+    @property
+    def vertices_count(self) -> int:
+        # of stored inputs & results
+        return self._vertices_count
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._vertices_count = 0
+
+    def compute(self, left: Polygon, right: Polygon,
+                operation_type: OperationType,
+                *,
+                monotone_chains: bool = False,
+                prefilter: bool = False,
+                simple: bool = False,
+                typecode: Optional[str] = None,
+                suspend_gc: bool = False,
+                flat: bool = False) -> Polygon:
+        canonical_left, canonical_right = (canonicalize(left),
+                                           canonicalize(right))
+        key = _to_key(canonical_left, canonical_right, operation_type,
+                      prefilter, simple, typecode, flat)
+        entries = self._entries
+        try:
+            _, result = entries[key]
+        except KeyError:
+            self._misses += 1
+        else:
+            self._hits += 1
+            entries.move_to_end(key)
+            return result.thaw()
+        resultant = compute(left, right, operation_type,
+                            monotone_chains=monotone_chains,
+                            prefilter=prefilter,
+                            simple=simple,
+                            typecode=typecode,
+                            suspend_gc=suspend_gc,
+                            flat=flat)
+        cost = (canonical_left.vertices_count
+                + canonical_right.vertices_count
+                + resultant.vertices_count)
+        if cost <= self._max_vertices_count:
+            while self._vertices_count + cost > self._max_vertices_count:
+                _, (evicted_cost, _) = entries.popitem(last=False)
+                self._vertices_count -= evicted_cost
+                self._evictions += 1
+            # entry is a snapshot, so caller may modify resultant
+            entries[key] = cost, FrozenPolygon.from_polygon(resultant)
+            self._vertices_count += cost
+        return resultant
+
+
+def _to_key(left: FrozenPolygon, right: FrozenPolygon,
+            operation_type: OperationType,
+            *options: Hashable) -> Tuple[Hashable, ...]:
+    operands = (frozenset((left, right))
+                if operation_type in COMMUTATIVE_OPERATIONS_TYPES
+                else (left, right))
+    return (operation_type, operands) + options
+
+
+def is_packable(polygon: Polygon) -> bool:
+    # only floating point coordinates survive binary round trip as they are
+    return all((contour.typecode is not None
+                or all(type(coordinate) is float
+                       for coordinate in contour.coordinates))
+               and all(0 <= hole <= _MAX_HOLE for hole in contour.holes)
+               for contour in polygon.contours)
+
+
+def polygon_to_bytes(polygon: Polygon) -> bytes:
+    chunks = [SIGNATURE, _POLYGON_HEADER.pack(len(polygon.contours))]
+    for contour in polygon.contours:
+        typecode = contour.typecode
+        coordinates = (array('d', contour.coordinates)
+                       if typecode is None
+                       else contour.coordinates)
+        chunks.append(_CONTOUR_HEADER.pack(
+                contour.is_external,
+                (_POINTS_TYPECODE
+                 if typecode is None
+                 else typecode.encode()),
+                len(contour.holes), len(coordinates)))
+        chunks.append(array(_HOLES_TYPECODE, contour.holes).tobytes())
+        chunks.append(coordinates.tobytes())
+    return b''.join(chunks)
+
+
+def polygon_from_bytes(data: bytes) -> Polygon:
+    if not data.startswith(SIGNATURE):
+        raise ValueError('Data should start with signature {!r}.'
+                         .format(SIGNATURE))
+    view = memoryview(data)
+    offset = len(SIGNATURE)
+    try:
+        contours_count, = _POLYGON_HEADER.unpack_from(view, offset)
+        offset += _POLYGON_HEADER.size
+        contours = []
+        for _ in range(contours_count):
+            (is_external, typecode, holes_count,
+             coordinates_count) = _CONTOUR_HEADER.unpack_from(view, offset)
+            offset += _CONTOUR_HEADER.size
+            holes = array(_HOLES_TYPECODE)
+            holes_end = offset + holes_count * holes.itemsize
+            holes.frombytes(view[offset:holes_end])
+            coordinates = array('d'
+                                if typecode == _POINTS_TYPECODE
+                                else typecode.decode())
+            offset = holes_end + coordinates_count * coordinates.itemsize
+            coordinates.frombytes(view[holes_end:offset])
+            contours.append(
+                    Contour(list(map(Point, coordinates[0::2],
+                                     coordinates[1::2])),
+                            holes.tolist(), is_external)
+                    if typecode == _POINTS_TYPECODE
+                    else Contour.from_coordinates(coordinates,
+                                                  holes.tolist(),
+                                                  is_external,
+                                                  typecode=typecode.decode()))
+    except (struct.error, ValueError) as error:
+        raise ValueError('Data is truncated or corrupted.') from error
+    if offset != len(data):
+        raise ValueError('Data has {} trailing bytes.'
+                         .format(len(data) - offset))
+    return Polygon(contours)
+
+
+def to_digest(left: Polygon, right: Polygon,
+              operation_type: OperationType,
+              *options: Hashable) -> str:
+    # stable across processes unlike built-in hashes
+    left_digest, right_digest = (
+        hashlib.sha256(polygon_to_bytes(
+                Polygon([to_canonical_contour(contour)
+                         for contour in polygon.contours]))).hexdigest()
+        for polygon in (left, right))
+    if operation_type in COMMUTATIVE_OPERATIONS_TYPES:
+        left_digest, right_digest = sorted((left_digest, right_digest))
+    return hashlib.sha256(
+            '{} {} {} {} {!r}'.format(__version__, int(operation_type),
+                                      left_digest, right_digest, options)
+            .encode()).hexdigest()
+
+
+class DiskCache:
+    # persists results of ``compute`` as files in directory,
+    # which can be shared by several processes:
+    # entries are written atomically & evicted in least-recently-used order
+    # (by modification time) to keep their total size under the limit,
+    # operands with non-floating point coordinates are not cached
+    __slots__ = ('_directory', '_max_size', '_entries', '_entries_size',
+                 '_hits', '_misses', '_evictions')
+
+    def __init__(self, directory: str, max_size: int) -> None:
+        if max_size < 0:
+            raise ValueError('Size should be non-negative, '
+                             'but found: {}.'.format(max_size))
+        os.makedirs(directory,
+                    exist_ok=True)
+        self._directory = directory
+        self._max_size = max_size
+        # sizes of entries by paths in least-recently-used order,
+        # so storing does not scan the directory,
+        # entries stored by other processes get into it
+        # once the limit is crossed & the directory is scanned again
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._entries_size = 0
+        self._load_entries()
+        self._hits = self._misses = self._evictions = 0
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        # of stored entries in bytes
+        return sum(size for _, size, _ in self._to_entries())
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        # made by this instance
+        return self._evictions
+
+    def __len__(self) -> int:
+        return len(self._to_entries())
+
+    def clear(self) -> None:
+        for _, _, path in self._to_entries():
+            _remove(path)
+        self._entries.clear()
+        self._entries_size = 0
+
+    def compute(self, left: Polygon, right: Polygon,
+                operation_type: OperationType,
+                *,
+                monotone_chains: bool = False,
+                prefilter: bool = False,
+                simple: bool = False,
+                typecode: Optional[str] = None,
+                suspend_gc: bool = False,
+                flat: bool = False) -> Polygon:
+        path = None
+        if is_packable(left) and is_packable(right):
+            path = os.path.join(self._directory,
+                                to_digest(left, right, operation_type,
+                                          prefilter, simple, typecode, flat)
+                                + ENTRY_EXTENSION)
+            try:
+                with open(path, 'rb') as file:
+                    data = file.read()
+                result = polygon_from_bytes(data)
+            except (OSError, ValueError):
+                # missing, evicted or written by incompatible version
+                pass
+            else:
+                self._hits += 1
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+                else:
+                    self._add_entry(path, len(data))
+                return result
+        self._misses += 1
+        result = compute(left, right, operation_type,
+                         monotone_chains=monotone_chains,
+                         prefilter=prefilter,
+                         simple=simple,
+                         typecode=typecode,
+                         suspend_gc=suspend_gc,
+                         flat=flat)
+        if path is not None and is_packable(result):
+            data = polygon_to_bytes(result)
+            if len(data) <= self._max_size:
+                self._store(path, data)
+                self._evict()
+        return result
+
+    def _store(self, path: str, data: bytes) -> None:
+        # readers see either complete entry or none
+        descriptor, temporary_path = tempfile.mkstemp(
+                suffix=TEMPORARY_EXTENSION,
+                dir=self._directory)
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(data)
+            os.replace(temporary_path, path)
+        except OSError:
+            _remove(temporary_path)
+        else:
+            self._add_entry(path, len(data))
+
+    def _add_entry(self, path: str, size: int) -> None:
+        entries = self._entries
+        self._entries_size += size - entries.pop(path, 0)
+        entries[path] = size
+
+    def _evict(self) -> None:
+        if self._entries_size <= self._max_size:
+            return
+        # other processes may have stored or evicted entries
+        self._load_entries()
+        entries = self._entries
+        while self._entries_size > self._max_size:
+            path, entry_size = entries.popitem(last=False)
+            if _remove(path):
+                self._evictions += 1
+            self._entries_size -= entry_size
+
+    def _load_entries(self) -> None:
+        self._remove_stale_temporaries()
+        entries = self._to_entries()
+        entries.sort()
+        self._entries.clear()
+        self._entries.update((path, size) for _, size, path in entries)
+        self._entries_size = sum(size for _, size, _ in entries)
+
+    def _remove_stale_temporaries(self) -> None:
+        # left by writers which crashed before replacing entry
+        expiration_time = time.time() - STALE_TEMPORARY_AGE
+        for name in os.listdir(self._directory):
+            if not name.endswith(TEMPORARY_EXTENSION):
+                continue
+            path = os.path.join(self._directory, name)
+            try:
+                is_stale = os.stat(path).st_mtime < expiration_time
+            except OSError:
+                # replaced or removed by another process
+                continue
+            if is_stale:
+                _remove(path)
+
+    def _to_entries(self) -> List[Tuple[float, int, str]]:
+        result = []
+        for name in os.listdir(self._directory):
+            if not name.endswith(ENTRY_EXTENSION):
+                continue
+            path = os.path.join(self._directory, name)
+            try:
+                status = os.stat(path)
+            except OSError:
+                # removed by another process
+                continue
+            result.append((status.st_mtime, status.st_size, path))
+        return result
+
+
+def _remove(path: str) -> bool:
+    try:
+        os.remove(path)
+    except OSError:
+        return False
+    else:
+        return True
@@ -1,44 +1,103 @@
-from functools import reduce
-from operator import add
-from typing import (Iterator,
-                    List)
+import operator
+from array import array
+from typing import (Iterable,
+                    Iterator,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple)
 
 from reprit.base import generate_repr
 
 from .bounding_box import BoundingBox
+from .hints import Scalar
 from .point import Point
 
+COORDINATES_TYPECODES = 'd', 'f'
+
 
 class Contour:
-    __slots__ = '_points', '_holes', 'is_external'
+    __slots__ = ('_points', '_coordinates', '_holes', 'is_external',
+                 '_is_shared', '_bounding_box', '_doubled_signed_area')
 
     def __init__(self, points: List[Point], holes: List[int], is_external: bool
                  ) -> None:
         self._points = points
+        self._coordinates = None
         self._holes = holes
         self.is_external = is_external
+        # vertices storage is shared with other contours
+        # & gets copied on the first modification
+        self._is_shared = False
+        self._invalidate()
 
     __repr__ = generate_repr(__init__)
 
+    @classmethod
+    def from_coordinates(cls, coordinates: Iterable[Scalar],
+                         holes: List[int],
+                         is_external: bool,
+                         *,
+                         typecode: str = 'd') -> 'Contour':
+        # stores vertices as interleaved "x, y" pairs in contiguous array,
+        # points are materialized on demand
+        if typecode not in COORDINATES_TYPECODES:
+            raise ValueError('Coordinates typecode should be one of {}, '
+                             'but found: {!r}.'
+                             .format(COORDINATES_TYPECODES, typecode))
+        result = cls(None, holes, is_external)
+        result._coordinates = array(typecode, coordinates)
+        return result
+
     def __iter__(self) -> Iterator[Point]:
-        return iter(self._points)
+        if self._coordinates is None:
+            return iter(self._points)
+        coordinates = self._coordinates
+        return map(Point, coordinates[0::2], coordinates[1::2])
 
     @property
     def points(self) -> List[Point]:
+        # for array-backed contour it is a fresh list on each access,
+        # shared storage gets copied since caller may modify it
+        if self._coordinates is not None:
+            return list(self)
+        if self._is_shared:
+            self._unshare()
         return self._points
 
+    @property
+    def coordinates(self) -> Sequence[Scalar]:
+        # fresh sequence on each access,
+        # so modifying it does not bypass cached metadata
+        if self._coordinates is None:
+            return [coordinate
+                    for point in self._points
+                    for coordinate in (point.x, point.y)]
+        return array(self._coordinates.typecode, self._coordinates)
+
+    @property
+    def typecode(self) -> Optional[str]:
+        return (None
+                if self._coordinates is None
+                else self._coordinates.typecode)
+
     @property
     def holes(self) -> List[int]:
         return self._holes
 
+    @property
+    def vertices_count(self) -> int:
+        return (len(self._points)
+                if self._coordinates is None
+                else len(self._coordinates) // 2)
+
+    @property
+    def signed_area(self) -> Scalar:
+        return self._to_doubled_signed_area() / 2
+
     @property
     def is_counterclockwise(self) -> bool:
-        points = self._points
-        signed_area = sum(
-                points[index].x * points[(index + 1) % len(points)].y
-                - points[(index + 1) % len(points)].x * points[index].y
-                for index in range(len(points)))
-        return signed_area >= 0
+        return self._to_doubled_signed_area() >= 0
 
     @property
     def is_clockwise(self) -> bool:
@@ -46,29 +105,54 @@ class Contour:
 
     @property
     def bounding_box(self) -> BoundingBox:
-        if self._points:
-            return reduce(add, [point.bounding_box for point in self._points])
-        else:
-            return BoundingBox(0, 0, 0, 0)
+        if self._bounding_box is None:
+            xs, ys = self._to_xs_ys()
+            self._bounding_box = (BoundingBox(min(xs), min(ys),
+                                              max(xs), max(ys))
+                                  if xs
+                                  else BoundingBox(0, 0, 0, 0))
+        return self._bounding_box
 
     def __eq__(self, other: 'Contour') -> bool:
-        return (self._points == other._points
+        # compares vertices without copying shared storage
+        return ((self._points == other._points
+                 if self._coordinates is None and other._coordinates is None
+                 else (self.vertices_count == other.vertices_count
+                       and all(map(operator.eq, self, other))))
                 and self._holes == other._holes
                 and self.is_external is other.is_external
                 if isinstance(other, Contour)
                 else NotImplemented)
 
     def add(self, point: Point) -> None:
-        self._points.append(point)
+        if self._is_shared:
+            self._unshare()
+        if self._coordinates is None:
+            self._points.append(point)
+        else:
+            self._coordinates.extend((point.x, point.y))
+        self._invalidate()
 
     def add_hole(self, hole: int) -> None:
         self._holes.append(hole)
+        self._invalidate()
 
     def clear_holes(self) -> None:
         self._holes.clear()
+        self._invalidate()
 
     def reverse(self) -> None:
-        self._points = self._points[::-1]
+        if self._coordinates is None:
+            self._points = self._points[::-1]
+        else:
+            coordinates = self._coordinates
+            reversed_coordinates = array(coordinates.typecode, coordinates)
+            reversed_coordinates[0::2] = coordinates[-2::-2]
+            reversed_coordinates[1::2] = coordinates[::-2]
+            self._coordinates = reversed_coordinates
+        # reversed vertices are stored anew
+        self._is_shared = False
+        self._invalidate()
 
     def set_clockwise(self) -> None:
         if self.is_counterclockwise:
@@ -77,3 +161,42 @@ class Contour:
     def set_counterclockwise(self) -> None:
         if self.is_clockwise:
             self.reverse()
+
+    def with_holes(self, holes: List[int]) -> 'Contour':
+        # shares vertices storage & metadata with the original
+        # until any of them is modified
+        result = Contour(self._points, holes, self.is_external)
+        result._coordinates = self._coordinates
+        result._bounding_box = self._bounding_box
+        result._doubled_signed_area = self._doubled_signed_area
+        result._is_shared = self._is_shared = True
+        return result
+
+    def _unshare(self) -> None:
+        if self._coordinates is None:
+            self._points = self._points[:]
+        else:
+            self._coordinates = array(self._coordinates.typecode,
+                                      self._coordinates)
+        self._is_shared = False
+
+    def _invalidate(self) -> None:
+        # metadata is cached lazily,
+        # so points should be modified only through the methods above
+        self._bounding_box = self._doubled_signed_area = None
+
+    def _to_doubled_signed_area(self) -> Scalar:
+        if self._doubled_signed_area is None:
+            xs, ys = self._to_xs_ys()
+            self._doubled_signed_area = sum(
+                    x * next_y - next_x * y
+                    for x, y, next_x, next_y in zip(xs, ys,
+                                                    xs[1:] + xs[:1],
+                                                    ys[1:] + ys[:1]))
+        return self._doubled_signed_area
+
+    def _to_xs_ys(self) -> Tuple[Sequence[Scalar], Sequence[Scalar]]:
+        if self._coordinates is None:
+            return ([point.x for point in self._points],
+                    [point.y for point in self._points])
+        return self._coordinates[0::2], self._coordinates[1::2]
@@ -0,0 +1,566 @@
+from array import array
+from copy import copy
+from functools import partial
+from heapq import (heappop,
+                   heappush)
+from operator import eq
+from typing import (Callable,
+                    Iterable,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple,
+                    TypeVar)
+
+from reprit import seekers
+from reprit.base import generate_repr
+
+from .boolean import (EdgeType,
+                      EventsQueueEntry,
+                      Operation,
+                      OperationType,
+                      PolygonType,
+                      collect_result_events)
+from .hints import Scalar
+from .point import Point
+from .polygon import Polygon
+from .segment import Segment
+from .utilities import sign
+from .vertices import VertexTable
+
+Domain = TypeVar('Domain')
+# marks absent link to event
+NIL = -1
+
+
+class EventsStore:
+    # struct-of-arrays counterpart of ``SweepEvent`` objects graph,
+    # event is an index into parallel arrays of fields,
+    # links between events are indices as well
+    __slots__ = ('points', 'xs', 'ys', 'are_left', 'others', 'polygons_types',
+                 'edges_types', 'in_outs', 'other_in_outs', 'in_results',
+                 'result_in_outs', 'positions', 'contours_ids',
+                 'prev_in_result_events', 'queue_entries')
+
+    def __init__(self) -> None:
+        self.points = []  # type: List[Point]
+        # coordinates are kept in lists to support exact scalars
+        self.xs = []  # type: List[Scalar]
+        self.ys = []  # type: List[Scalar]
+        self.are_left = array('b')
+        self.others = array('q')
+        self.polygons_types = array('b')
+        self.edges_types = array('b')
+        self.in_outs = array('b')
+        self.other_in_outs = array('b')
+        self.in_results = array('b')
+        self.result_in_outs = array('b')
+        self.positions = array('q')
+        self.contours_ids = array('q')
+        self.prev_in_result_events = array('q')
+        self.queue_entries = []  # type: List[Optional[EventsQueueEntry]]
+
+    __repr__ = generate_repr(__init__)
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def add(self, is_left: bool, point: Point, other: int,
+            polygon_type: PolygonType,
+            edge_type: EdgeType = EdgeType.NORMAL) -> int:
+        result = len(self.points)
+        self.points.append(point)
+        self.xs.append(point.x)
+        self.ys.append(point.y)
+        self.are_left.append(is_left)
+        self.others.append(other)
+        self.polygons_types.append(polygon_type)
+        self.edges_types.append(edge_type)
+        self.in_outs.append(False)
+        self.other_in_outs.append(False)
+        self.in_results.append(False)
+        self.result_in_outs.append(False)
+        self.positions.append(0)
+        self.contours_ids.append(0)
+        self.prev_in_result_events.append(NIL)
+        self.queue_entries.append(None)
+        return result
+
+    def add_segment(self, segment: Segment, polygon_type: PolygonType
+                    ) -> Tuple[int, int]:
+        source = len(self.points)
+        target = source + 1
+        self.add(True, segment.source, target, polygon_type)
+        self.add(True, segment.target, source, polygon_type)
+        if segment.min == segment.source:
+            self.are_left[target] = False
+        else:
+            self.are_left[source] = False
+        return source, target
+
+    def coordinates(self, event: int) -> Tuple[Scalar, Scalar, Scalar, Scalar]:
+        xs, ys, other_event = self.xs, self.ys, self.others[event]
+        return xs[event], ys[event], xs[other_event], ys[other_event]
+
+    def to_order_key(self, event: int) -> Tuple[Scalar, Scalar, bool]:
+        # same as ``events_order_key``
+        return self.xs[event], self.ys[event], self.are_left[event]
+
+    def is_vertical(self, event: int) -> bool:
+        return self.xs[event] == self.xs[self.others[event]]
+
+    def is_below(self, event: int, point: Point) -> bool:
+        return self.is_below_coordinates(event, point.x, point.y)
+
+    def is_below_coordinates(self, event: int,
+                             point_x: Scalar, point_y: Scalar) -> bool:
+        xs, ys, other_event = self.xs, self.ys, self.others[event]
+        x, y, other_x, other_y = (xs[event], ys[event], xs[other_event],
+                                  ys[other_event])
+        determinant = ((x - point_x) * (other_y - point_y)
+                       - (other_x - point_x) * (y - point_y))
+        return (determinant > 0
+                if self.are_left[event]
+                else determinant < 0)
+
+    def is_above(self, event: int, point: Point) -> bool:
+        return not self.is_below(event, point)
+
+    def is_queued_after(self, event: int, other_event: int) -> bool:
+        # same as ``EventsQueueKey`` comparison
+        xs, ys = self.xs, self.ys
+        if xs[event] != xs[other_event]:
+            return xs[event] > xs[other_event]
+        elif ys[event] != ys[other_event]:
+            return ys[event] > ys[other_event]
+        elif self.are_left[event] != self.are_left[other_event]:
+            return bool(self.are_left[event])
+        elif sign(self.points[event], self.points[self.others[event]],
+                  self.points[self.others[other_event]]):
+            return self.is_above(event, self.points[self.others[other_event]])
+        else:
+            return (self.polygons_types[event]
+                    > self.polygons_types[other_event])
+
+    def view(self, event: int) -> 'EventView':
+        return EventView(self, event)
+
+
+class EventView:
+    # read-only object-like access to stored event for debugging
+    __slots__ = '_store', '_event'
+
+    def __init__(self, store: EventsStore, event: int) -> None:
+        self._store = store
+        self._event = event
+
+    def __repr__(self) -> str:
+        return ('{}(is_left={!r}, point={!r}, polygon_type={!r}, '
+                'edge_type={!r}, in_out={!r}, other_in_out={!r}, '
+                'in_result={!r}, result_in_out={!r}, position={!r}, '
+                'contour_id={!r})'
+                .format(type(self).__qualname__, self.is_left, self.point,
+                        self.polygon_type, self.edge_type, self.in_out,
+                        self.other_in_out, self.in_result, self.result_in_out,
+                        self.position, self.contour_id))
+
+    def __eq__(self, other: 'EventView') -> bool:
+        return (self._store is other._store and self._event == other._event
+                if isinstance(other, EventView)
+                else NotImplemented)
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._event))
+
+    @property
+    def index(self) -> int:
+        return self._event
+
+    @property
+    def is_left(self) -> bool:
+        return bool(self._store.are_left[self._event])
+
+    @property
+    def point(self) -> Point:
+        return self._store.points[self._event]
+
+    @property
+    def other_event(self) -> 'EventView':
+        return EventView(self._store, self._store.others[self._event])
+
+    @property
+    def polygon_type(self) -> PolygonType:
+        return PolygonType(self._store.polygons_types[self._event])
+
+    @property
+    def edge_type(self) -> EdgeType:
+        return EdgeType(self._store.edges_types[self._event])
+
+    @property
+    def in_out(self) -> bool:
+        return bool(self._store.in_outs[self._event])
+
+    @property
+    def other_in_out(self) -> bool:
+        return bool(self._store.other_in_outs[self._event])
+
+    @property
+    def in_result(self) -> bool:
+        return bool(self._store.in_results[self._event])
+
+    @property
+    def result_in_out(self) -> bool:
+        return bool(self._store.result_in_outs[self._event])
+
+    @property
+    def position(self) -> int:
+        return self._store.positions[self._event]
+
+    @property
+    def contour_id(self) -> int:
+        return self._store.contours_ids[self._event]
+
+    @property
+    def prev_in_result_event(self) -> Optional['EventView']:
+        event = self._store.prev_in_result_events[self._event]
+        return None if event == NIL else EventView(self._store, event)
+
+    @property
+    def is_vertical(self) -> bool:
+        return self._store.is_vertical(self._event)
+
+    @property
+    def segment(self) -> Segment:
+        return Segment(self.point, self.other_event.point)
+
+
+class StoredEventsQueueTiebreaker:
+    __slots__ = 'store', 'event'
+
+    def __init__(self, store: EventsStore, event: int) -> None:
+        self.store = store
+        self.event = event
+
+    __repr__ = generate_repr(__init__)
+
+    def __lt__(self, other: 'StoredEventsQueueTiebreaker') -> bool:
+        # same as ``EventsQueueTiebreaker`` comparison
+        store, event, other_event = self.store, self.event, other.event
+        xs, ys, others = store.xs, store.ys, store.others
+        x, y = xs[other_event], ys[other_event]
+        other_x, other_y = xs[others[other_event]], ys[others[other_event]]
+        end_x, end_y = xs[others[event]], ys[others[event]]
+        determinant = ((x - end_x) * (other_y - end_y)
+                       - (other_x - end_x) * (y - end_y))
+        if determinant > 0 or determinant < 0:  # not collinear
+            # the event associate to the bottom segment is processed first
+            return (determinant < 0) is bool(store.are_left[other_event])
+        elif (store.polygons_types[other_event]
+              != store.polygons_types[event]):
+            return (store.polygons_types[other_event]
+                    > store.polygons_types[event])
+        else:
+            # events are stored in insertion order
+            return event < other_event
+
+
+def to_stored_events_queue_entry(store: EventsStore,
+                                 event: int) -> EventsQueueEntry:
+    return [store.xs[event], store.ys[event], bool(store.are_left[event]),
+            StoredEventsQueueTiebreaker(store, event)]
+
+
+class StoredEventsQueue:
+    # same as ``EventsQueue``, but holds stored events
+    __slots__ = '_store', '_sorted_entries', '_entries'
+
+    def __init__(self, store: EventsStore) -> None:
+        self._store = store
+        self._sorted_entries = []
+        self._entries = []
+
+    __repr__ = generate_repr(__init__)
+
+    def __bool__(self) -> bool:
+        return bool(self._sorted_entries or self._entries)
+
+    def __copy__(self) -> 'StoredEventsQueue':
+        result = StoredEventsQueue(self._store)
+        result._sorted_entries = self._sorted_entries[:]
+        result._entries = self._entries[:]
+        return result
+
+    def __len__(self) -> int:
+        return len(self._sorted_entries) + len(self._entries)
+
+    def load(self, events: Iterable[int]) -> None:
+        store = self._store
+        entries = [to_stored_events_queue_entry(store, event)
+                   for event in events]
+        if not entries:
+            return
+        queue_entries = store.queue_entries
+        for entry in entries:
+            queue_entries[entry[3].event] = entry
+        entries += self._sorted_entries
+        entries.sort(reverse=True)
+        self._sorted_entries = entries
+
+    def peek(self) -> int:
+        sorted_entries, entries = self._sorted_entries, self._entries
+        if sorted_entries and not (entries
+                                   and entries[0] < sorted_entries[-1]):
+            return sorted_entries[-1][3].event
+        elif entries:
+            return entries[0][3].event
+        else:
+            raise ValueError('Events queue is empty')
+
+    def pop(self) -> int:
+        sorted_entries, entries = self._sorted_entries, self._entries
+        if sorted_entries and not (entries
+                                   and entries[0] < sorted_entries[-1]):
+            entry = sorted_entries.pop()
+        elif entries:
+            entry = heappop(entries)
+        else:
+            raise ValueError('Events queue is empty')
+        return entry[3].event
+
+    def push(self, event: int) -> None:
+        store = self._store
+        store.queue_entries[event] = entry = to_stored_events_queue_entry(
+                store, event)
+        heappush(self._entries, entry)
+
+    def update(self, event: int) -> None:
+        # endpoint type of queued event has changed
+        entry = self._store.queue_entries[event]
+        if entry is not None:
+            entry[2] = bool(self._store.are_left[event])
+
+
+class StoredSweepLineKey:
+    __slots__ = 'store', 'event'
+
+    def __init__(self, store: EventsStore, event: int) -> None:
+        self.store = store
+        self.event = event
+
+    __repr__ = generate_repr(__init__)
+
+    def __lt__(self, other: 'StoredSweepLineKey') -> bool:
+        # same as ``SweepLineKey`` comparison
+        if self is other:
+            return False
+        store, event, other_event = self.store, self.event, other.event
+        xs, ys, others = store.xs, store.ys, store.others
+        x, y, end_x, end_y = (xs[event], ys[event], xs[others[event]],
+                              ys[others[event]])
+        other_x, other_y, other_end_x, other_end_y = (
+            xs[other_event], ys[other_event], xs[others[other_event]],
+            ys[others[other_event]])
+        start_determinant = ((x - other_x) * (end_y - other_y)
+                             - (end_x - other_x) * (y - other_y))
+        end_determinant = ((x - other_end_x) * (end_y - other_end_y)
+                           - (end_x - other_end_x) * (y - other_end_y))
+        is_left = store.are_left[event]
+        if not (start_determinant > 0 or start_determinant < 0
+                or end_determinant > 0 or end_determinant < 0):
+            # segments are collinear
+            polygon_type, other_polygon_type = (
+                store.polygons_types[event],
+                store.polygons_types[other_event])
+            return (store.is_queued_after(event, other_event)
+                    if polygon_type == other_polygon_type
+                    else polygon_type < other_polygon_type)
+        # segments are not collinear
+        elif x == other_x and y == other_y:
+            # same left endpoint, use the right endpoint to sort
+            return (end_determinant > 0
+                    if is_left
+                    else end_determinant < 0)
+        # different left endpoint, use the left endpoint to sort
+        elif x == other_x:
+            return y < other_y
+        elif x > other_x:
+            return not store.is_below_coordinates(other_event, x, y)
+        else:
+            return (start_determinant > 0
+                    if is_left
+                    else start_determinant < 0)
+
+
+class StoredEventsQueueKey:
+    __slots__ = 'store', 'event'
+
+    def __init__(self, store: EventsStore, event: int) -> None:
+        self.store = store
+        self.event = event
+
+    __repr__ = generate_repr(__init__)
+
+    def __lt__(self, other: 'StoredEventsQueueKey') -> bool:
+        # same as ``EventsQueueKey`` comparison
+        return self.store.is_queued_after(self.event, other.event)
+
+
+def to_item_getter(sequence: Sequence[Domain]) -> Callable[[int], Domain]:
+    # unlike bound methods of built-in types
+    # partials get deep copied along with the sequence
+    return partial(type(sequence).__getitem__, sequence)
+
+
+def _sort_stored_events(store: EventsStore, events: List[int],
+                        start: int, stop: int) -> None:
+    # same as ``_sort_events``
+    events[start:stop] = sorted(events[start:stop],
+                                key=partial(StoredEventsQueueKey, store),
+                                reverse=True)
+
+
+class StoredOperation(Operation):
+    # runs the same sweep & edges connection as ``Operation``
+    # on events kept in ``EventsStore``
+    # instead of graph of ``SweepEvent`` objects,
+    # so events are integer indices in its methods
+    __slots__ = ('_store', '_to_point', '_to_x', '_is_left', '_is_in_result',
+                 '_to_other_event', '_to_polygon_type', '_to_in_out',
+                 '_to_position', '_to_result_in_out', '_to_contour_id',
+                 '_to_order_key', '_sort_tied_events', '_sweep_line_key',
+                 '_to_segment_events', '_is_queued_after', '_set_position')
+
+    def __init__(self, left: Polygon, right: Polygon,
+                 type_: OperationType,
+                 *,
+                 monotone_chains: bool = False,
+                 prefilter: bool = False,
+                 simple: bool = False,
+                 typecode: Optional[str] = None,
+                 suspend_gc: bool = False,
+                 flat: bool = False,
+                 vertex_table: Optional[VertexTable] = None) -> None:
+        if monotone_chains:
+            raise ValueError('Monotone chains are not supported '
+                             'by stored events.')
+        super().__init__(left, right, type_,
+                         prefilter=prefilter,
+                         simple=simple,
+                         typecode=typecode,
+                         suspend_gc=suspend_gc,
+                         flat=flat,
+                         vertex_table=vertex_table)
+        self._bind(EventsStore())
+
+    __repr__ = generate_repr(__init__,
+                             field_seeker=seekers.complex_)
+
+    @property
+    def store(self) -> EventsStore:
+        return self._store
+
+    @property
+    def events(self) -> List[EventView]:
+        events_queue = copy(self._events_queue)
+        return [self._store.view(events_queue.pop())
+                for _ in range(len(events_queue))]
+
+    def _bind(self, store: EventsStore) -> None:
+        # algorithms inherited from ``Operation`` access stored events
+        # with methods bound to the store
+        self._store = store
+        self._events_queue = StoredEventsQueue(store)
+        self._to_point = to_item_getter(store.points)
+        self._to_x = to_item_getter(store.xs)
+        self._is_left = to_item_getter(store.are_left)
+        self._is_in_result = to_item_getter(store.in_results)
+        self._to_other_event = to_item_getter(store.others)
+        self._to_polygon_type = to_item_getter(store.polygons_types)
+        self._to_in_out = to_item_getter(store.in_outs)
+        self._to_position = to_item_getter(store.positions)
+        self._to_result_in_out = to_item_getter(store.result_in_outs)
+        self._to_contour_id = to_item_getter(store.contours_ids)
+        self._to_order_key = store.to_order_key
+        self._sort_tied_events = partial(_sort_stored_events, store)
+        self._sweep_line_key = partial(StoredSweepLineKey, store)
+        self._to_segment_events = store.add_segment
+        self._is_queued_after = store.is_queued_after
+        self._set_position = partial(array.__setitem__, store.positions)
+
+    # events are indices, so they are compared by value
+    _are_same_events = staticmethod(eq)
+
+    def _to_prev_in_result_event(self, event: int) -> Optional[int]:
+        result = self._store.prev_in_result_events[event]
+        return None if result == NIL else result
+
+    def _set_edge_type(self, event: int, edge_type: EdgeType) -> None:
+        self._store.edges_types[event] = edge_type
+
+    def _set_result_fields(self, event: int, result_in_out: bool,
+                           contour_id: int) -> None:
+        store = self._store
+        store.result_in_outs[event] = result_in_out
+        store.contours_ids[event] = contour_id
+
+    def collect_events(self, events: List[int]) -> List[int]:
+        return collect_result_events(self, events)
+
+    def compute_fields(self, event: int, previous_event: Optional[int]
+                       ) -> None:
+        store = self._store
+        if previous_event is None:
+            store.in_outs[event] = False
+            store.other_in_outs[event] = True
+        else:
+            if (store.polygons_types[event]
+                    == store.polygons_types[previous_event]):
+                store.in_outs[event] = not store.in_outs[previous_event]
+                store.other_in_outs[event] = (
+                    store.other_in_outs[previous_event])
+            else:
+                store.in_outs[event] = not store.other_in_outs[previous_event]
+                store.other_in_outs[event] = (
+                    not store.in_outs[previous_event]
+                    if store.is_vertical(previous_event)
+                    else store.in_outs[previous_event])
+            store.prev_in_result_events[event] = (
+                store.prev_in_result_events[previous_event]
+                if (not self.in_result(previous_event)
+                    or store.is_vertical(previous_event))
+                else previous_event)
+        store.in_results[event] = self.in_result(event)
+
+    def divide_segment(self, event: int, point: Point) -> None:
+        store = self._store
+        other_event = store.others[event]
+        polygon_type = store.polygons_types[event]
+        left_event = store.add(True, point, other_event, polygon_type)
+        right_event = store.add(False, point, event, polygon_type)
+        if store.is_queued_after(left_event, other_event):
+            # avoid a rounding error,
+            # the left event would be processed after the right event
+            store.are_left[other_event] = True
+            self._events_queue.update(other_event)
+            store.are_left[left_event] = False
+        store.others[other_event] = left_event
+        store.others[event] = right_event
+        self._events_queue.push(left_event)
+        self._events_queue.push(right_event)
+
+    def in_result(self, event: int) -> bool:
+        store = self._store
+        return (self._in_result_table
+                [store.edges_types[event]]
+                [store.polygons_types[event]]
+                [store.other_in_outs[event]])
+
+    def release(self) -> None:
+        # queue entries refer to the store through comparison keys
+        del self._store.queue_entries[:]
+        self._bind(EventsStore())
+
+    @staticmethod
+    def _dismantle(events: List[int]) -> None:
+        # stored events are not linked to each other by references
+        pass
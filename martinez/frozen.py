@@ -0,0 +1,140 @@
+from typing import (Iterator,
+                    Optional,
+                    Sequence,
+                    Tuple)
+
+from reprit.base import generate_repr
+
+from .bounding_box import BoundingBox
+from .contour import Contour
+from .hints import Scalar
+from .point import Point
+from .polygon import Polygon
+
+
+class FrozenContour:
+    # immutable & hashable view of contour,
+    # underlying contour is never exposed, so its metadata is cached for good
+    __slots__ = '_contour', '_hash'
+
+    def __init__(self, points: Sequence[Point], holes: Sequence[int],
+                 is_external: bool) -> None:
+        self._contour = Contour(list(points), list(holes), is_external)
+        self._hash = None  # type: Optional[int]
+
+    __repr__ = generate_repr(__init__)
+
+    @classmethod
+    def from_contour(cls, contour: Contour) -> 'FrozenContour':
+        # takes snapshot of vertices, since the original's storage
+        # may be modified in place through its accessors
+        if contour.typecode is None:
+            return cls(contour, contour.holes, contour.is_external)
+        result = cls.__new__(cls)
+        result._contour = Contour.from_coordinates(contour.coordinates,
+                                                   contour.holes[:],
+                                                   contour.is_external,
+                                                   typecode=contour.typecode)
+        result._hash = None
+        return result
+
+    @property
+    def points(self) -> Tuple[Point, ...]:
+        return tuple(self._contour)
+
+    @property
+    def holes(self) -> Tuple[int, ...]:
+        return tuple(self._contour.holes)
+
+    @property
+    def is_external(self) -> bool:
+        return self._contour.is_external
+
+    @property
+    def vertices_count(self) -> int:
+        return self._contour.vertices_count
+
+    @property
+    def bounding_box(self) -> BoundingBox:
+        return self._contour.bounding_box
+
+    @property
+    def signed_area(self) -> Scalar:
+        return self._contour.signed_area
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(self._contour)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            contour = self._contour
+            self._hash = hash((tuple(contour.coordinates),
+                               tuple(contour.holes), contour.is_external))
+        return self._hash
+
+    def __eq__(self, other: 'FrozenContour') -> bool:
+        # differing fingerprints spare vertices comparison
+        return (self is other
+                or (hash(self) == hash(other)
+                    and self._contour == other._contour)
+                if isinstance(other, FrozenContour)
+                else NotImplemented)
+
+    def thaw(self) -> Contour:
+        return self._contour.with_holes(self._contour.holes[:])
+
+
+class FrozenPolygon:
+    __slots__ = '_contours', '_polygon', '_hash'
+
+    def __init__(self, contours: Sequence[FrozenContour]) -> None:
+        self._contours = tuple(contours)
+        self._polygon = Polygon([contour._contour
+                                 for contour in self._contours])
+        self._hash = None  # type: Optional[int]
+
+    __repr__ = generate_repr(__init__)
+
+    @classmethod
+    def from_polygon(cls, polygon: Polygon) -> 'FrozenPolygon':
+        return cls([FrozenContour.from_contour(contour)
+                    for contour in polygon.contours])
+
+    @property
+    def contours(self) -> Tuple[FrozenContour, ...]:
+        return self._contours
+
+    @property
+    def vertices_count(self) -> int:
+        return self._polygon.vertices_count
+
+    @property
+    def bounding_box(self) -> BoundingBox:
+        return self._polygon.bounding_box
+
+    @property
+    def area(self) -> Scalar:
+        return self._polygon.area
+
+    def __iter__(self) -> Iterator[FrozenContour]:
+        return iter(self._contours)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._contours)
+        return self._hash
+
+    def __eq__(self, other: 'FrozenPolygon') -> bool:
+        return (self is other
+                or (hash(self) == hash(other)
+                    and self._contours == other._contours)
+                if isinstance(other, FrozenPolygon)
+                else NotImplemented)
+
+    def thaw(self) -> Polygon:
+        # copy-on-write copy, so modifying it does not affect the original
+        return self._polygon.share()
+
+
+def freeze(polygon: Polygon) -> FrozenPolygon:
+    return FrozenPolygon.from_polygon(polygon)
@@ -0,0 +1,116 @@
+from typing import (Callable,
+                    Iterable,
+                    Iterator,
+                    Optional)
+
+from reprit.base import generate_repr
+
+from .boolean import (Operation,
+                      OperationType)
+from .bounding_box import BoundingBox
+from .contour import Contour
+from .hints import Scalar
+from .polygon import Polygon
+
+EMPTY_BOUNDING_BOX = BoundingBox(0, 0, 0, 0)
+
+
+class LazyOperation:
+    # defers operation run until resultant is accessed
+    __slots__ = '_operation', '_is_trivial', '_resultant'
+
+    def __init__(self, operation: Operation) -> None:
+        self._operation = operation
+        self._is_trivial = None  # type: Optional[bool]
+        self._resultant = None  # type: Optional[Polygon]
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def operation(self) -> Operation:
+        return self._operation
+
+    @property
+    def is_computed(self) -> bool:
+        return self._resultant is not None
+
+    @property
+    def is_trivial(self) -> bool:
+        # trivial resultant is known without running the sweep
+        if self._is_trivial is None:
+            self._is_trivial = self._operation.is_trivial
+            if self._is_trivial:
+                # run is cheap for trivial operation
+                # and finishes resultant (e.g. interns its vertices)
+                self._resultant = to_resultant(self._operation)
+        return self._is_trivial
+
+    @property
+    def extent(self) -> BoundingBox:
+        # bounding box which contains resultant's one,
+        # derived from operands' ones without running the sweep
+        left, right = self._operation.left, self._operation.right
+        type_ = self._operation.type
+        if type_ is OperationType.INTERSECTION:
+            if not (left.contours and right.contours):
+                return EMPTY_BOUNDING_BOX
+            left_bounding_box, right_bounding_box = (left.bounding_box,
+                                                     right.bounding_box)
+            x_min = max(left_bounding_box.x_min, right_bounding_box.x_min)
+            y_min = max(left_bounding_box.y_min, right_bounding_box.y_min)
+            x_max = min(left_bounding_box.x_max, right_bounding_box.x_max)
+            y_max = min(left_bounding_box.y_max, right_bounding_box.y_max)
+            return (BoundingBox(x_min, y_min, x_max, y_max)
+                    if x_min <= x_max and y_min <= y_max
+                    else EMPTY_BOUNDING_BOX)
+        elif type_ is OperationType.DIFFERENCE or not right.contours:
+            return left.bounding_box
+        elif not left.contours:
+            return right.bounding_box
+        else:
+            return left.bounding_box + right.bounding_box
+
+    @property
+    def resultant(self) -> Polygon:
+        self.prefetch()
+        return self._resultant
+
+    @property
+    def bounding_box(self) -> BoundingBox:
+        return self.resultant.bounding_box
+
+    @property
+    def area(self) -> Scalar:
+        return self.resultant.area
+
+    def __iter__(self) -> Iterator[Contour]:
+        return iter(self.resultant)
+
+    def prefetch(self) -> None:
+        if self._resultant is None and not self.is_trivial:
+            self._resultant = to_resultant(self._operation)
+
+
+def prefetch(operations: Iterable[LazyOperation],
+             map_: Callable[[Callable[[Operation], Polygon],
+                             Iterable[Operation]],
+                            Iterable[Polygon]] = map) -> None:
+    # computes resultants of pending operations together,
+    # ``map_`` can be a worker pool's one, e.g. ``Executor.map``,
+    # then operations run on copies & get resultants back,
+    # which are interned into the original vertex tables
+    pending = [operation
+               for operation in operations
+               if not operation.is_computed and not operation.is_trivial]
+    for operation, resultant in zip(pending,
+                                    map_(to_resultant,
+                                         [operation.operation
+                                          for operation in pending])):
+        if not operation.operation._already_run:
+            operation.operation._adopt(resultant)
+        operation._resultant = operation.operation.resultant
+
+
+def to_resultant(operation: Operation) -> Polygon:
+    operation.run()
+    return operation.resultant
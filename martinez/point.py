@@ -20,6 +20,9 @@ class Point:
                 if isinstance(other, Point)
                 else NotImplemented)
 
+    def __hash__(self) -> int:
+        return hash((self._x, self._y))
+
     @property
     def bounding_box(self) -> BoundingBox:
         return BoundingBox(self._x, self._y, self._x, self._y)
@@ -7,6 +7,7 @@ from reprit.base import generate_repr
 
 from .bounding_box import BoundingBox
 from .contour import Contour
+from .hints import Scalar
 
 
 class Polygon:
@@ -31,16 +32,39 @@ class Polygon:
 
     @property
     def bounding_box(self) -> BoundingBox:
-        if self._contours:
-            return reduce(add, [contour.bounding_box
-                                for contour in self._contours])
-        else:
-            return BoundingBox(0, 0, 0, 0)
+        # metadata is not cached on polygon,
+        # since its contours may be modified directly,
+        # but is derived from the ones cached on contours
+        return (reduce(add, [contour.bounding_box
+                             for contour in self._contours])
+                if self._contours
+                else BoundingBox(0, 0, 0, 0))
+
+    @property
+    def area(self) -> Scalar:
+        # holes' areas are subtracted from externals' ones,
+        # empty contours are skipped since their scalar type is unknown
+        return sum(abs(contour.signed_area)
+                   if contour.is_external
+                   else -abs(contour.signed_area)
+                   for contour in self._contours
+                   if contour.vertices_count)
+
+    @property
+    def vertices_count(self) -> int:
+        return sum(contour.vertices_count for contour in self._contours)
+
+    def add(self, contour: Contour) -> None:
+        self._contours.append(contour)
+
+    def share(self) -> 'Polygon':
+        # copy which shares contours' vertices storage with the original
+        # until any of them is modified
+        return Polygon([contour.with_holes(contour.holes[:])
+                        for contour in self._contours])
 
     def join(self, other: 'Polygon') -> None:
         contours_count = len(self._contours)
-        self._contours.extend(Contour(contour.points,
-                                      [hole + contours_count
-                                       for hole in contour.holes],
-                                      contour.is_external)
+        self._contours.extend(contour.with_holes([hole + contours_count
+                                                  for hole in contour.holes])
                               for contour in other._contours)
@@ -0,0 +1,255 @@
+from typing import (Any,
+                    Callable,
+                    Iterator,
+                    Optional,
+                    TypeVar)
+
+from reprit.base import generate_repr
+
+Domain = TypeVar('Domain')
+
+
+class SweepLineNode:
+    __slots__ = ('value', 'key', 'parent', 'left', 'right', 'is_black',
+                 'predecessor', 'successor')
+
+    def __init__(self, value: Domain, key: Any) -> None:
+        self.value = value
+        self.key = key
+        self.parent = self.left = self.right = None
+        self.is_black = False
+        self.predecessor = self.successor = None
+
+    __repr__ = generate_repr(__init__)
+
+
+class SweepLine:
+    # red-black tree threaded with predecessor/successor links,
+    # so neighbours of nodes returned by ``add`` & ``find``
+    # are looked up & removed without keys comparisons
+    __slots__ = '_key', '_root', '_size'
+
+    def __init__(self, key: Callable[[Domain], Any]) -> None:
+        self._key = key
+        self._root = None
+        self._size = 0
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def key(self) -> Callable[[Domain], Any]:
+        return self._key
+
+    def __iter__(self) -> Iterator[Domain]:
+        node = self._root
+        if node is None:
+            return
+        while node.left is not None:
+            node = node.left
+        while node is not None:
+            yield node.value
+            node = node.successor
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, value: Domain) -> SweepLineNode:
+        # returns node of equivalent value if there is one
+        key = self._key(value)
+        parent = self._root
+        if parent is None:
+            node = self._root = SweepLineNode(value, key)
+            node.is_black = True
+            self._size = 1
+            return node
+        while True:
+            if key < parent.key:
+                if parent.left is None:
+                    node = parent.left = SweepLineNode(value, key)
+                    node.predecessor, node.successor = (parent.predecessor,
+                                                        parent)
+                    break
+                parent = parent.left
+            elif parent.key < key:
+                if parent.right is None:
+                    node = parent.right = SweepLineNode(value, key)
+                    node.predecessor, node.successor = (parent,
+                                                        parent.successor)
+                    break
+                parent = parent.right
+            else:
+                return parent
+        node.parent = parent
+        if node.predecessor is not None:
+            node.predecessor.successor = node
+        if node.successor is not None:
+            node.successor.predecessor = node
+        self._size += 1
+        self._restore(node)
+        return node
+
+    def find(self, value: Domain) -> Optional[SweepLineNode]:
+        # looks up node of equivalent value by keys comparisons
+        key = self._key(value)
+        node = self._root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                break
+        return node
+
+    def clear(self) -> None:
+        # unlinks nodes, so they do not form reference cycles
+        # and get freed as soon as handles are dropped
+        nodes = [] if self._root is None else [self._root]
+        while nodes:
+            node = nodes.pop()
+            if node.left is not None:
+                nodes.append(node.left)
+            if node.right is not None:
+                nodes.append(node.right)
+            node.parent = node.left = node.right = None
+            node.predecessor = node.successor = None
+        self._root = None
+        self._size = 0
+
+    def remove(self, node: SweepLineNode) -> None:
+        if node.predecessor is not None:
+            node.predecessor.successor = node.successor
+        if node.successor is not None:
+            node.successor.predecessor = node.predecessor
+        is_removed_black = node.is_black
+        if node.left is None:
+            child, child_parent = node.right, node.parent
+            self._transplant(node, child)
+        elif node.right is None:
+            child, child_parent = node.left, node.parent
+            self._transplant(node, child)
+        else:
+            # leftmost node of the right subtree
+            replacement = node.successor
+            is_removed_black = replacement.is_black
+            child = replacement.right
+            if replacement.parent is node:
+                child_parent = replacement
+            else:
+                child_parent = replacement.parent
+                self._transplant(replacement, child)
+                replacement.right = node.right
+                replacement.right.parent = replacement
+            self._transplant(node, replacement)
+            replacement.left = node.left
+            replacement.left.parent = replacement
+            replacement.is_black = node.is_black
+        if is_removed_black:
+            self._remove_fixup(child, child_parent)
+        node.parent = node.left = node.right = None
+        node.predecessor = node.successor = None
+        self._size -= 1
+
+    def _restore(self, node: SweepLineNode) -> None:
+        while node.parent is not None and not node.parent.is_black:
+            parent = node.parent
+            grandparent = parent.parent
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if uncle is None or uncle.is_black:
+                    if node is parent.right:
+                        self._rotate_left(parent)
+                        node, parent = parent, node
+                    parent.is_black, grandparent.is_black = True, False
+                    self._rotate_right(grandparent)
+                else:
+                    parent.is_black = uncle.is_black = True
+                    grandparent.is_black = False
+                    node = grandparent
+            else:
+                uncle = grandparent.left
+                if uncle is None or uncle.is_black:
+                    if node is parent.left:
+                        self._rotate_right(parent)
+                        node, parent = parent, node
+                    parent.is_black, grandparent.is_black = True, False
+                    self._rotate_left(grandparent)
+                else:
+                    parent.is_black = uncle.is_black = True
+                    grandparent.is_black = False
+                    node = grandparent
+        self._root.is_black = True
+
+    def _remove_fixup(self, node: Optional[SweepLineNode],
+                      parent: Optional[SweepLineNode]) -> None:
+        while node is not self._root and (node is None or node.is_black):
+            if node is parent.left:
+                sibling = parent.right
+                if not sibling.is_black:
+                    sibling.is_black, parent.is_black = True, False
+                    self._rotate_left(parent)
+                    sibling = parent.right
+                if ((sibling.left is None or sibling.left.is_black)
+                        and (sibling.right is None or sibling.right.is_black)):
+                    sibling.is_black = False
+                    node, parent = parent, parent.parent
+                else:
+                    if sibling.right is None or sibling.right.is_black:
+                        sibling.left.is_black, sibling.is_black = True, False
+                        self._rotate_right(sibling)
+                        sibling = parent.right
+                    sibling.is_black, parent.is_black = parent.is_black, True
+                    if sibling.right is not None:
+                        sibling.right.is_black = True
+                    self._rotate_left(parent)
+                    node = self._root
+            else:
+                sibling = parent.left
+                if not sibling.is_black:
+                    sibling.is_black, parent.is_black = True, False
+                    self._rotate_right(parent)
+                    sibling = parent.left
+                if ((sibling.left is None or sibling.left.is_black)
+                        and (sibling.right is None or sibling.right.is_black)):
+                    sibling.is_black = False
+                    node, parent = parent, parent.parent
+                else:
+                    if sibling.left is None or sibling.left.is_black:
+                        sibling.right.is_black, sibling.is_black = True, False
+                        self._rotate_left(sibling)
+                        sibling = parent.left
+                    sibling.is_black, parent.is_black = parent.is_black, True
+                    if sibling.left is not None:
+                        sibling.left.is_black = True
+                    self._rotate_right(parent)
+                    node = self._root
+        if node is not None:
+            node.is_black = True
+
+    def _rotate_left(self, node: SweepLineNode) -> None:
+        replacement = node.right
+        self._transplant(node, replacement)
+        node.right = replacement.left
+        if node.right is not None:
+            node.right.parent = node
+        replacement.left, node.parent = node, replacement
+
+    def _rotate_right(self, node: SweepLineNode) -> None:
+        replacement = node.left
+        self._transplant(node, replacement)
+        node.left = replacement.right
+        if node.left is not None:
+            node.left.parent = node
+        replacement.right, node.parent = node, replacement
+
+    def _transplant(self, origin: SweepLineNode,
+                    replacement: Optional[SweepLineNode]) -> None:
+        parent = origin.parent
+        if parent is None:
+            self._root = replacement
+        elif origin is parent.left:
+            parent.left = replacement
+        else:
+            parent.right = replacement
+        if replacement is not None:
+            replacement.parent = parent
@@ -1,12 +1,21 @@
+import gc
 import math
-from typing import (Optional,
+import threading
+from contextlib import contextmanager
+from typing import (Generator,
+                    Iterator,
+                    List,
+                    Optional,
                     Sequence,
-                    Tuple)
+                    Tuple,
+                    TypeVar)
 
 from .hints import Scalar
 from .point import Point
 from .segment import Segment
 
+Domain = TypeVar('Domain')
+
 
 def sign(first_point: Point, second_point: Point, third_point: Point) -> int:
     determinant = ((first_point.x - third_point.x)
@@ -120,6 +129,189 @@ def find_intersections(first_segment: Segment, second_segment: Segment,
             second_intersection_point)
 
 
+def find_intersections_by_endpoints(first_source: Point,
+                                    first_target: Point,
+                                    second_source: Point,
+                                    second_target: Point,
+                                    *,
+                                    threshold: float = 1e-8,
+                                    squared_inv_epsilon: int = 10 ** 7
+                                    ) -> Tuple[int, Optional[Point],
+                                               Optional[Point]]:
+    # same as ``find_intersections``, but works on raw coordinates
+    # and rejects segments with distant bounding boxes beforehand
+    first_source_x, first_source_y = first_source.x, first_source.y
+    first_target_x, first_target_y = first_target.x, first_target.y
+    second_source_x, second_source_y = second_source.x, second_source.y
+    second_target_x, second_target_y = second_target.x, second_target.y
+    first_vector_x = first_target_x - first_source_x
+    first_vector_y = first_target_y - first_source_y
+    second_vector_x = second_target_x - second_source_x
+    second_vector_y = second_target_y - second_source_y
+    if first_vector_x or first_vector_y:
+        # near-parallel segments are checked for overlap
+        # with tolerance relative to their lengths,
+        # so bounding boxes gap should exceed it
+        # (degenerate first segment is always reported as intersecting)
+        first_x_min, first_x_max = ((first_source_x, first_target_x)
+                                    if first_vector_x > 0
+                                    else (first_target_x, first_source_x))
+        first_y_min, first_y_max = ((first_source_y, first_target_y)
+                                    if first_vector_y > 0
+                                    else (first_target_y, first_source_y))
+        second_x_min, second_x_max = ((second_source_x, second_target_x)
+                                      if second_vector_x > 0
+                                      else (second_target_x, second_source_x))
+        second_y_min, second_y_max = ((second_source_y, second_target_y)
+                                      if second_vector_y > 0
+                                      else (second_target_y, second_source_y))
+        margin = (first_x_max - first_x_min + first_y_max - first_y_min
+                  + second_x_max - second_x_min
+                  + second_y_max - second_y_min) / 1000
+        if (second_x_min - first_x_max > margin
+                or first_x_min - second_x_max > margin
+                or second_y_min - first_y_max > margin
+                or first_y_min - second_y_max > margin):
+            return 0, None, None
+    e_x = second_source_x - first_source_x
+    e_y = second_source_y - first_source_y
+    cross_product = (first_vector_x * second_vector_y
+                     - first_vector_y * second_vector_x)
+    squared_cross_product = cross_product * cross_product
+    first_squared_length = (first_vector_x * first_vector_x
+                            + first_vector_y * first_vector_y)
+    second_squared_length = (second_vector_x * second_vector_x
+                             + second_vector_y * second_vector_y)
+    if squared_cross_product > (first_squared_length * second_squared_length
+                                / squared_inv_epsilon):
+        s = (e_x * second_vector_y - e_y * second_vector_x) / cross_product
+        if (s < 0) or (s > 1):
+            return 0, None, None
+        t = (e_x * first_vector_y - e_y * first_vector_x) / cross_product
+        if (t < 0) or (t > 1):
+            return 0, None, None
+        return (1,
+                _snap(first_source_x + s * first_vector_x,
+                      first_source_y + s * first_vector_y,
+                      first_source, first_target, second_source,
+                      second_target, threshold),
+                None)
+    e_squared_length = e_x * e_x + e_y * e_y
+    cross_product = e_x * first_vector_y - e_y * first_vector_x
+    squared_cross_product = cross_product * cross_product
+    if squared_cross_product > (first_squared_length * e_squared_length
+                                / squared_inv_epsilon):
+        return 0, None, None
+    s0 = first_vector_x * e_x + first_vector_y * e_y
+    try:
+        s0 /= first_squared_length
+    except ArithmeticError:
+        s0 = s1 = math.nan
+    else:
+        s1 = s0 + (first_vector_x * second_vector_x
+                   + first_vector_y * second_vector_y) / first_squared_length
+    s_min, s_max = min(s0, s1), max(s0, s1)
+    (intersections_count, first_coefficient,
+     second_coefficient) = _find_intersections(0, 1, s_min, s_max)
+    if not intersections_count:
+        return 0, None, None
+    first_intersection_point = _snap(
+            first_source_x + first_coefficient * first_vector_x,
+            first_source_y + first_coefficient * first_vector_y,
+            first_source, first_target, second_source, second_target,
+            threshold)
+    second_intersection_point = (
+        Point(first_source_x + second_coefficient * first_vector_x,
+              first_source_y + second_coefficient * first_vector_y)
+        if intersections_count > 1
+        else None)
+    return (intersections_count, first_intersection_point,
+            second_intersection_point)
+
+
+def _snap(x: Scalar, y: Scalar,
+          first_source: Point, first_target: Point,
+          second_source: Point, second_target: Point,
+          threshold: float) -> Point:
+    squared_threshold = threshold * threshold
+    for endpoint in (first_source, first_target, second_source,
+                     second_target):
+        delta_x, delta_y = x - endpoint.x, y - endpoint.y
+        squared_distance = delta_x * delta_x + delta_y * delta_y
+        if squared_distance < squared_threshold / 4:
+            return endpoint
+        elif (squared_distance < 4 * squared_threshold
+              # borderline case, fall back to ``Point.distance_to``
+              and math.sqrt(delta_x ** 2 + delta_y ** 2) < threshold):
+            return endpoint
+    return Point(x, y)
+
+
 def to_segments(vertices: Sequence[Point]) -> Sequence[Segment]:
     return [Segment(vertices[index], vertices[(index + 1) % len(vertices)])
             for index in range(len(vertices))]
+
+
+def to_monotone_chains(vertices: Sequence[Point]) -> List[List[Segment]]:
+    # splits contour into chains of consecutive segments
+    # with strictly increasing (in lexicographical order) left endpoints,
+    # hence x-monotone
+    result = []
+    chain, is_forward = [], None
+    for segment in to_segments(vertices):
+        source, target = segment.source, segment.target
+        if source == target:
+            result.append([segment])
+            continue
+        is_segment_forward = (source.x < target.x
+                              or source.x == target.x and source.y < target.y)
+        if chain and is_segment_forward is is_forward:
+            chain.append(segment)
+            continue
+        if chain:
+            result.append(chain if is_forward else chain[::-1])
+        chain, is_forward = [segment], is_segment_forward
+    if chain:
+        result.append(chain if is_forward else chain[::-1])
+    return result
+
+
+_gc_lock = threading.Lock()
+_gc_suspensions_count = 0
+_was_gc_enabled = False
+
+
+@contextmanager
+def suspended_gc() -> Iterator[None]:
+    # disables cyclic garbage collector,
+    # it gets back to its previous state
+    # when the last of nested/concurrent suspensions ends
+    global _gc_suspensions_count, _was_gc_enabled
+    with _gc_lock:
+        if not _gc_suspensions_count:
+            _was_gc_enabled = gc.isenabled()
+            gc.disable()
+        _gc_suspensions_count += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_suspensions_count -= 1
+            if not _gc_suspensions_count and _was_gc_enabled:
+                gc.enable()
+
+
+def with_suspended_gc(iterator: Generator[Domain, None, None]
+                      ) -> Iterator[Domain]:
+    # advances iterator with suspended cyclic garbage collector,
+    # consumer's code between the steps runs with collector as it was
+    try:
+        while True:
+            with suspended_gc():
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        iterator.close()
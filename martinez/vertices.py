@@ -0,0 +1,69 @@
+from typing import (Dict,
+                    List,
+                    Tuple)
+
+from reprit.base import generate_repr
+
+from .contour import Contour
+from .hints import Scalar
+from .point import Point
+from .polygon import Polygon
+
+
+class VertexTable:
+    # maps equal coordinates to single shared point,
+    # can be shared by several operations,
+    # so neighbouring results reference the same vertices
+    __slots__ = '_vertices', '_indices'
+
+    def __init__(self) -> None:
+        self._vertices = []  # type: List[Point]
+        self._indices = {}  # type: Dict[Tuple[Scalar, Scalar], int]
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def vertices(self) -> List[Point]:
+        return self._vertices
+
+    def __len__(self) -> int:
+        return len(self._vertices)
+
+    def intern(self, point: Point) -> int:
+        key = point.x, point.y
+        try:
+            return self._indices[key]
+        except KeyError:
+            result = self._indices[key] = len(self._vertices)
+            self._vertices.append(point)
+            return result
+
+    def intern_contour(self, contour: Contour) -> Tuple[Contour, List[int]]:
+        # returns contour referencing interned vertices with their indices,
+        # array-backed contours are returned as they are
+        indices = self._indices
+        vertices = self._vertices
+        result = []
+        for point in contour:
+            key = point.x, point.y
+            try:
+                index = indices[key]
+            except KeyError:
+                index = indices[key] = len(vertices)
+                vertices.append(point)
+            result.append(index)
+        if contour.typecode is not None:
+            return contour, result
+        interned = Contour([vertices[index] for index in result],
+                           contour.holes, contour.is_external)
+        return interned, result
+
+    def intern_polygon(self, polygon: Polygon) -> List[List[int]]:
+        # replaces contours of the polygon with interned ones,
+        # so it should own them
+        contours = polygon.contours
+        result = []
+        for index, contour in enumerate(contours):
+            contours[index], contour_indices = self.intern_contour(contour)
+            result.append(contour_indices)
+        return result
@@ -15,7 +15,8 @@ def read_file(path_string: str) -> str:
 
 parameters = dict(
         name=martinez.__name__,
-        packages=find_packages(exclude=('tests', 'tests.*')),
+        packages=find_packages(exclude=('benchmarks', 'benchmarks.*',
+                                         'tests', 'tests.*')),
         version=martinez.__version__,
         description=martinez.__doc__,
         long_description=read_file('README.md'),
@@ -9,6 +9,7 @@ from martinez.boolean import (OperationType as PortedOperationType,
                               Polygon as PortedPolygon,
                               compute as ported)
 from tests.integration_tests.utils import are_bound_ported_polygons_equal
+from tests.port_tests.utils import to_packed_ported_polygon
 from . import strategies
 
 
@@ -25,3 +26,74 @@ def test_basic(polygons_pairs_pair: Tuple[Tuple[BoundPolygon, PortedPolygon],
     ported_result = ported(ported_left, ported_right, ported_operation_type)
 
     assert are_bound_ported_polygons_equal(bound_result, ported_result)
+
+
+@given(strategies.polygons_pairs_pairs, strategies.operations_types_pairs)
+def test_monotone_chains(polygons_pairs_pair: Tuple[Tuple[BoundPolygon,
+                                                          PortedPolygon],
+                                                    Tuple[BoundPolygon,
+                                                          PortedPolygon]],
+                         operations_types_pair: Tuple[BoundOperationType,
+                                                      PortedOperationType]
+                         ) -> None:
+    ((bound_left, ported_left),
+     (bound_right, ported_right)) = polygons_pairs_pair
+    bound_operation_type, ported_operation_type = operations_types_pair
+
+    bound_result = bound(bound_left, bound_right, bound_operation_type)
+    ported_result = ported(ported_left, ported_right, ported_operation_type,
+                           monotone_chains=True)
+
+    assert are_bound_ported_polygons_equal(bound_result, ported_result)
+
+
+@given(strategies.polygons_pairs_pairs, strategies.operations_types_pairs)
+def test_prefilter(polygons_pairs_pair: Tuple[Tuple[BoundPolygon,
+                                                    PortedPolygon],
+                                              Tuple[BoundPolygon,
+                                                    PortedPolygon]],
+                   operations_types_pair: Tuple[BoundOperationType,
+                                                PortedOperationType]) -> None:
+    ((bound_left, ported_left),
+     (bound_right, ported_right)) = polygons_pairs_pair
+    bound_operation_type, ported_operation_type = operations_types_pair
+
+    bound_result = bound(bound_left, bound_right, bound_operation_type)
+    ported_result = ported(ported_left, ported_right, ported_operation_type,
+                           prefilter=True)
+
+    assert are_bound_ported_polygons_equal(bound_result, ported_result)
+
+
+@given(strategies.polygons_pairs_pairs, strategies.operations_types_pairs)
+def test_simple(polygons_pairs_pair: Tuple[Tuple[BoundPolygon, PortedPolygon],
+                                           Tuple[BoundPolygon, PortedPolygon]],
+                operations_types_pair: Tuple[BoundOperationType,
+                                             PortedOperationType]) -> None:
+    ((bound_left, ported_left),
+     (bound_right, ported_right)) = polygons_pairs_pair
+    bound_operation_type, ported_operation_type = operations_types_pair
+
+    bound_result = bound(bound_left, bound_right, bound_operation_type)
+    ported_result = ported(ported_left, ported_right, ported_operation_type,
+                           simple=True)
+
+    assert are_bound_ported_polygons_equal(bound_result, ported_result)
+
+
+@given(strategies.polygons_pairs_pairs, strategies.operations_types_pairs)
+def test_packed(polygons_pairs_pair: Tuple[Tuple[BoundPolygon, PortedPolygon],
+                                           Tuple[BoundPolygon, PortedPolygon]],
+                operations_types_pair: Tuple[BoundOperationType,
+                                             PortedOperationType]) -> None:
+    ((bound_left, ported_left),
+     (bound_right, ported_right)) = polygons_pairs_pair
+    bound_operation_type, ported_operation_type = operations_types_pair
+
+    bound_result = bound(bound_left, bound_right, bound_operation_type)
+    ported_result = ported(to_packed_ported_polygon(ported_left),
+                           to_packed_ported_polygon(ported_right),
+                           ported_operation_type,
+                           typecode='d')
+
+    assert are_bound_ported_polygons_equal(bound_result, ported_result)
@@ -27,7 +27,6 @@ from tests.strategies import (booleans,
                               single_precision_floats as floats)
 from tests.utils import (MAX_CONTOURS_COUNT,
                          MAX_NESTING_DEPTH,
-                         Strategy,
                          are_sweep_events_pair_with_different_polygon_types,
                          to_double_nested_sweep_event,
                          to_pairs,
@@ -60,26 +59,6 @@ def to_double_nested_sweep_events_pair(events_pair: Tuple[BoundSweepEvent,
 double_nested_sweep_events_pairs = (nested_sweep_events_pairs
                                     .map(to_double_nested_sweep_events_pair))
 maybe_nested_sweep_events_pairs = nones_pairs | nested_sweep_events_pairs
-non_empty_sweep_events_lists_pairs = (strategies.lists(sweep_events_pairs,
-                                                       min_size=1)
-                                      .map(transpose))
-
-
-def to_sweep_events_lists_pairs_with_indices_and_booleans_lists(
-        events_pairs: Tuple[List[BoundSweepEvent], List[PortedSweepEvent]]
-) -> Strategy[Tuple[List[BoundSweepEvent], List[PortedSweepEvent],
-                    int, List[bool]]]:
-    events_count = len(events_pairs[0])
-    return strategies.tuples(strategies.just(events_pairs),
-                             strategies.integers(0, events_count - 1),
-                             strategies.lists(booleans,
-                                              min_size=events_count,
-                                              max_size=events_count))
-
-
-non_empty_sweep_events_lists_pairs_with_indices_and_booleans_lists = (
-    non_empty_sweep_events_lists_pairs.flatmap(
-            to_sweep_events_lists_pairs_with_indices_and_booleans_lists))
 nested_sweep_events_lists_pairs = (strategies.lists(nested_sweep_events_pairs)
                                    .map(transpose))
 nested_sweep_events_pairs_pairs = (to_pairs(nested_sweep_events_pairs)
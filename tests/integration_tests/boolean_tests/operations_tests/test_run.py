@@ -2,9 +2,17 @@ from typing import Tuple
 
 from hypothesis import given
 
-from tests.bind_tests.hints import BoundOperation
+from tests.bind_tests.hints import (BoundOperation,
+                                    BoundOperationType)
+from tests.integration_tests.factories import (
+    to_bound_with_ported_contours_pair,
+    to_bound_with_ported_points_pair,
+    to_bound_with_ported_polygons_pair)
 from tests.integration_tests.utils import are_bound_ported_polygons_equal
-from tests.port_tests.hints import PortedOperation
+from tests.port_tests.hints import (PortedOperation,
+                                    PortedOperationType,
+                                    PortedStoredOperation)
+from tests.utils import transpose
 from . import strategies
 
 
@@ -17,3 +25,80 @@ def test_basic(operations_pair: Tuple[BoundOperation, PortedOperation]
     ported.run()
 
     assert are_bound_ported_polygons_equal(bound.resultant, ported.resultant)
+
+
+@given(strategies.operations_pairs)
+def test_monotone_chains(operations_pair: Tuple[BoundOperation,
+                                                PortedOperation]) -> None:
+    bound, ported = operations_pair
+    ported = PortedOperation(ported.left, ported.right, ported.type,
+                             monotone_chains=True)
+
+    bound.run()
+    ported.run()
+
+    assert are_bound_ported_polygons_equal(bound.resultant, ported.resultant)
+
+
+@given(strategies.operations_pairs)
+def test_prefilter(operations_pair: Tuple[BoundOperation, PortedOperation]
+                   ) -> None:
+    bound, ported = operations_pair
+    ported = PortedOperation(ported.left, ported.right, ported.type,
+                             prefilter=True)
+
+    bound.run()
+    ported.run()
+
+    assert are_bound_ported_polygons_equal(bound.resultant, ported.resultant)
+
+
+@given(strategies.operations_pairs)
+def test_simple(operations_pair: Tuple[BoundOperation, PortedOperation]
+                ) -> None:
+    bound, ported = operations_pair
+    ported = PortedOperation(ported.left, ported.right, ported.type,
+                             simple=True)
+
+    bound.run()
+    ported.run()
+
+    assert are_bound_ported_polygons_equal(bound.resultant, ported.resultant)
+
+
+@given(strategies.operations_pairs)
+def test_stored(operations_pair: Tuple[BoundOperation, PortedOperation]
+                ) -> None:
+    bound, ported = operations_pair
+    ported = PortedStoredOperation(ported.left, ported.right, ported.type)
+
+    bound.run()
+    ported.run()
+
+    assert are_bound_ported_polygons_equal(bound.resultant, ported.resultant)
+
+
+def test_overlapping_contours() -> None:
+    # right endpoints of segments which got out of order after division
+    # are not found in sweep line & their segments are kept there
+    first_contours_pair, second_contours_pair = (
+        to_bound_with_ported_contours_pair(
+                transpose([to_bound_with_ported_points_pair(x, y)
+                           for x, y in vertices]),
+                [], True)
+        for vertices in ([(-140., -139.78996), (0., -139.78996),
+                          (0., 0.21004), (-140., 0.21004)],
+                         [(-139.5, -139.804688), (0.5, -139.804688),
+                          (0.5, 0.195312), (-139.5, 0.195312)]))
+    bound_left, ported_left = to_bound_with_ported_polygons_pair(
+            transpose([first_contours_pair, second_contours_pair]))
+    bound_right, ported_right = to_bound_with_ported_polygons_pair(
+            transpose([second_contours_pair]))
+    bound = BoundOperation(bound_left, bound_right, BoundOperationType.XOR)
+    ported = PortedOperation(ported_left, ported_right,
+                             PortedOperationType.XOR)
+
+    bound.run()
+    ported.run()
+
+    assert are_bound_ported_polygons_equal(bound.resultant, ported.resultant)
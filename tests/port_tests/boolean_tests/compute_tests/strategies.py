@@ -1,11 +1,17 @@
 from functools import partial
+from operator import (add,
+                      lt)
+from typing import Tuple
 
 from hypothesis import strategies
 
 from tests.port_tests.factories import scalars_to_ported_polygons
-from tests.port_tests.hints import PortedPolygon
+from tests.port_tests.hints import (PortedContour,
+                                    PortedPoint,
+                                    PortedPolygon)
 from tests.port_tests.utils import (ported_operations_types,
-                                    to_non_overlapping_ported_polygons_pair)
+                                    to_non_overlapping_ported_polygons_pair,
+                                    to_ported_rectangle)
 from tests.strategies import scalars_strategies
 from tests.utils import (identity,
                          pack,
@@ -23,3 +29,86 @@ polygons_pairs = (strategies.tuples(empty_polygons, non_empty_polygons) |
                   non_empty_polygons_strategies
                   .flatmap(to_pairs)
                   .map(pack(to_non_overlapping_ported_polygons_pair)))
+sizes = strategies.integers(1, 100)
+
+NESTING_SIZE = 10
+
+
+def to_nested_non_convex_polygons_pair(notch: Tuple[int, int, int],
+                                       inner: Tuple[int, int, int, int],
+                                       clip: Tuple[int, int, int, int],
+                                       is_clockwise: bool,
+                                       is_hole: bool
+                                       ) -> Tuple[PortedPolygon,
+                                                  PortedPolygon]:
+    # U-shaped contour with a rectangle inside of its bounding box
+    # and a separate square, so clipping rectangle may interact
+    # with any of them, coordinates of the nested rectangle are halves,
+    # so edges of the same polygon cross, but do not overlap
+    notch_x_min, notch_x_max, notch_y = notch
+    u_shape = PortedContour(
+            [PortedPoint(x, y)
+             for x, y in [(0, 0), (NESTING_SIZE, 0),
+                          (NESTING_SIZE, NESTING_SIZE),
+                          (notch_x_max, NESTING_SIZE),
+                          (notch_x_max, notch_y), (notch_x_min, notch_y),
+                          (notch_x_min, NESTING_SIZE), (0, NESTING_SIZE)]],
+            [1] if is_hole else [], True)
+    if is_clockwise:
+        u_shape.reverse()
+    inner_x_min, inner_x_max, inner_y_min, inner_y_max = inner
+    inner_contour = PortedContour(
+            to_ported_rectangle((inner_x_min + 0.5, inner_x_max + 0.5),
+                                (inner_y_min + 0.5, inner_y_max + 0.5)),
+            [], not is_hole)
+    clip_x_min, clip_x_max, clip_y_min, clip_y_max = clip
+    square = PortedContour(to_ported_rectangle((2 * NESTING_SIZE,
+                                                2 * NESTING_SIZE + 2),
+                                               (0, 2)),
+                           [], True)
+    return (PortedPolygon([u_shape, inner_contour, square]),
+            PortedPolygon([PortedContour(
+                    to_ported_rectangle((clip_x_min, clip_x_max),
+                                        (clip_y_min, clip_y_max)),
+                    [], True)]))
+
+
+nesting_coordinates = strategies.integers(1, NESTING_SIZE - 2)
+nesting_intervals = (strategies.tuples(nesting_coordinates,
+                                       nesting_coordinates)
+                     .filter(pack(lt)))
+notches = strategies.builds(add, nesting_intervals,
+                            strategies.tuples(nesting_coordinates))
+inner_rectangles = strategies.builds(add, nesting_intervals, nesting_intervals)
+clip_coordinates = strategies.integers(-NESTING_SIZE, 3 * NESTING_SIZE)
+clip_rectangles = strategies.builds(add,
+                                    strategies.tuples(clip_coordinates,
+                                                      clip_coordinates)
+                                    .filter(pack(lt)),
+                                    strategies.tuples(clip_coordinates,
+                                                      clip_coordinates)
+                                    .filter(pack(lt)))
+nested_non_convex_polygons_pairs = strategies.builds(
+        to_nested_non_convex_polygons_pair, notches, inner_rectangles,
+        clip_rectangles, strategies.booleans(), strategies.booleans())
+
+
+def to_stacked_polygons_pair(x_offset: int, y_offset: int
+                             ) -> Tuple[PortedPolygon, PortedPolygon]:
+    # triangle overlapping clipping rectangle
+    # and a rectangle right above them,
+    # which does not interact with either one,
+    # but sweep joins it to their union
+    def to_contour(*coordinates: Tuple[int, int]) -> PortedContour:
+        return PortedContour([PortedPoint(x + x_offset, y + y_offset)
+                              for x, y in coordinates],
+                             [], True)
+
+    return (PortedPolygon([to_contour((3, 7), (5, 1), (2, 1)),
+                           to_contour((4, 11), (7, 11), (7, 13), (4, 13))]),
+            PortedPolygon([to_contour((4, 2), (7, 2), (7, 4), (4, 4))]))
+
+
+stacking_offsets = strategies.integers(-100, 100)
+stacked_polygons_pairs = strategies.builds(to_stacked_polygons_pair,
+                                           stacking_offsets, stacking_offsets)
@@ -1,10 +1,15 @@
+import copy
 from typing import Tuple
 
 from hypothesis import given
 
 from martinez.boolean import compute
-from tests.port_tests.hints import (PortedOperationType,
-                                    PortedPolygon)
+from tests.port_tests.hints import (PortedContour,
+                                    PortedOperationType,
+                                    PortedPoint,
+                                    PortedPolygon,
+                                    PortedVertexTable)
+from tests.port_tests.utils import to_ported_rectangle
 from . import strategies
 
 
@@ -16,3 +21,147 @@ def test_basic(polygons: Tuple[PortedPolygon, PortedPolygon],
     result = compute(left, right, operation_type)
 
     assert isinstance(result, PortedPolygon)
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_prefilter(polygons: Tuple[PortedPolygon, PortedPolygon],
+                   operation_type: PortedOperationType) -> None:
+    left, right = polygons
+
+    result = compute(copy.deepcopy(left), copy.deepcopy(right),
+                     operation_type,
+                     prefilter=True)
+
+    assert result == compute(left, right, operation_type)
+
+
+@given(strategies.nested_non_convex_polygons_pairs,
+       strategies.operations_types)
+def test_prefilter_nested(polygons: Tuple[PortedPolygon, PortedPolygon],
+                          operation_type: PortedOperationType) -> None:
+    left, right = polygons
+
+    result = compute(copy.deepcopy(left), copy.deepcopy(right),
+                     operation_type,
+                     prefilter=True)
+
+    assert result == compute(left, right, operation_type)
+
+
+@given(strategies.stacked_polygons_pairs, strategies.operations_types)
+def test_prefilter_stacked(polygons: Tuple[PortedPolygon, PortedPolygon],
+                           operation_type: PortedOperationType) -> None:
+    left, right = polygons
+
+    try:
+        expected = compute(copy.deepcopy(left), copy.deepcopy(right),
+                           operation_type)
+    except ValueError:
+        return
+    result = compute(left, right, operation_type,
+                     prefilter=True)
+
+    assert result == expected
+
+
+@given(strategies.sizes, strategies.sizes, strategies.operations_types)
+def test_modified_contour(size: int, offset: int,
+                          operation_type: PortedOperationType) -> None:
+    left = PortedPolygon([PortedContour(
+            to_ported_rectangle((0, size), (0, size)), [], True)])
+    right = PortedPolygon([PortedContour(
+            to_ported_rectangle((size + offset, size + 2 * offset),
+                                (size + offset, size + 2 * offset)),
+            [], True)])
+    left.bounding_box
+
+    left.contours[0].add(PortedPoint(size + 3 * offset, size + 3 * offset))
+
+    result = compute(left, right, operation_type)
+
+    assert result == compute(PortedPolygon([PortedContour(contour.points[:],
+                                                          contour.holes[:],
+                                                          contour.is_external)
+                                            for contour in left.contours]),
+                             right, operation_type)
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_suspend_gc(polygons: Tuple[PortedPolygon, PortedPolygon],
+                    operation_type: PortedOperationType) -> None:
+    left, right = polygons
+
+    result = compute(copy.deepcopy(left), copy.deepcopy(right),
+                     operation_type,
+                     suspend_gc=True)
+
+    assert result == compute(left, right, operation_type)
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_flat(polygons: Tuple[PortedPolygon, PortedPolygon],
+              operation_type: PortedOperationType) -> None:
+    left, right = polygons
+
+    result = compute(copy.deepcopy(left), copy.deepcopy(right),
+                     operation_type,
+                     flat=True)
+
+    nested_result = compute(left, right, operation_type)
+    assert len(result.contours) == len(nested_result.contours)
+    assert all(not contour.holes and contour.is_external
+               for contour in result.contours)
+    assert all(contour.points in (nested_contour.points,
+                                  nested_contour.points[::-1])
+               for contour, nested_contour in zip(result.contours,
+                                                  nested_result.contours))
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_inputs(polygons: Tuple[PortedPolygon, PortedPolygon],
+                operation_type: PortedOperationType) -> None:
+    left, right = polygons
+    original_left, original_right = copy.deepcopy(polygons)
+
+    result = compute(left, right, operation_type)
+
+    for contour in result.contours:
+        if contour.points:
+            contour.add(contour.points[0])
+        contour.clear_holes()
+
+    assert left == original_left
+    assert right == original_right
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_vertex_table(polygons: Tuple[PortedPolygon, PortedPolygon],
+                      operation_type: PortedOperationType) -> None:
+    left, right = polygons
+    vertex_table = PortedVertexTable()
+
+    result = compute(left, right, operation_type,
+                     vertex_table=vertex_table)
+
+    assert result == compute(left, right, operation_type)
+    assert all(any(point is vertex for vertex in vertex_table.vertices)
+               for contour in result.contours
+               if contour.typecode is None
+               for point in contour.points)
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_inputs_storage(polygons: Tuple[PortedPolygon, PortedPolygon],
+                        operation_type: PortedOperationType) -> None:
+    left, right = polygons
+    original_left, original_right = copy.deepcopy(polygons)
+
+    result = compute(left, right, operation_type)
+
+    for contour in result.contours:
+        points = contour.points
+        if points:
+            points.append(points[0])
+
+    assert left == original_left
+    assert right == original_right
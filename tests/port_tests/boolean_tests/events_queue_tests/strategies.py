@@ -0,0 +1,73 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import strategies
+
+from tests.port_tests.factories import (scalars_to_nested_ported_sweep_events,
+                                        scalars_to_ported_polygons)
+from tests.port_tests.hints import (PortedEventsQueue,
+                                    PortedOperation,
+                                    PortedOperationType,
+                                    PortedPolygon,
+                                    PortedSweepEvent)
+from tests.port_tests.utils import ported_operations_types
+from tests.strategies import scalars_strategies
+from tests.utils import (Scalar,
+                         Strategy,
+                         identity)
+
+
+def to_events_queue(events: List[PortedSweepEvent]) -> PortedEventsQueue:
+    return PortedEventsQueue(*events)
+
+
+def scalars_to_nested_sweep_events_lists(
+        scalars: Strategy[Scalar]) -> Strategy[List[PortedSweepEvent]]:
+    return strategies.lists(scalars_to_nested_ported_sweep_events(scalars))
+
+
+def scalars_to_events_queues_with_nested_sweep_events_lists(
+        scalars: Strategy[Scalar]
+) -> Strategy[Tuple[PortedEventsQueue, List[PortedSweepEvent]]]:
+    events_lists = scalars_to_nested_sweep_events_lists(scalars)
+    return strategies.tuples(events_lists.map(to_events_queue), events_lists)
+
+
+def scalars_to_events_queues_with_nested_sweep_events(
+        scalars: Strategy[Scalar]
+) -> Strategy[Tuple[PortedEventsQueue, PortedSweepEvent]]:
+    return strategies.tuples(
+            scalars_to_nested_sweep_events_lists(scalars).map(to_events_queue),
+            scalars_to_nested_ported_sweep_events(scalars))
+
+
+def to_operation_events(left: PortedPolygon,
+                        right: PortedPolygon,
+                        operation_type: PortedOperationType
+                        ) -> List[PortedSweepEvent]:
+    operation = PortedOperation(left, right, operation_type)
+    operation.process_segments()
+    return operation.events
+
+
+def scalars_to_operations_events(scalars: Strategy[Scalar]
+                                 ) -> Strategy[List[PortedSweepEvent]]:
+    polygons = scalars_to_ported_polygons(scalars)
+    return strategies.builds(to_operation_events, polygons, polygons,
+                             ported_operations_types)
+
+
+nested_sweep_events = (scalars_strategies
+                       .flatmap(scalars_to_nested_ported_sweep_events))
+nested_sweep_events_lists = (scalars_strategies
+                             .flatmap(scalars_to_nested_sweep_events_lists))
+non_empty_events_queues = (nested_sweep_events_lists
+                           .filter(bool)
+                           .map(to_events_queue))
+events_queues_with_nested_sweep_events = scalars_strategies.flatmap(
+        scalars_to_events_queues_with_nested_sweep_events)
+events_queues_with_nested_sweep_events_lists = scalars_strategies.flatmap(
+        scalars_to_events_queues_with_nested_sweep_events_lists)
+operations_events = (scalars_strategies
+                     .map(scalars_to_operations_events)
+                     .flatmap(identity))
@@ -0,0 +1,16 @@
+import copy
+
+from hypothesis import given
+
+from tests.port_tests.hints import PortedEventsQueue
+from . import strategies
+
+
+@given(strategies.non_empty_events_queues)
+def test_shallow(events_queue: PortedEventsQueue) -> None:
+    result = copy.copy(events_queue)
+
+    result.pop()
+
+    assert result is not events_queue
+    assert len(result) == len(events_queue) - 1
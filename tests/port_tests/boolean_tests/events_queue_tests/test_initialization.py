@@ -0,0 +1,15 @@
+from typing import List
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedEventsQueue,
+                                    PortedSweepEvent)
+from . import strategies
+
+
+@given(strategies.nested_sweep_events_lists)
+def test_basic(events: List[PortedSweepEvent]) -> None:
+    result = PortedEventsQueue(*events)
+
+    assert len(result) == len(events)
+    assert all(event.queue_entry is not None for event in events)
@@ -0,0 +1,37 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedEventsQueue,
+                                    PortedEventsQueueKey,
+                                    PortedSweepEvent)
+from . import strategies
+
+
+@given(strategies.events_queues_with_nested_sweep_events_lists)
+def test_basic(events_queue_with_events: Tuple[PortedEventsQueue,
+                                               List[PortedSweepEvent]]
+               ) -> None:
+    events_queue, events = events_queue_with_events
+    size = len(events_queue)
+
+    result = events_queue.load(events)
+
+    assert result is None
+    assert len(events_queue) == size + len(events)
+    assert all(event.queue_entry is not None for event in events)
+
+
+@given(strategies.operations_events)
+def test_order(events: List[PortedSweepEvent]) -> None:
+    events_queue = PortedEventsQueue()
+    events_queue.load(events[::2])
+    for event in events[1::2]:
+        events_queue.push(event)
+
+    result = [events_queue.pop() for _ in range(len(events))]
+
+    assert all(not PortedEventsQueueKey(result[index])
+               < PortedEventsQueueKey(result[index + 1])
+               for index in range(len(result) - 1))
@@ -0,0 +1,51 @@
+from copy import copy
+from typing import List
+
+import pytest
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedEventsQueue,
+                                    PortedEventsQueueKey,
+                                    PortedSweepEvent)
+from . import strategies
+
+
+@given(strategies.non_empty_events_queues)
+def test_basic(events_queue: PortedEventsQueue) -> None:
+    size = len(events_queue)
+    front = events_queue.peek()
+
+    result = events_queue.pop()
+
+    assert result is front
+    assert len(events_queue) == size - 1
+
+
+@given(strategies.operations_events)
+def test_order(events: List[PortedSweepEvent]) -> None:
+    events_queue = PortedEventsQueue(*events)
+
+    result = [events_queue.pop() for _ in range(len(events))]
+
+    assert all(not PortedEventsQueueKey(result[index])
+               < PortedEventsQueueKey(result[index + 1])
+               for index in range(len(result) - 1))
+
+
+@given(strategies.nested_sweep_events)
+def test_stability(event: PortedSweepEvent) -> None:
+    events = [copy(event) for _ in range(10)]
+    events_queue = PortedEventsQueue()
+    for event in events:
+        events_queue.push(event)
+
+    result = [events_queue.pop() for _ in range(len(events))]
+
+    assert all(popped is event for popped, event in zip(result, events))
+
+
+def test_empty() -> None:
+    events_queue = PortedEventsQueue()
+
+    with pytest.raises(ValueError):
+        events_queue.pop()
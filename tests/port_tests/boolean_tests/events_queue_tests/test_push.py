@@ -0,0 +1,19 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedEventsQueue,
+                                    PortedSweepEvent)
+from . import strategies
+
+
+@given(strategies.events_queues_with_nested_sweep_events)
+def test_basic(events_queue_with_event: Tuple[PortedEventsQueue,
+                                              PortedSweepEvent]) -> None:
+    events_queue, event = events_queue_with_event
+    size = len(events_queue)
+
+    events_queue.push(event)
+
+    assert len(events_queue) == size + 1
+    assert any(element is event for element in events_queue.events)
@@ -14,8 +14,7 @@ from tests.port_tests.hints import (PortedOperation,
 from tests.port_tests.utils import (are_non_overlapping_ported_sweep_events,
                                     ported_operations_types,
                                     to_non_overlapping_ported_polygons_pair)
-from tests.strategies import (booleans,
-                              scalars_strategies)
+from tests.strategies import scalars_strategies
 from tests.utils import (Scalar,
                          Strategy,
                          are_sweep_events_pair_with_different_polygon_types,
@@ -33,24 +32,9 @@ sweep_events = scalars_strategies.flatmap(scalars_to_ported_sweep_events)
 nested_sweep_events = (scalars_strategies
                        .flatmap(scalars_to_nested_ported_sweep_events))
 maybe_nested_sweep_events = to_maybe(nested_sweep_events)
-non_empty_sweep_events_lists = strategies.lists(sweep_events,
-                                                min_size=1)
-
-
-def to_sweep_events_lists_with_indices_and_booleans_lists(
-        events: List[PortedSweepEvent]
-) -> Strategy[Tuple[List[PortedSweepEvent], int, List[bool]]]:
-    return strategies.tuples(strategies.just(events),
-                             strategies.integers(0, len(events) - 1),
-                             strategies.lists(booleans,
-                                              min_size=len(events),
-                                              max_size=len(events)))
-
-
-non_empty_sweep_events_lists_with_indices_and_booleans_lists = (
-    non_empty_sweep_events_lists.flatmap(
-            to_sweep_events_lists_with_indices_and_booleans_lists))
-nested_sweep_events_lists = strategies.lists(nested_sweep_events)
+nested_sweep_events_lists = (scalars_strategies
+                             .map(scalars_to_nested_ported_sweep_events)
+                             .flatmap(strategies.lists))
 non_degenerate_nested_sweep_events = (nested_sweep_events
                                       .filter(is_sweep_event_non_degenerate))
 nested_sweep_events_pairs = (scalars_strategies
@@ -63,6 +47,8 @@ nested_sweep_events_pairs = (
         .filter(are_sweep_events_pair_with_different_polygon_types))
 operations_types = ported_operations_types
 polygons = scalars_strategies.flatmap(scalars_to_ported_polygons)
+polygons_pairs = (scalars_strategies.map(scalars_to_ported_polygons)
+                  .flatmap(to_pairs))
 
 
 def scalars_to_trivial_operations(scalars: Strategy[Scalar]
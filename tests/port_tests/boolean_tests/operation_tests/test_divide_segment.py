@@ -36,3 +36,20 @@ def test_events(operation_with_event_and_point: Tuple[PortedOperation,
     assert not events_before
     assert len(events_after) == 2
     assert all(isinstance(event, PortedSweepEvent) for event in events_after)
+
+
+@given(strategies.operations_with_double_nested_sweep_events_and_points)
+def test_coordinates(operation_with_event_and_point: Tuple[PortedOperation,
+                                                           PortedSweepEvent,
+                                                           PortedPoint]
+                     ) -> None:
+    operation, event, point = operation_with_event_and_point
+    other_event = event.other_event
+    event.coordinates, other_event.coordinates
+
+    operation.divide_segment(event, point)
+
+    assert all(event.coordinates == (event.point.x, event.point.y,
+                                     event.other_event.point.x,
+                                     event.other_event.point.y)
+               for event in (event, other_event))
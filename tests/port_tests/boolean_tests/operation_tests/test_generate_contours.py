@@ -0,0 +1,41 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedContour,
+                                    PortedOperation,
+                                    PortedSweepEvent)
+from . import strategies
+
+
+@given(strategies.operations_with_events_lists)
+def test_basic(operation_with_events: Tuple[PortedOperation,
+                                            List[PortedSweepEvent]]) -> None:
+    operation, events = operation_with_events
+
+    result = list(operation.generate_contours(events))
+
+    assert all(isinstance(contour_id, int)
+               and isinstance(parent_id, int)
+               and isinstance(contour, PortedContour)
+               for contour_id, parent_id, contour in result)
+
+
+@given(strategies.operations_with_events_lists)
+def test_properties(operation_with_events: Tuple[PortedOperation,
+                                                 List[PortedSweepEvent]]
+                    ) -> None:
+    operation, events = operation_with_events
+
+    result = list(operation.generate_contours(events))
+
+    operation.process_events(events)
+    contours = operation.resultant.contours
+    assert [contour_id for contour_id, _, _ in result] == list(
+            range(len(contours)))
+    assert all(parent_id == -1 or contour_id in contours[parent_id].holes
+               for contour_id, parent_id, _ in result)
+    assert all(not contour.holes
+               and contour.points == contours[contour_id].points
+               for contour_id, _, contour in result)
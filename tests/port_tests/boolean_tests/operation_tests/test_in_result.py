@@ -2,7 +2,8 @@ from typing import Tuple
 
 from hypothesis import given
 
-from tests.port_tests.hints import (PortedOperation,
+from tests.port_tests.hints import (PortedEdgeType,
+                                    PortedOperation,
                                     PortedSweepEvent)
 from . import strategies
 
@@ -13,3 +14,13 @@ def test_basic(operation_with_sweep_event: Tuple[PortedOperation,
     operation, event = operation_with_sweep_event
 
     assert isinstance(operation.in_result(event), bool)
+
+
+@given(strategies.operations_with_sweep_events)
+def test_non_contributing(operation_with_sweep_event: Tuple[PortedOperation,
+                                                            PortedSweepEvent]
+                          ) -> None:
+    operation, event = operation_with_sweep_event
+    event.edge_type = PortedEdgeType.NON_CONTRIBUTING
+
+    assert not operation.in_result(event)
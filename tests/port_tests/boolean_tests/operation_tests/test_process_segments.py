@@ -25,3 +25,29 @@ def test_events(operation: PortedOperation) -> None:
     assert not events_before
     assert not len(events_after) % 2
     assert all(isinstance(event, PortedSweepEvent) for event in events_after)
+
+
+@given(strategies.operations)
+def test_idempotence(operation: PortedOperation) -> None:
+    operation.process_segments()
+    events = operation.events
+
+    operation.process_segments()
+
+    assert operation.events == events
+
+
+@given(strategies.operations)
+def test_run(operation: PortedOperation) -> None:
+    fresh_operation = PortedOperation(operation.left, operation.right,
+                                      operation.type)
+
+    operation.process_segments()
+
+    try:
+        operation.run()
+    except ValueError:
+        return
+
+    fresh_operation.run()
+    assert operation.resultant == fresh_operation.resultant
@@ -0,0 +1,36 @@
+import gc
+
+from hypothesis import given
+
+from tests.port_tests.hints import PortedOperation
+from . import strategies
+
+
+@given(strategies.operations)
+def test_basic(operation: PortedOperation) -> None:
+    result = operation.release()
+
+    assert result is None
+
+
+@given(strategies.pre_processed_operations)
+def test_events(operation: PortedOperation) -> None:
+    operation.release()
+
+    assert not operation.events
+
+
+@given(strategies.operations)
+def test_run(operation: PortedOperation) -> None:
+    gc.collect()
+    gc.disable()
+    try:
+        try:
+            operation.run()
+        except ValueError:
+            return
+        garbage_count = gc.collect()
+    finally:
+        gc.enable()
+
+    assert not garbage_count
@@ -8,3 +8,19 @@ from . import strategies
 @given(strategies.operations)
 def test_basic(operation: PortedOperation) -> None:
     assert isinstance(operation.resultant, PortedPolygon)
+
+
+@given(strategies.operations)
+def test_metadata(operation: PortedOperation) -> None:
+    operation.resultant.vertices_count
+    operation.resultant.bounding_box
+
+    try:
+        operation.run()
+    except ValueError:
+        return
+
+    result = operation.resultant
+    assert result.vertices_count == PortedPolygon(
+            result.contours).vertices_count
+    assert result.bounding_box == PortedPolygon(result.contours).bounding_box
@@ -0,0 +1,55 @@
+import copy
+from typing import Tuple
+
+import pytest
+from hypothesis import given
+
+from martinez.boolean import compute
+from tests.port_tests.hints import (PortedOperation,
+                                    PortedOperationType,
+                                    PortedPolygon)
+from . import strategies
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_run(polygons: Tuple[PortedPolygon, PortedPolygon],
+             operation_type: PortedOperationType) -> None:
+    left, right = polygons
+    operation = PortedOperation(copy.deepcopy(left), copy.deepcopy(right),
+                                operation_type)
+
+    try:
+        result = list(operation.stream())
+    except ValueError:
+        return
+
+    if operation.is_trivial:
+        operation.run()
+        assert len(result) == len(operation.resultant.contours)
+        assert operation.resultant == compute(left, right, operation_type)
+    else:
+        with pytest.raises(ValueError):
+            operation.run()
+        with pytest.raises(ValueError):
+            operation.resultant
+        with pytest.raises(ValueError):
+            operation.stream()
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_interrupted(polygons: Tuple[PortedPolygon, PortedPolygon],
+                     operation_type: PortedOperationType) -> None:
+    left, right = polygons
+    operation = PortedOperation(left, right, operation_type)
+
+    try:
+        next(operation.stream(), None)
+    except ValueError:
+        return
+
+    if operation.is_trivial:
+        operation.run()
+        assert operation.resultant == compute(left, right, operation_type)
+    else:
+        with pytest.raises(ValueError):
+            operation.run()
@@ -0,0 +1,56 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedOperation,
+                                    PortedOperationType,
+                                    PortedPolygon,
+                                    PortedVertexTable)
+from . import strategies
+
+
+@given(strategies.operations)
+def test_basic(operation: PortedOperation) -> None:
+    assert operation.vertices_indices == []
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_vertex_table(polygons: Tuple[PortedPolygon, PortedPolygon],
+                      operation_type: PortedOperationType) -> None:
+    left, right = polygons
+    vertex_table = PortedVertexTable()
+    operation = PortedOperation(left, right, operation_type,
+                                vertex_table=vertex_table)
+
+    try:
+        operation.run()
+    except ValueError:
+        return
+
+    result = operation.vertices_indices
+    assert len(result) == len(operation.resultant.contours)
+    assert all([vertex_table.vertices[index] for index in indices]
+               == contour.points
+               for indices, contour in zip(result,
+                                           operation.resultant.contours))
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_trivial(polygons: Tuple[PortedPolygon, PortedPolygon],
+                 operation_type: PortedOperationType) -> None:
+    left, right = polygons
+    vertex_table = PortedVertexTable()
+    operation = PortedOperation(left, right, operation_type,
+                                vertex_table=vertex_table)
+    operation.is_trivial
+
+    try:
+        operation.run()
+    except ValueError:
+        return
+
+    result = operation.vertices_indices
+    assert len(result) == len(operation.resultant.contours)
+    assert len(vertex_table) == len({(point.x, point.y)
+                                     for contour in operation.resultant
+                                     for point in contour.points})
@@ -0,0 +1,77 @@
+import copy
+from typing import (Iterable,
+                    Tuple)
+
+from hypothesis import given
+
+from martinez.boolean import (ResultContour,
+                              compute,
+                              stream)
+from tests.port_tests.hints import (PortedContour,
+                                    PortedOperationType,
+                                    PortedPolygon)
+from . import strategies
+
+
+def are_contours_equivalent(result_contours: Iterable[ResultContour],
+                            polygon: PortedPolygon) -> bool:
+    result_contours = list(result_contours)
+    return (len(result_contours) == len(polygon.contours)
+            and all(contour.points == polygon.contours[contour_id].points
+                    and (parent_id == -1
+                         or contour_id in polygon.contours[parent_id].holes)
+                    for contour_id, parent_id, contour in result_contours))
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_basic(polygons: Tuple[PortedPolygon, PortedPolygon],
+               operation_type: PortedOperationType) -> None:
+    left, right = polygons
+
+    result = list(stream(left, right, operation_type))
+
+    assert all(isinstance(contour, PortedContour) and not contour.holes
+               for _, _, contour in result)
+    assert [contour_id for contour_id, _, _ in result] == list(
+            range(len(result)))
+    assert all(parent_id in range(-1, len(result))
+               for _, parent_id, _ in result)
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_properties(polygons: Tuple[PortedPolygon, PortedPolygon],
+                    operation_type: PortedOperationType) -> None:
+    left, right = polygons
+
+    result = stream(copy.deepcopy(left), copy.deepcopy(right),
+                    operation_type)
+
+    assert are_contours_equivalent(result,
+                                   compute(left, right, operation_type))
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_prefilter(polygons: Tuple[PortedPolygon, PortedPolygon],
+                   operation_type: PortedOperationType) -> None:
+    left, right = polygons
+
+    result = stream(copy.deepcopy(left), copy.deepcopy(right),
+                    operation_type,
+                    prefilter=True)
+
+    assert are_contours_equivalent(result,
+                                   compute(left, right, operation_type,
+                                           prefilter=True))
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_suspend_gc(polygons: Tuple[PortedPolygon, PortedPolygon],
+                    operation_type: PortedOperationType) -> None:
+    left, right = polygons
+
+    result = stream(copy.deepcopy(left), copy.deepcopy(right),
+                    operation_type,
+                    suspend_gc=True)
+
+    assert are_contours_equivalent(result,
+                                   compute(left, right, operation_type))
@@ -0,0 +1,19 @@
+import pytest
+from hypothesis import given
+
+from tests.port_tests.hints import PortedSweepEvent
+from . import strategies
+
+
+@given(strategies.leaf_sweep_events)
+def test_leaf(event: PortedSweepEvent) -> None:
+    with pytest.raises(ValueError):
+        event.coordinates
+
+
+@given(strategies.nested_sweep_events)
+def test_nested(event: PortedSweepEvent) -> None:
+    result = event.coordinates
+
+    assert result == (event.point.x, event.point.y,
+                      event.other_event.point.x, event.other_event.point.y)
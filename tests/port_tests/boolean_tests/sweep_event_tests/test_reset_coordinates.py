@@ -0,0 +1,17 @@
+from hypothesis import given
+
+from tests.port_tests.hints import PortedSweepEvent
+from . import strategies
+
+
+@given(strategies.nested_sweep_events, strategies.nested_sweep_events)
+def test_basic(event: PortedSweepEvent,
+               other_event: PortedSweepEvent) -> None:
+    event.coordinates
+    event.other_event = other_event
+
+    result = event.reset_coordinates()
+
+    assert result is None
+    assert event.coordinates == (event.point.x, event.point.y,
+                                 other_event.point.x, other_event.point.y)
@@ -0,0 +1,12 @@
+from hypothesis import strategies
+
+from tests.port_tests.factories import scalars_to_ported_contours_lists
+from tests.strategies import scalars_strategies
+from tests.utils import (identity,
+                         to_pairs)
+
+contours_lists_strategies = scalars_strategies.map(
+        scalars_to_ported_contours_lists)
+contours_lists = contours_lists_strategies.flatmap(identity)
+contours_lists_pairs = contours_lists_strategies.flatmap(to_pairs)
+empty_contours_lists = strategies.builds(list)
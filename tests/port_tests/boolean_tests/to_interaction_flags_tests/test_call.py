@@ -0,0 +1,51 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from martinez.boolean import to_interaction_flags
+from tests.port_tests.hints import PortedContour
+from . import strategies
+
+
+@given(strategies.contours_lists_pairs)
+def test_basic(contours_lists_pair: Tuple[List[PortedContour],
+                                          List[PortedContour]]) -> None:
+    left_contours, right_contours = contours_lists_pair
+
+    result = to_interaction_flags(left_contours, right_contours)
+
+    assert isinstance(result, tuple)
+    assert len(result) == 2
+    left_flags, right_flags = result
+    assert len(left_flags) == len(left_contours)
+    assert len(right_flags) == len(right_contours)
+    assert all(isinstance(flag, bool) for flag in left_flags + right_flags)
+
+
+@given(strategies.contours_lists, strategies.empty_contours_lists)
+def test_empty(contours: List[PortedContour],
+               empty_contours: List[PortedContour]) -> None:
+    left_flags, right_flags = to_interaction_flags(contours, empty_contours)
+
+    assert not right_flags
+    assert to_interaction_flags(empty_contours, contours) == (right_flags,
+                                                              left_flags)
+
+
+@given(strategies.contours_lists)
+def test_self(contours: List[PortedContour]) -> None:
+    assert to_interaction_flags(contours, contours) == ([True] * len(contours),
+                                                        [True] * len(contours))
+
+
+@given(strategies.contours_lists_pairs)
+def test_symmetry(contours_lists_pair: Tuple[List[PortedContour],
+                                             List[PortedContour]]) -> None:
+    left_contours, right_contours = contours_lists_pair
+
+    left_flags, right_flags = to_interaction_flags(left_contours,
+                                                   right_contours)
+
+    assert to_interaction_flags(right_contours, left_contours) == (
+        right_flags, left_flags)
@@ -0,0 +1,22 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import strategies
+
+from tests.port_tests.factories import scalars_to_ported_contours_lists
+from tests.port_tests.hints import PortedContour
+from tests.strategies import scalars_strategies
+from tests.utils import Strategy
+
+
+def to_flagged_contours_lists(contours: List[PortedContour]
+                              ) -> Strategy[Tuple[List[PortedContour],
+                                                  List[bool]]]:
+    return strategies.tuples(strategies.just(contours),
+                             strategies.lists(strategies.booleans(),
+                                              min_size=len(contours),
+                                              max_size=len(contours)))
+
+
+contours_lists = scalars_strategies.flatmap(scalars_to_ported_contours_lists)
+flagged_contours_lists = contours_lists.flatmap(to_flagged_contours_lists)
@@ -0,0 +1,55 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from martinez.boolean import to_stacking_flags
+from tests.port_tests.hints import PortedContour
+from . import strategies
+
+
+@given(strategies.flagged_contours_lists)
+def test_basic(flagged_contours: Tuple[List[PortedContour], List[bool]]
+               ) -> None:
+    contours, flags = flagged_contours
+
+    result = to_stacking_flags(contours, flags)
+
+    assert isinstance(result, list)
+    assert len(result) == len(contours)
+    assert all(isinstance(flag, bool) for flag in result)
+
+
+@given(strategies.flagged_contours_lists)
+def test_flagged(flagged_contours: Tuple[List[PortedContour], List[bool]]
+                 ) -> None:
+    contours, flags = flagged_contours
+
+    result = to_stacking_flags(contours, flags)
+
+    assert all(flag for flag, original in zip(result, flags) if original)
+    assert to_stacking_flags(contours, result) == result
+
+
+@given(strategies.contours_lists)
+def test_unflagged(contours: List[PortedContour]) -> None:
+    assert to_stacking_flags(contours, [False] * len(contours)) == (
+        [False] * len(contours))
+
+
+@given(strategies.flagged_contours_lists)
+def test_stacked(flagged_contours: Tuple[List[PortedContour], List[bool]]
+                 ) -> None:
+    contours, flags = flagged_contours
+
+    result = to_stacking_flags(contours, flags)
+
+    assert not any(
+            not flag
+            and other_flag
+            and not (contour.bounding_box.x_min
+                     > other_contour.bounding_box.x_max
+                     or other_contour.bounding_box.x_min
+                     > contour.bounding_box.x_max)
+            for contour, flag in zip(contours, result)
+            for other_contour, other_flag in zip(contours, result))
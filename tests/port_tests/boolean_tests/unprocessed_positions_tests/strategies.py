@@ -0,0 +1,64 @@
+from functools import partial
+from operator import attrgetter
+from typing import (List,
+                    Tuple)
+
+from hypothesis import strategies
+
+from tests.port_tests.factories import scalars_to_ported_sweep_events
+from tests.port_tests.hints import (PortedSweepEvent,
+                                    PortedUnprocessedPositions)
+from tests.strategies import (booleans,
+                              scalars_strategies)
+from tests.utils import Strategy
+
+sweep_events = scalars_strategies.flatmap(scalars_to_ported_sweep_events)
+
+
+def to_sorted_events_lists_with_repeats(events: List[PortedSweepEvent]
+                                        ) -> Strategy[List[PortedSweepEvent]]:
+    # events sharing points are frequent in connected edges
+    # & get adjacent after sorting
+    return (strategies.lists(strategies.sampled_from(events),
+                             min_size=1)
+            .map(partial(sorted,
+                         key=attrgetter('point.x', 'point.y'))))
+
+
+non_empty_sweep_events_lists = (strategies.lists(sweep_events,
+                                                 min_size=1,
+                                                 max_size=5)
+                                .flatmap(to_sorted_events_lists_with_repeats))
+
+
+def to_sweep_events_lists_with_indices_and_booleans_lists(
+        events: List[PortedSweepEvent]
+) -> Strategy[Tuple[List[PortedSweepEvent], int, List[bool]]]:
+    return strategies.tuples(strategies.just(events),
+                             strategies.integers(0, len(events) - 1),
+                             strategies.lists(booleans,
+                                              min_size=len(events),
+                                              max_size=len(events)))
+
+
+non_empty_sweep_events_lists_with_indices_and_booleans_lists = (
+    non_empty_sweep_events_lists.flatmap(
+            to_sweep_events_lists_with_indices_and_booleans_lists))
+
+
+def to_unprocessed_positions_with_events_position_and_processed(
+        events_with_position_and_processed
+        : Tuple[List[PortedSweepEvent], int, List[bool]]
+) -> Tuple[PortedUnprocessedPositions, List[PortedSweepEvent], int,
+           List[bool]]:
+    events, position, processed = events_with_position_and_processed
+    result = PortedUnprocessedPositions([event.point for event in events])
+    for index, is_processed in enumerate(processed):
+        if is_processed:
+            result.discard(index)
+    return result, events, position, processed
+
+
+unprocessed_positions_with_events_positions_and_processed = (
+    non_empty_sweep_events_lists_with_indices_and_booleans_lists
+    .map(to_unprocessed_positions_with_events_position_and_processed))
@@ -0,0 +1,24 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedSweepEvent,
+                                    PortedUnprocessedPositions)
+from . import strategies
+
+
+@given(strategies.unprocessed_positions_with_events_positions_and_processed)
+def test_basic(unprocessed_with_events_position_and_processed
+               : Tuple[PortedUnprocessedPositions, List[PortedSweepEvent],
+                       int, List[bool]]) -> None:
+    (unprocessed, events, position,
+     processed) = unprocessed_with_events_position_and_processed
+
+    result = unprocessed.discard(position)
+
+    assert result is None
+    assert position not in unprocessed
+    assert all((index in unprocessed) is not is_processed
+               for index, is_processed in enumerate(processed)
+               if index != position)
@@ -0,0 +1,52 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedSweepEvent,
+                                    PortedUnprocessedPositions)
+from . import strategies
+
+
+@given(strategies.unprocessed_positions_with_events_positions_and_processed)
+def test_basic(unprocessed_with_events_position_and_processed
+               : Tuple[PortedUnprocessedPositions, List[PortedSweepEvent],
+                       int, List[bool]]) -> None:
+    (unprocessed, events, position,
+     processed) = unprocessed_with_events_position_and_processed
+
+    result = unprocessed.to_next(position)
+
+    assert result == to_next_position(position, events, processed)
+
+
+@given(strategies.unprocessed_positions_with_events_positions_and_processed)
+def test_repeated(unprocessed_with_events_position_and_processed
+                  : Tuple[PortedUnprocessedPositions, List[PortedSweepEvent],
+                          int, List[bool]]) -> None:
+    (unprocessed, events, position,
+     processed) = unprocessed_with_events_position_and_processed
+
+    first_result = unprocessed.to_next(position)
+    second_result = unprocessed.to_next(position)
+
+    assert first_result == second_result
+
+
+def to_next_position(position: int, events: List[PortedSweepEvent],
+                     processed: List[bool]) -> int:
+    result = position + 1
+    while (result < len(events)
+           and events[result].point == events[position].point):
+        if not processed[result]:
+            return result
+        else:
+            result += 1
+    if not position:
+        return 0
+    result = position - 1
+    while processed[result]:
+        if not result:
+            break
+        result -= 1
+    return result
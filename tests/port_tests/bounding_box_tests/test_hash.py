@@ -0,0 +1,22 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from tests.port_tests.hints import PortedBoundingBox
+from tests.utils import Scalar
+from . import strategies
+
+
+@given(strategies.bounding_boxes)
+def test_basic(bounding_box: PortedBoundingBox) -> None:
+    assert isinstance(hash(bounding_box), int)
+
+
+@given(strategies.scalars_quadruples)
+def test_connection_with_equality(
+        scalars_quadruple: Tuple[Scalar, Scalar, Scalar, Scalar]) -> None:
+    first_bounding_box = PortedBoundingBox(*scalars_quadruple)
+    second_bounding_box = PortedBoundingBox(*scalars_quadruple)
+
+    assert first_bounding_box == second_bounding_box
+    assert hash(first_bounding_box) == hash(second_bounding_box)
@@ -0,0 +1,9 @@
+from hypothesis import strategies
+
+from tests.port_tests.factories import (scalars_to_ported_polygons,
+                                        scalars_to_ported_points)
+from tests.strategies import scalars_strategies
+
+polygons = scalars_strategies.flatmap(scalars_to_ported_polygons)
+points = scalars_strategies.flatmap(scalars_to_ported_points)
+offsets = strategies.integers(0, 100)
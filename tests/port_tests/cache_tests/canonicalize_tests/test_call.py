@@ -0,0 +1,50 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from martinez.cache import canonicalize
+from tests.port_tests.hints import (PortedContour,
+                                    PortedFrozenPolygon,
+                                    PortedPoint,
+                                    PortedPolygon)
+from tests.utils import Scalar
+from . import strategies
+
+
+def to_coordinates(point: PortedPoint) -> Tuple[Scalar, Scalar]:
+    return point.x, point.y
+
+
+@given(strategies.polygons)
+def test_basic(polygon: PortedPolygon) -> None:
+    result = canonicalize(polygon)
+
+    assert isinstance(result, PortedFrozenPolygon)
+    assert len(result.contours) == len(polygon.contours)
+    assert all(sorted(result_contour.points, key=to_coordinates)
+               == sorted(contour.points, key=to_coordinates)
+               for result_contour, contour in zip(result.contours,
+                                                  polygon.contours))
+
+
+@given(strategies.polygons, strategies.offsets)
+def test_start_vertices(polygon: PortedPolygon, offset: int) -> None:
+    rotated = PortedPolygon([PortedContour(contour.points[offset:]
+                                           + contour.points[:offset],
+                                           contour.holes[:],
+                                           contour.is_external)
+                             for contour in polygon.contours])
+
+    assert canonicalize(rotated) == canonicalize(polygon)
+
+
+@given(strategies.polygons, strategies.points)
+def test_original_modification(polygon: PortedPolygon,
+                               point: PortedPoint) -> None:
+    result = canonicalize(polygon)
+    original_points = [contour.points for contour in result.contours]
+
+    for contour in polygon.contours:
+        contour.add(point)
+
+    assert [contour.points for contour in result.contours] == original_points
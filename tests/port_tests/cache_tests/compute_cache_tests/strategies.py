@@ -0,0 +1,16 @@
+from hypothesis import strategies
+
+from tests.port_tests.factories import scalars_to_ported_polygons
+from tests.port_tests.hints import PortedOperationType
+from tests.port_tests.utils import ported_operations_types
+from tests.strategies import scalars_strategies
+from tests.utils import to_pairs
+
+operations_types = ported_operations_types
+commutative_operations_types = ported_operations_types.filter(
+        lambda operation_type:
+        operation_type is not PortedOperationType.DIFFERENCE)
+polygons_pairs = (scalars_strategies.map(scalars_to_ported_polygons)
+                  .flatmap(to_pairs))
+max_vertices_counts = strategies.integers(0, 100)
+negative_integers = strategies.integers(max_value=-1)
@@ -0,0 +1,125 @@
+import copy
+from typing import Tuple
+
+from hypothesis import given
+
+from martinez.boolean import compute
+from tests.port_tests.hints import (PortedComputeCache,
+                                    PortedContour,
+                                    PortedOperationType,
+                                    PortedPolygon)
+from . import strategies
+
+
+@given(strategies.polygons_pairs, strategies.operations_types,
+       strategies.max_vertices_counts)
+def test_basic(polygons: Tuple[PortedPolygon, PortedPolygon],
+               operation_type: PortedOperationType,
+               max_vertices_count: int) -> None:
+    left, right = polygons
+    cache = PortedComputeCache(max_vertices_count)
+
+    try:
+        result = cache.compute(copy.deepcopy(left), copy.deepcopy(right),
+                               operation_type)
+    except ValueError:
+        return
+
+    assert result == compute(left, right, operation_type)
+    assert cache.misses == 1
+    assert cache.hits == 0
+    assert cache.vertices_count <= cache.max_vertices_count
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_hit(polygons: Tuple[PortedPolygon, PortedPolygon],
+             operation_type: PortedOperationType) -> None:
+    left, right = polygons
+    cache = PortedComputeCache(10 ** 6)
+
+    try:
+        result = cache.compute(left, right, operation_type)
+    except ValueError:
+        return
+    original_result = copy.deepcopy(result)
+    for contour in result.contours:
+        contour.clear_holes()
+
+    assert cache.compute(left, right, operation_type) == original_result
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert len(cache) == 1
+
+
+@given(strategies.polygons_pairs, strategies.commutative_operations_types)
+def test_commutativity(polygons: Tuple[PortedPolygon, PortedPolygon],
+                       operation_type: PortedOperationType) -> None:
+    left, right = polygons
+    cache = PortedComputeCache(10 ** 6)
+
+    try:
+        result = cache.compute(left, right, operation_type)
+    except ValueError:
+        return
+
+    assert cache.compute(right, left, operation_type) == result
+    assert cache.hits == 1
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_start_vertices(polygons: Tuple[PortedPolygon, PortedPolygon],
+                        operation_type: PortedOperationType) -> None:
+    left, right = polygons
+    cache = PortedComputeCache(10 ** 6)
+    rotated_left = PortedPolygon([PortedContour(contour.points[1:]
+                                                + contour.points[:1],
+                                                contour.holes[:],
+                                                contour.is_external)
+                                  for contour in left.contours])
+
+    try:
+        result = cache.compute(left, right, operation_type)
+    except ValueError:
+        return
+
+    assert cache.compute(rotated_left, right, operation_type) == result
+    assert cache.hits == 1
+
+
+@given(strategies.polygons_pairs, strategies.operations_types,
+       strategies.max_vertices_counts)
+def test_eviction(polygons: Tuple[PortedPolygon, PortedPolygon],
+                  operation_type: PortedOperationType,
+                  max_vertices_count: int) -> None:
+    left, right = polygons
+    cache = PortedComputeCache(max_vertices_count)
+
+    try:
+        cache.compute(left, right, operation_type)
+        cache.compute(left, left, operation_type)
+        cache.compute(right, right, operation_type)
+    except ValueError:
+        return
+
+    assert cache.vertices_count <= cache.max_vertices_count
+    assert cache.hits + cache.misses == 3
+    assert len(cache) <= cache.misses - cache.evictions
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_prefilter(polygons: Tuple[PortedPolygon, PortedPolygon],
+                   operation_type: PortedOperationType) -> None:
+    left, right = polygons
+    cache = PortedComputeCache(10 ** 6)
+
+    try:
+        cache.compute(left, right, operation_type)
+        result = cache.compute(left, right, operation_type,
+                               prefilter=True)
+    except ValueError:
+        return
+
+    assert result == compute(left, right, operation_type,
+                             prefilter=True)
+    assert cache.hits == 0
+    assert cache.misses == 2
@@ -0,0 +1,21 @@
+import pytest
+from hypothesis import given
+
+from tests.port_tests.hints import PortedComputeCache
+from . import strategies
+
+
+@given(strategies.max_vertices_counts)
+def test_basic(max_vertices_count: int) -> None:
+    result = PortedComputeCache(max_vertices_count)
+
+    assert result.max_vertices_count == max_vertices_count
+    assert result.vertices_count == 0
+    assert result.hits == result.misses == result.evictions == 0
+    assert len(result) == 0
+
+
+@given(strategies.negative_integers)
+def test_invalid_max_vertices_count(max_vertices_count: int) -> None:
+    with pytest.raises(ValueError):
+        PortedComputeCache(max_vertices_count)
@@ -0,0 +1,14 @@
+from hypothesis import strategies
+
+from tests.port_tests.factories import scalars_to_ported_polygons
+from tests.port_tests.utils import ported_operations_types
+from tests.strategies import (floats,
+                              scalars_strategies)
+from tests.utils import to_pairs
+
+operations_types = ported_operations_types
+polygons_pairs = (scalars_strategies.map(scalars_to_ported_polygons)
+                  .flatmap(to_pairs))
+float_polygons_pairs = to_pairs(scalars_to_ported_polygons(floats))
+max_sizes = strategies.integers(0, 10 ** 4)
+negative_integers = strategies.integers(max_value=-1)
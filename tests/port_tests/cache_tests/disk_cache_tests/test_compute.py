@@ -0,0 +1,131 @@
+import copy
+import os
+import tempfile
+from typing import Tuple
+
+from hypothesis import given
+
+from martinez.boolean import compute
+from martinez.cache import is_packable
+from tests.port_tests.hints import (PortedDiskCache,
+                                    PortedOperationType,
+                                    PortedPolygon)
+from . import strategies
+
+
+@given(strategies.polygons_pairs, strategies.operations_types,
+       strategies.max_sizes)
+def test_basic(polygons: Tuple[PortedPolygon, PortedPolygon],
+               operation_type: PortedOperationType,
+               max_size: int) -> None:
+    left, right = polygons
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = PortedDiskCache(directory, max_size)
+        try:
+            result = cache.compute(copy.deepcopy(left), copy.deepcopy(right),
+                                   operation_type)
+        except ValueError:
+            return
+
+        assert result == compute(left, right, operation_type)
+        assert cache.misses == 1
+        assert cache.hits == 0
+        assert cache.size <= cache.max_size
+
+
+@given(strategies.float_polygons_pairs, strategies.operations_types)
+def test_hit(polygons: Tuple[PortedPolygon, PortedPolygon],
+             operation_type: PortedOperationType) -> None:
+    left, right = polygons
+    if not (is_packable(left) and is_packable(right)):
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = PortedDiskCache(directory, 10 ** 6)
+        try:
+            result = cache.compute(left, right, operation_type)
+        except ValueError:
+            return
+        other_cache = PortedDiskCache(directory, 10 ** 6)
+
+        assert other_cache.compute(left, right, operation_type) == result
+        assert other_cache.hits == 1
+        assert other_cache.misses == 0
+        assert len(other_cache) == 1
+
+
+@given(strategies.float_polygons_pairs, strategies.operations_types)
+def test_corrupted_entry(polygons: Tuple[PortedPolygon, PortedPolygon],
+                         operation_type: PortedOperationType) -> None:
+    left, right = polygons
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = PortedDiskCache(directory, 10 ** 6)
+        try:
+            result = cache.compute(left, right, operation_type)
+        except ValueError:
+            return
+        for name in os.listdir(directory):
+            with open(os.path.join(directory, name), 'r+b') as file:
+                file.truncate(3)
+
+        assert cache.compute(left, right, operation_type) == result
+        assert cache.hits == 0
+        assert cache.misses == 2
+
+
+@given(strategies.float_polygons_pairs, strategies.operations_types,
+       strategies.max_sizes)
+def test_eviction(polygons: Tuple[PortedPolygon, PortedPolygon],
+                  operation_type: PortedOperationType,
+                  max_size: int) -> None:
+    left, right = polygons
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = PortedDiskCache(directory, max_size)
+        try:
+            cache.compute(left, right, operation_type)
+            cache.compute(left, left, operation_type)
+            cache.compute(right, right, operation_type)
+        except ValueError:
+            return
+
+        assert cache.size <= cache.max_size
+        assert cache.hits + cache.misses == 3
+        assert len(cache) <= cache.misses - cache.evictions
+
+
+@given(strategies.float_polygons_pairs, strategies.operations_types)
+def test_prefilter(polygons: Tuple[PortedPolygon, PortedPolygon],
+                   operation_type: PortedOperationType) -> None:
+    left, right = polygons
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = PortedDiskCache(directory, 10 ** 6)
+        try:
+            cache.compute(left, right, operation_type)
+            cache.compute(left, right, operation_type,
+                          prefilter=True)
+        except ValueError:
+            return
+
+        assert cache.hits == 0
+        assert cache.misses == 2
+
+
+@given(strategies.float_polygons_pairs, strategies.operations_types)
+def test_existing_entries(polygons: Tuple[PortedPolygon, PortedPolygon],
+                          operation_type: PortedOperationType) -> None:
+    left, right = polygons
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = PortedDiskCache(directory, 10 ** 6)
+        try:
+            cache.compute(left, right, operation_type)
+            other_cache = PortedDiskCache(directory, cache.size)
+            other_cache.compute(left, left, operation_type)
+        except ValueError:
+            return
+
+        assert other_cache.size <= other_cache.max_size
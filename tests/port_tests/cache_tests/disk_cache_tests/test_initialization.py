@@ -0,0 +1,48 @@
+import os
+import tempfile
+import time
+
+import pytest
+from hypothesis import given
+
+from martinez.cache import (STALE_TEMPORARY_AGE,
+                            TEMPORARY_EXTENSION)
+from tests.port_tests.hints import PortedDiskCache
+from . import strategies
+
+
+@given(strategies.max_sizes)
+def test_basic(max_size: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        result = PortedDiskCache(directory, max_size)
+
+        assert result.directory == directory
+        assert result.max_size == max_size
+        assert result.size == 0
+        assert result.hits == result.misses == result.evictions == 0
+        assert len(result) == 0
+
+
+@given(strategies.negative_integers)
+def test_invalid_max_size(max_size: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        with pytest.raises(ValueError):
+            PortedDiskCache(directory, max_size)
+
+
+@given(strategies.max_sizes)
+def test_stale_temporaries(max_size: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        stale_path, fresh_path = (
+            os.path.join(directory, name + TEMPORARY_EXTENSION)
+            for name in ('stale', 'fresh'))
+        for path in (stale_path, fresh_path):
+            with open(path, 'wb') as file:
+                file.write(b'MRTZ')
+        stale_time = time.time() - 2 * STALE_TEMPORARY_AGE
+        os.utime(stale_path, (stale_time, stale_time))
+
+        PortedDiskCache(directory, max_size)
+
+        assert not os.path.exists(stale_path)
+        assert os.path.exists(fresh_path)
@@ -0,0 +1,7 @@
+from hypothesis import strategies
+
+from tests.port_tests.factories import scalars_to_ported_polygons
+from tests.strategies import floats
+
+float_polygons = scalars_to_ported_polygons(floats)
+byte_strings = strategies.binary()
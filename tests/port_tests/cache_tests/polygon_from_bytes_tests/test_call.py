@@ -0,0 +1,26 @@
+import pytest
+from hypothesis import given
+
+from martinez.cache import (SIGNATURE,
+                            is_packable,
+                            polygon_from_bytes,
+                            polygon_to_bytes)
+from tests.port_tests.hints import PortedPolygon
+from . import strategies
+
+
+@given(strategies.byte_strings)
+def test_invalid_signature(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        polygon_from_bytes(data[:len(SIGNATURE) - 1] + b'\xff' + data)
+
+
+@given(strategies.float_polygons, strategies.byte_strings)
+def test_corrupted(polygon: PortedPolygon, suffix: bytes) -> None:
+    if not is_packable(polygon) or not suffix:
+        return
+
+    data = polygon_to_bytes(polygon)
+
+    with pytest.raises(ValueError):
+        polygon_from_bytes(data + suffix)
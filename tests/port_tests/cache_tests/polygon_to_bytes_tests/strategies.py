@@ -0,0 +1,9 @@
+from hypothesis import strategies
+
+from tests.port_tests.factories import scalars_to_ported_polygons
+from tests.port_tests.utils import to_packed_ported_polygon
+from tests.strategies import floats
+
+float_polygons = scalars_to_ported_polygons(floats)
+packed_polygons = strategies.builds(to_packed_ported_polygon, float_polygons,
+                                    strategies.sampled_from(['d', 'f']))
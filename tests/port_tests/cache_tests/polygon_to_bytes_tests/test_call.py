@@ -0,0 +1,43 @@
+from hypothesis import given
+
+from martinez.cache import (is_packable,
+                            polygon_from_bytes,
+                            polygon_to_bytes)
+from tests.port_tests.hints import PortedPolygon
+from . import strategies
+
+
+@given(strategies.float_polygons)
+def test_basic(polygon: PortedPolygon) -> None:
+    if not is_packable(polygon):
+        return
+
+    result = polygon_to_bytes(polygon)
+
+    assert isinstance(result, bytes)
+
+
+@given(strategies.float_polygons)
+def test_round_trip(polygon: PortedPolygon) -> None:
+    if not is_packable(polygon):
+        return
+
+    result = polygon_from_bytes(polygon_to_bytes(polygon))
+
+    assert result == polygon
+    assert all(result_contour.typecode == contour.typecode
+               for result_contour, contour in zip(result.contours,
+                                                  polygon.contours))
+
+
+@given(strategies.packed_polygons)
+def test_packed(polygon: PortedPolygon) -> None:
+    if not is_packable(polygon):
+        return
+
+    result = polygon_from_bytes(polygon_to_bytes(polygon))
+
+    assert result == polygon
+    assert all(result_contour.typecode == contour.typecode
+               for result_contour, contour in zip(result.contours,
+                                                  polygon.contours))
@@ -1,7 +1,11 @@
+from hypothesis import strategies
+
 from tests.port_tests.factories import (scalars_to_ported_contours,
                                         scalars_to_ported_points,
                                         scalars_to_ported_points_lists)
+from tests.port_tests.utils import to_packed_ported_contour
 from tests.strategies import (booleans,
+                              floats,
                               non_negative_integers,
                               non_negative_integers_lists,
                               scalars_strategies)
@@ -12,9 +16,14 @@ from tests.utils import (identity,
 booleans = booleans
 non_negative_integers = non_negative_integers
 non_negative_integers_lists = non_negative_integers_lists
+typecodes = strategies.sampled_from(['d', 'f'])
+invalid_typecodes = strategies.sampled_from(['b', 'i', 'l', 'u', 'x'])
 points = scalars_strategies.flatmap(scalars_to_ported_points)
 points_lists = scalars_strategies.flatmap(scalars_to_ported_points_lists)
 contours_strategies = scalars_strategies.map(scalars_to_ported_contours)
 contours = contours_strategies.flatmap(identity)
 contours_pairs = contours_strategies.flatmap(to_pairs)
 contours_triplets = contours_strategies.flatmap(to_triplets)
+float_contours = scalars_to_ported_contours(floats)
+packed_contours = strategies.builds(to_packed_ported_contour, float_contours,
+                                    typecodes)
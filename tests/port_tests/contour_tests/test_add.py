@@ -18,3 +18,25 @@ def test_properties(contour: PortedContour, point: PortedPoint) -> None:
 
     assert len(contour.points) > 0
     assert contour.points[-1] == point
+
+
+@given(strategies.contours, strategies.points)
+def test_metadata(contour: PortedContour, point: PortedPoint) -> None:
+    vertices_count = contour.vertices_count
+    contour.bounding_box
+
+    contour.add(point)
+
+    assert contour.vertices_count == vertices_count + 1
+    assert contour.bounding_box.x_min <= point.x <= contour.bounding_box.x_max
+    assert contour.bounding_box.y_min <= point.y <= contour.bounding_box.y_max
+
+
+@given(strategies.packed_contours, strategies.points)
+def test_packed(contour: PortedContour, point: PortedPoint) -> None:
+    points = contour.points
+
+    contour.add(point)
+
+    assert contour.vertices_count == len(points) + 1
+    assert contour.points[:-1] == points
@@ -0,0 +1,26 @@
+from hypothesis import given
+
+from tests.port_tests.hints import PortedContour
+from . import strategies
+
+
+@given(strategies.packed_contours)
+def test_basic(contour: PortedContour) -> None:
+    result = contour.coordinates
+
+    assert len(result) == 2 * contour.vertices_count
+    assert list(result) == [coordinate
+                            for point in contour
+                            for coordinate in (point.x, point.y)]
+
+
+@given(strategies.packed_contours)
+def test_modification(contour: PortedContour) -> None:
+    vertices_count = contour.vertices_count
+    bounding_box, signed_area = contour.bounding_box, contour.signed_area
+
+    contour.coordinates.extend(contour.coordinates)
+
+    assert contour.vertices_count == vertices_count
+    assert contour.bounding_box == bounding_box
+    assert contour.signed_area == signed_area
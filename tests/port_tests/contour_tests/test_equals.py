@@ -40,3 +40,12 @@ def test_connection_with_inequality(
 
     assert equivalence(not first_contour == second_contour,
                        first_contour != second_contour)
+
+
+@given(strategies.packed_contours)
+def test_storages(contour: PortedContour) -> None:
+    points_contour = PortedContour(list(contour), contour.holes[:],
+                                   contour.is_external)
+
+    assert contour == points_contour
+    assert points_contour == contour
@@ -0,0 +1,44 @@
+from array import array
+
+import pytest
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedContour,
+                                    PortedPoint)
+from . import strategies
+
+
+@given(strategies.float_contours)
+def test_basic(contour: PortedContour) -> None:
+    result = PortedContour.from_coordinates(contour.coordinates,
+                                            contour.holes,
+                                            contour.is_external)
+
+    assert result == contour
+    assert result.typecode == 'd'
+    assert result.vertices_count == contour.vertices_count
+    assert result.bounding_box == contour.bounding_box
+    assert result.signed_area == contour.signed_area
+
+
+@given(strategies.float_contours, strategies.typecodes)
+def test_typecode(contour: PortedContour, typecode: str) -> None:
+    result = PortedContour.from_coordinates(contour.coordinates,
+                                            contour.holes,
+                                            contour.is_external,
+                                            typecode=typecode)
+
+    coordinates = array(typecode, contour.coordinates)
+    assert result.typecode == typecode
+    assert result.coordinates == coordinates
+    assert result.points == [PortedPoint(x, y)
+                             for x, y in zip(coordinates[0::2],
+                                             coordinates[1::2])]
+
+
+@given(strategies.float_contours, strategies.invalid_typecodes)
+def test_invalid_typecode(contour: PortedContour, typecode: str) -> None:
+    with pytest.raises(ValueError):
+        PortedContour.from_coordinates(contour.coordinates, contour.holes,
+                                       contour.is_external,
+                                       typecode=typecode)
@@ -8,3 +8,8 @@ from . import strategies
 @given(strategies.contours)
 def test_round_trip(contour: PortedContour) -> None:
     assert pickle_round_trip(contour) == contour
+
+
+@given(strategies.packed_contours)
+def test_packed(contour: PortedContour) -> None:
+    assert pickle_round_trip(contour) == contour
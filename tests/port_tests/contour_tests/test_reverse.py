@@ -21,3 +21,26 @@ def test_involution(contour: PortedContour) -> None:
     contour.reverse()
 
     assert contour == original
+
+
+
+@given(strategies.contours)
+def test_metadata(contour: PortedContour) -> None:
+    contour.signed_area
+    contour.bounding_box
+
+    contour.reverse()
+
+    fresh_contour = PortedContour(contour.points, contour.holes,
+                                  contour.is_external)
+    assert contour.signed_area == fresh_contour.signed_area
+    assert contour.bounding_box == fresh_contour.bounding_box
+
+
+@given(strategies.packed_contours)
+def test_packed(contour: PortedContour) -> None:
+    points = contour.points
+
+    contour.reverse()
+
+    assert contour.points == points[::-1]
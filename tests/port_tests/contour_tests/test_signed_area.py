@@ -0,0 +1,17 @@
+from hypothesis import given
+
+from tests.port_tests.hints import PortedContour
+from tests.utils import (equivalence,
+                         implication)
+from . import strategies
+
+
+@given(strategies.contours)
+def test_empty(contour: PortedContour) -> None:
+    assert implication(not contour.points, not contour.signed_area)
+
+
+@given(strategies.contours)
+def test_orientation(contour: PortedContour) -> None:
+    assert equivalence(contour.signed_area >= 0, contour.is_counterclockwise)
+
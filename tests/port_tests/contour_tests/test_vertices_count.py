@@ -0,0 +1,12 @@
+from hypothesis import given
+
+from tests.port_tests.hints import PortedContour
+from . import strategies
+
+
+@given(strategies.contours)
+def test_basic(contour: PortedContour) -> None:
+    result = contour.vertices_count
+
+    assert isinstance(result, int)
+    assert result == len(contour.points)
@@ -0,0 +1,6 @@
+from tests.port_tests.factories import scalars_to_ported_segments
+from tests.port_tests.utils import ported_polygons_types
+from tests.strategies import scalars_strategies
+
+polygons_types = ported_polygons_types
+segments = scalars_strategies.flatmap(scalars_to_ported_segments)
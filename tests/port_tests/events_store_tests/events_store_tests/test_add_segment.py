@@ -0,0 +1,32 @@
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedEventsStore,
+                                    PortedPolygonType,
+                                    PortedSegment)
+from . import strategies
+
+
+@given(strategies.segments, strategies.polygons_types)
+def test_basic(segment: PortedSegment,
+               polygon_type: PortedPolygonType) -> None:
+    store = PortedEventsStore()
+
+    result = store.add_segment(segment, polygon_type)
+
+    assert isinstance(result, tuple)
+    assert len(store) == len(result) == 2
+
+
+@given(strategies.segments, strategies.polygons_types)
+def test_properties(segment: PortedSegment,
+                    polygon_type: PortedPolygonType) -> None:
+    store = PortedEventsStore()
+
+    source, target = store.add_segment(segment, polygon_type)
+
+    source_view, target_view = store.view(source), store.view(target)
+    assert source_view.other_event == target_view
+    assert target_view.other_event == source_view
+    assert source_view.is_left is not target_view.is_left
+    assert source_view.segment == segment
+    assert source_view.polygon_type is target_view.polygon_type is polygon_type
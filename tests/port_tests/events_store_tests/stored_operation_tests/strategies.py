@@ -0,0 +1,8 @@
+from tests.port_tests.factories import scalars_to_ported_polygons
+from tests.port_tests.utils import ported_operations_types
+from tests.strategies import scalars_strategies
+from tests.utils import to_pairs
+
+operations_types = ported_operations_types
+polygons_pairs = (scalars_strategies.map(scalars_to_ported_polygons)
+                  .flatmap(to_pairs))
@@ -0,0 +1,32 @@
+from typing import Tuple
+
+import pytest
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedOperationType,
+                                    PortedPolygon,
+                                    PortedStoredOperation)
+from . import strategies
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_basic(polygons_pair: Tuple[PortedPolygon, PortedPolygon],
+               operation_type: PortedOperationType) -> None:
+    left, right = polygons_pair
+
+    result = PortedStoredOperation(left, right, operation_type)
+
+    assert result.left == left
+    assert result.right == right
+    assert result.type is operation_type
+    assert not result.store
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_monotone_chains(polygons_pair: Tuple[PortedPolygon, PortedPolygon],
+                         operation_type: PortedOperationType) -> None:
+    left, right = polygons_pair
+
+    with pytest.raises(ValueError):
+        PortedStoredOperation(left, right, operation_type,
+                              monotone_chains=True)
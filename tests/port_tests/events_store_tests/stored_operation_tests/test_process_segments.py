@@ -0,0 +1,28 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedOperation,
+                                    PortedOperationType,
+                                    PortedPolygon,
+                                    PortedStoredOperation)
+from . import strategies
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_events(polygons_pair: Tuple[PortedPolygon, PortedPolygon],
+                operation_type: PortedOperationType) -> None:
+    left, right = polygons_pair
+    operation = PortedStoredOperation(left, right, operation_type)
+    original = PortedOperation(left, right, operation_type)
+
+    operation.process_segments()
+    original.process_segments()
+
+    events, original_events = operation.events, original.events
+    assert len(operation.store) == len(events) == len(original_events)
+    assert all(event.is_left is original_event.is_left
+               and event.point == original_event.point
+               and event.other_event.point == original_event.other_event.point
+               and event.polygon_type is original_event.polygon_type
+               for event, original_event in zip(events, original_events))
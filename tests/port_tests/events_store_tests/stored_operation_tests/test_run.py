@@ -0,0 +1,66 @@
+import copy
+from typing import Tuple
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedOperation,
+                                    PortedOperationType,
+                                    PortedPolygon,
+                                    PortedStoredOperation)
+from . import strategies
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_basic(polygons_pair: Tuple[PortedPolygon, PortedPolygon],
+               operation_type: PortedOperationType) -> None:
+    left, right = polygons_pair
+    operation = PortedStoredOperation(copy.deepcopy(left),
+                                      copy.deepcopy(right), operation_type)
+    original = PortedOperation(left, right, operation_type)
+
+    try:
+        original.run()
+    except ValueError:
+        return
+    operation.run()
+
+    assert operation.resultant == original.resultant
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_flat(polygons_pair: Tuple[PortedPolygon, PortedPolygon],
+              operation_type: PortedOperationType) -> None:
+    left, right = polygons_pair
+    operation = PortedStoredOperation(copy.deepcopy(left),
+                                      copy.deepcopy(right), operation_type,
+                                      flat=True)
+    original = PortedOperation(left, right, operation_type,
+                               flat=True)
+
+    try:
+        original.run()
+    except ValueError:
+        return
+    operation.run()
+
+    assert operation.resultant == original.resultant
+
+
+@given(strategies.polygons_pairs, strategies.operations_types)
+def test_copy(polygons_pair: Tuple[PortedPolygon, PortedPolygon],
+              operation_type: PortedOperationType) -> None:
+    left, right = polygons_pair
+    operation = PortedStoredOperation(left, right, operation_type)
+    original = PortedOperation(left, right, operation_type)
+    operation.process_segments()
+
+    result = copy.deepcopy(operation)
+
+    try:
+        original.run()
+    except ValueError:
+        return
+    result.run()
+
+    assert result.resultant == original.resultant
+    assert not any(operation.store.positions)
@@ -0,0 +1,4 @@
+from tests.port_tests.factories import scalars_to_ported_polygons
+from tests.strategies import scalars_strategies
+
+polygons = scalars_strategies.flatmap(scalars_to_ported_polygons)
@@ -0,0 +1,19 @@
+from hypothesis import given
+
+from martinez.frozen import freeze
+from tests.port_tests.hints import (PortedFrozenPolygon,
+                                    PortedPolygon)
+from . import strategies
+
+
+@given(strategies.polygons)
+def test_basic(polygon: PortedPolygon) -> None:
+    result = freeze(polygon)
+
+    assert isinstance(result, PortedFrozenPolygon)
+    assert result == PortedFrozenPolygon.from_polygon(polygon)
+
+
+@given(strategies.polygons)
+def test_round_trip(polygon: PortedPolygon) -> None:
+    assert freeze(polygon).thaw() == polygon
@@ -0,0 +1,29 @@
+from hypothesis import strategies
+
+from tests.port_tests.factories import (scalars_to_ported_contours,
+                                        scalars_to_ported_points,
+                                        scalars_to_ported_points_lists)
+from tests.port_tests.hints import PortedFrozenContour
+from tests.port_tests.utils import to_packed_ported_contour
+from tests.strategies import (booleans,
+                              floats,
+                              non_negative_integers_lists,
+                              scalars_strategies)
+from tests.utils import (identity,
+                         to_pairs)
+
+booleans = booleans
+non_negative_integers_lists = non_negative_integers_lists
+points = scalars_strategies.flatmap(scalars_to_ported_points)
+points_lists = scalars_strategies.flatmap(scalars_to_ported_points_lists)
+contours_strategies = scalars_strategies.map(scalars_to_ported_contours)
+contours = contours_strategies.flatmap(identity)
+packed_contours = strategies.builds(to_packed_ported_contour,
+                                    scalars_to_ported_contours(floats),
+                                    strategies.sampled_from(['d', 'f']))
+frozen_contours = (contours | packed_contours).map(
+        PortedFrozenContour.from_contour)
+frozen_contours_pairs = (contours_strategies
+                         .map(lambda contours
+                              : contours.map(PortedFrozenContour.from_contour))
+                         .flatmap(to_pairs))
@@ -0,0 +1,24 @@
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedContour,
+                                    PortedFrozenContour)
+from tests.utils import equivalence
+from . import strategies
+
+
+@given(strategies.frozen_contours)
+def test_reflexivity(contour: PortedFrozenContour) -> None:
+    assert contour == contour
+
+
+@given(strategies.contours, strategies.contours)
+def test_connection_with_contours(first_contour: PortedContour,
+                                  second_contour: PortedContour) -> None:
+    assert equivalence(PortedFrozenContour.from_contour(first_contour)
+                       == PortedFrozenContour.from_contour(second_contour),
+                       first_contour == second_contour)
+
+
+@given(strategies.frozen_contours)
+def test_mutable_contour(contour: PortedFrozenContour) -> None:
+    assert contour != contour.thaw()
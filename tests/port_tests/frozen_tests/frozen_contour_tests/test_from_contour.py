@@ -0,0 +1,68 @@
+import copy
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedContour,
+                                    PortedFrozenContour,
+                                    PortedPoint)
+from . import strategies
+
+
+@given(strategies.contours)
+def test_basic(contour: PortedContour) -> None:
+    result = PortedFrozenContour.from_contour(contour)
+
+    assert isinstance(result, PortedFrozenContour)
+    assert result.points == tuple(contour.points)
+    assert result.holes == tuple(contour.holes)
+    assert result.is_external is contour.is_external
+
+
+@given(strategies.contours)
+def test_metadata(contour: PortedContour) -> None:
+    result = PortedFrozenContour.from_contour(contour)
+
+    assert result.vertices_count == contour.vertices_count
+    assert result.bounding_box == contour.bounding_box
+    if contour.points:
+        assert result.signed_area == contour.signed_area
+
+
+@given(strategies.contours, strategies.points)
+def test_original_modification(contour: PortedContour,
+                               point: PortedPoint) -> None:
+    result = PortedFrozenContour.from_contour(contour)
+    original_result = copy.deepcopy(result)
+
+    contour.add(point)
+    contour.add_hole(0)
+    contour.reverse()
+
+    assert result == original_result
+
+
+@given(strategies.contours, strategies.points)
+def test_original_storage_modification(contour: PortedContour,
+                                       point: PortedPoint) -> None:
+    result = PortedFrozenContour.from_contour(contour)
+    original_result = copy.deepcopy(result)
+    original_hash = hash(result)
+
+    contour.points.append(point)
+
+    assert result == original_result
+    assert hash(result) == original_hash
+    assert result.vertices_count == original_result.vertices_count
+    assert result.bounding_box == original_result.bounding_box
+
+
+@given(strategies.packed_contours)
+def test_original_coordinates_modification(contour: PortedContour) -> None:
+    result = PortedFrozenContour.from_contour(contour)
+    original_result = copy.deepcopy(result)
+
+    coordinates = contour.coordinates
+    for index in range(len(coordinates)):
+        coordinates[index] += 1
+
+    assert result == original_result
@@ -0,0 +1,36 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedContour,
+                                    PortedFrozenContour)
+from tests.utils import implication
+from . import strategies
+
+
+@given(strategies.frozen_contours)
+def test_basic(contour: PortedFrozenContour) -> None:
+    assert isinstance(hash(contour), int)
+    assert hash(contour) == hash(contour)
+
+
+@given(strategies.frozen_contours_pairs)
+def test_connection_with_equality(
+        contours_pair: Tuple[PortedFrozenContour, PortedFrozenContour]
+) -> None:
+    first_contour, second_contour = contours_pair
+
+    assert implication(first_contour == second_contour,
+                       hash(first_contour) == hash(second_contour))
+
+
+@given(strategies.packed_contours)
+def test_packed(contour: PortedContour) -> None:
+    unpacked_contour = PortedContour(contour.points, contour.holes,
+                                     contour.is_external)
+
+    packed_frozen = PortedFrozenContour.from_contour(contour)
+    unpacked_frozen = PortedFrozenContour.from_contour(unpacked_contour)
+
+    assert packed_frozen == unpacked_frozen
+    assert hash(packed_frozen) == hash(unpacked_frozen)
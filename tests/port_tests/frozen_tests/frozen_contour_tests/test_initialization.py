@@ -0,0 +1,34 @@
+from typing import List
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedFrozenContour,
+                                    PortedPoint)
+from . import strategies
+
+
+@given(strategies.points_lists, strategies.non_negative_integers_lists,
+       strategies.booleans)
+def test_basic(points: List[PortedPoint],
+               holes: List[int],
+               is_external: bool) -> None:
+    result = PortedFrozenContour(points, holes, is_external)
+
+    assert result.points == tuple(points)
+    assert result.holes == tuple(holes)
+    assert result.is_external is is_external
+
+
+@given(strategies.points_lists, strategies.non_negative_integers_lists,
+       strategies.booleans, strategies.points)
+def test_immutability(points: List[PortedPoint],
+                      holes: List[int],
+                      is_external: bool,
+                      point: PortedPoint) -> None:
+    result = PortedFrozenContour(points, holes, is_external)
+
+    points.append(point)
+    holes.append(0)
+
+    assert len(result.points) == len(points) - 1
+    assert len(result.holes) == len(holes) - 1
@@ -0,0 +1,28 @@
+import copy
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedContour,
+                                    PortedFrozenContour,
+                                    PortedPoint)
+from . import strategies
+
+
+@given(strategies.frozen_contours)
+def test_basic(contour: PortedFrozenContour) -> None:
+    result = contour.thaw()
+
+    assert isinstance(result, PortedContour)
+    assert PortedFrozenContour.from_contour(result) == contour
+
+
+@given(strategies.frozen_contours, strategies.points)
+def test_modification(contour: PortedFrozenContour,
+                      point: PortedPoint) -> None:
+    original_contour = copy.deepcopy(contour)
+
+    result = contour.thaw()
+    result.add(point)
+    result.add_hole(0)
+
+    assert contour == original_contour
@@ -0,0 +1,23 @@
+from hypothesis import strategies
+
+from tests.port_tests.factories import (scalars_to_ported_points,
+                                        scalars_to_ported_polygons)
+from tests.port_tests.hints import PortedFrozenPolygon
+from tests.port_tests.utils import to_packed_ported_polygon
+from tests.strategies import (floats,
+                              scalars_strategies)
+from tests.utils import (identity,
+                         to_pairs)
+
+points = scalars_strategies.flatmap(scalars_to_ported_points)
+polygons_strategies = scalars_strategies.map(scalars_to_ported_polygons)
+polygons = polygons_strategies.flatmap(identity)
+packed_polygons = strategies.builds(to_packed_ported_polygon,
+                                    scalars_to_ported_polygons(floats),
+                                    strategies.sampled_from(['d', 'f']))
+frozen_polygons = (polygons | packed_polygons).map(
+        PortedFrozenPolygon.from_polygon)
+frozen_polygons_pairs = (polygons_strategies
+                         .map(lambda polygons
+                              : polygons.map(PortedFrozenPolygon.from_polygon))
+                         .flatmap(to_pairs))
@@ -0,0 +1,19 @@
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedFrozenPolygon,
+                                    PortedPolygon)
+from tests.utils import equivalence
+from . import strategies
+
+
+@given(strategies.frozen_polygons)
+def test_reflexivity(polygon: PortedFrozenPolygon) -> None:
+    assert polygon == polygon
+
+
+@given(strategies.polygons, strategies.polygons)
+def test_connection_with_polygons(first_polygon: PortedPolygon,
+                                  second_polygon: PortedPolygon) -> None:
+    assert equivalence(PortedFrozenPolygon.from_polygon(first_polygon)
+                       == PortedFrozenPolygon.from_polygon(second_polygon),
+                       first_polygon == second_polygon)
@@ -0,0 +1,39 @@
+import copy
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedFrozenContour,
+                                    PortedFrozenPolygon,
+                                    PortedPoint,
+                                    PortedPolygon)
+from . import strategies
+
+
+@given(strategies.polygons)
+def test_basic(polygon: PortedPolygon) -> None:
+    result = PortedFrozenPolygon.from_polygon(polygon)
+
+    assert isinstance(result, PortedFrozenPolygon)
+    assert result.contours == tuple(PortedFrozenContour.from_contour(contour)
+                                    for contour in polygon.contours)
+
+
+@given(strategies.polygons)
+def test_metadata(polygon: PortedPolygon) -> None:
+    result = PortedFrozenPolygon.from_polygon(polygon)
+
+    assert result.vertices_count == polygon.vertices_count
+    assert result.bounding_box == polygon.bounding_box
+
+
+@given(strategies.polygons, strategies.points)
+def test_original_modification(polygon: PortedPolygon,
+                               point: PortedPoint) -> None:
+    result = PortedFrozenPolygon.from_polygon(polygon)
+    original_result = copy.deepcopy(result)
+
+    for contour in polygon.contours:
+        contour.add(point)
+        contour.clear_holes()
+
+    assert result == original_result
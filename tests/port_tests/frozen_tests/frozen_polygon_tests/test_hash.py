@@ -0,0 +1,28 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from tests.port_tests.hints import PortedFrozenPolygon
+from tests.utils import implication
+from . import strategies
+
+
+@given(strategies.frozen_polygons)
+def test_basic(polygon: PortedFrozenPolygon) -> None:
+    assert isinstance(hash(polygon), int)
+    assert hash(polygon) == hash(polygon)
+
+
+@given(strategies.frozen_polygons_pairs)
+def test_connection_with_equality(
+        polygons_pair: Tuple[PortedFrozenPolygon, PortedFrozenPolygon]
+) -> None:
+    first_polygon, second_polygon = polygons_pair
+
+    assert implication(first_polygon == second_polygon,
+                       hash(first_polygon) == hash(second_polygon))
+
+
+@given(strategies.frozen_polygons)
+def test_set(polygon: PortedFrozenPolygon) -> None:
+    assert polygon in {PortedFrozenPolygon.from_polygon(polygon.thaw())}
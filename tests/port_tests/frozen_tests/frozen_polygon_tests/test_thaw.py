@@ -0,0 +1,29 @@
+import copy
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedFrozenPolygon,
+                                    PortedPoint,
+                                    PortedPolygon)
+from . import strategies
+
+
+@given(strategies.frozen_polygons)
+def test_basic(polygon: PortedFrozenPolygon) -> None:
+    result = polygon.thaw()
+
+    assert isinstance(result, PortedPolygon)
+    assert PortedFrozenPolygon.from_polygon(result) == polygon
+
+
+@given(strategies.frozen_polygons, strategies.points)
+def test_modification(polygon: PortedFrozenPolygon,
+                      point: PortedPoint) -> None:
+    original_polygon = copy.deepcopy(polygon)
+
+    result = polygon.thaw()
+    for contour in result.contours:
+        contour.add(point)
+        contour.clear_holes()
+
+    assert polygon == original_polygon
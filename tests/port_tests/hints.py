@@ -1,22 +1,41 @@
 from typing import Tuple
 
 from martinez.boolean import (EdgeType as PortedEdgeType,
+                              EventsQueue as PortedEventsQueue,
                               EventsQueueKey as PortedEventsQueueKey,
                               Operation as PortedOperation,
                               OperationType as PortedOperationType,
                               PolygonType as PortedPolygonType,
                               SweepEvent as PortedSweepEvent,
-                              SweepLineKey as PortedSweepLineKey)
+                              SweepLineKey as PortedSweepLineKey,
+                              UnprocessedPositions
+                              as PortedUnprocessedPositions)
 from martinez.bounding_box import BoundingBox as PortedBoundingBox
+from martinez.cache import (ComputeCache as PortedComputeCache,
+                            DiskCache as PortedDiskCache)
 from martinez.contour import Contour as PortedContour
+from martinez.events_store import (EventsStore as PortedEventsStore,
+                                   StoredOperation as PortedStoredOperation)
+from martinez.frozen import (FrozenContour as PortedFrozenContour,
+                             FrozenPolygon as PortedFrozenPolygon)
+from martinez.lazy import LazyOperation as PortedLazyOperation
 from martinez.point import Point as PortedPoint
 from martinez.polygon import Polygon as PortedPolygon
 from martinez.segment import Segment as PortedSegment
+from martinez.sweep_line import SweepLine as PortedSweepLine
+from martinez.vertices import VertexTable as PortedVertexTable
 
 PortedBoundingBox = PortedBoundingBox
+PortedComputeCache = PortedComputeCache
 PortedContour = PortedContour
+PortedDiskCache = PortedDiskCache
 PortedEdgeType = PortedEdgeType
+PortedEventsQueue = PortedEventsQueue
 PortedEventsQueueKey = PortedEventsQueueKey
+PortedEventsStore = PortedEventsStore
+PortedFrozenContour = PortedFrozenContour
+PortedFrozenPolygon = PortedFrozenPolygon
+PortedLazyOperation = PortedLazyOperation
 PortedOperation = PortedOperation
 PortedOperationType = PortedOperationType
 PortedPoint = PortedPoint
@@ -25,5 +44,9 @@ PortedPointsTriplet = Tuple[PortedPoint, PortedPoint, PortedPoint]
 PortedPolygon = PortedPolygon
 PortedPolygonType = PortedPolygonType
 PortedSegment = PortedSegment
+PortedStoredOperation = PortedStoredOperation
 PortedSweepEvent = PortedSweepEvent
+PortedSweepLine = PortedSweepLine
 PortedSweepLineKey = PortedSweepLineKey
+PortedUnprocessedPositions = PortedUnprocessedPositions
+PortedVertexTable = PortedVertexTable
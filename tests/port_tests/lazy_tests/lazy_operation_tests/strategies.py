@@ -0,0 +1,26 @@
+from typing import Tuple
+
+from hypothesis import strategies
+
+from tests.port_tests.factories import scalars_to_ported_polygons
+from tests.port_tests.hints import (PortedLazyOperation,
+                                    PortedOperation,
+                                    PortedOperationType,
+                                    PortedPolygon)
+from tests.port_tests.utils import ported_operations_types
+from tests.strategies import scalars_strategies
+from tests.utils import to_pairs
+
+operations_types = ported_operations_types
+polygons_pairs = (scalars_strategies.map(scalars_to_ported_polygons)
+                  .flatmap(to_pairs))
+
+
+def to_operation(polygons_pair: Tuple[PortedPolygon, PortedPolygon],
+                 operation_type: PortedOperationType) -> PortedOperation:
+    left, right = polygons_pair
+    return PortedOperation(left, right, operation_type)
+
+
+operations = strategies.builds(to_operation, polygons_pairs, operations_types)
+lazy_operations = strategies.builds(PortedLazyOperation, operations)
@@ -0,0 +1,21 @@
+from hypothesis import given
+
+from tests.port_tests.hints import PortedLazyOperation
+from . import strategies
+
+
+@given(strategies.lazy_operations)
+def test_basic(lazy_operation: PortedLazyOperation) -> None:
+    result = lazy_operation.extent
+
+    assert not lazy_operation.is_computed
+    try:
+        resultant = lazy_operation.resultant
+    except ValueError:
+        return
+    if resultant.contours:
+        bounding_box = resultant.bounding_box
+        assert result.x_min <= bounding_box.x_min
+        assert result.y_min <= bounding_box.y_min
+        assert bounding_box.x_max <= result.x_max
+        assert bounding_box.y_max <= result.y_max
@@ -0,0 +1,13 @@
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedLazyOperation,
+                                    PortedOperation)
+from . import strategies
+
+
+@given(strategies.operations)
+def test_basic(operation: PortedOperation) -> None:
+    result = PortedLazyOperation(operation)
+
+    assert result.operation is operation
+    assert not result.is_computed
@@ -0,0 +1,16 @@
+import copy
+
+from hypothesis import given
+
+from tests.port_tests.hints import PortedLazyOperation
+from . import strategies
+
+
+@given(strategies.lazy_operations)
+def test_basic(lazy_operation: PortedLazyOperation) -> None:
+    operation = copy.deepcopy(lazy_operation.operation)
+
+    result = lazy_operation.is_trivial
+
+    assert result is operation.is_trivial
+    assert lazy_operation.is_computed is result
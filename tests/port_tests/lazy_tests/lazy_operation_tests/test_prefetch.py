@@ -0,0 +1,15 @@
+from hypothesis import given
+
+from tests.port_tests.hints import PortedLazyOperation
+from . import strategies
+
+
+@given(strategies.lazy_operations)
+def test_basic(lazy_operation: PortedLazyOperation) -> None:
+    try:
+        result = lazy_operation.prefetch()
+    except ValueError:
+        return
+
+    assert result is None
+    assert lazy_operation.is_computed
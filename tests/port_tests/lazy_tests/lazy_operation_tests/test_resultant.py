@@ -0,0 +1,33 @@
+import copy
+
+from hypothesis import given
+
+from tests.port_tests.hints import PortedLazyOperation
+from . import strategies
+
+
+@given(strategies.lazy_operations)
+def test_basic(lazy_operation: PortedLazyOperation) -> None:
+    operation = copy.deepcopy(lazy_operation.operation)
+
+    try:
+        result = lazy_operation.resultant
+    except ValueError:
+        return
+
+    operation.run()
+    assert lazy_operation.is_computed
+    assert result == operation.resultant
+    assert lazy_operation.resultant is result
+
+
+@given(strategies.lazy_operations)
+def test_accessors(lazy_operation: PortedLazyOperation) -> None:
+    try:
+        result = lazy_operation.resultant
+    except ValueError:
+        return
+
+    assert lazy_operation.bounding_box == result.bounding_box
+    assert lazy_operation.area == result.area
+    assert list(lazy_operation) == result.contours
@@ -0,0 +1,44 @@
+from typing import Tuple
+
+from hypothesis import strategies
+
+from tests.port_tests.factories import scalars_to_ported_polygons
+from tests.port_tests.hints import (PortedLazyOperation,
+                                    PortedOperation,
+                                    PortedOperationType,
+                                    PortedPolygon,
+                                    PortedVertexTable)
+from tests.port_tests.utils import ported_operations_types
+from tests.strategies import scalars_strategies
+from tests.utils import to_pairs
+
+operations_types = ported_operations_types
+polygons_pairs = (scalars_strategies.map(scalars_to_ported_polygons)
+                  .flatmap(to_pairs))
+
+
+def to_operation(polygons_pair: Tuple[PortedPolygon, PortedPolygon],
+                 operation_type: PortedOperationType) -> PortedOperation:
+    left, right = polygons_pair
+    return PortedOperation(left, right, operation_type)
+
+
+operations = strategies.builds(to_operation, polygons_pairs, operations_types)
+lazy_operations = strategies.builds(PortedLazyOperation, operations)
+lazy_operations_lists = strategies.lists(lazy_operations,
+                                         max_size=5)
+
+
+def to_interning_operation(polygons_pair: Tuple[PortedPolygon, PortedPolygon],
+                           operation_type: PortedOperationType
+                           ) -> PortedOperation:
+    left, right = polygons_pair
+    return PortedOperation(left, right, operation_type,
+                           vertex_table=PortedVertexTable())
+
+
+interning_operations = strategies.builds(to_interning_operation,
+                                         polygons_pairs, operations_types)
+interning_lazy_operations_lists = strategies.lists(
+        strategies.builds(PortedLazyOperation, interning_operations),
+        max_size=5)
@@ -0,0 +1,63 @@
+import copy
+from typing import (Callable,
+                    Iterable,
+                    Iterator,
+                    List,
+                    TypeVar)
+
+from hypothesis import given
+
+from martinez.lazy import prefetch
+from tests.port_tests.hints import PortedLazyOperation
+from . import strategies
+
+
+@given(strategies.lazy_operations_lists)
+def test_basic(lazy_operations: List[PortedLazyOperation]) -> None:
+    operations = [copy.deepcopy(lazy_operation.operation)
+                  for lazy_operation in lazy_operations]
+
+    try:
+        result = prefetch(lazy_operations)
+    except ValueError:
+        return
+
+    assert result is None
+    assert all(lazy_operation.is_computed
+               for lazy_operation in lazy_operations)
+    for operation in operations:
+        operation.run()
+    assert [lazy_operation.resultant
+            for lazy_operation in lazy_operations] == [
+               operation.resultant for operation in operations]
+
+
+@given(strategies.interning_lazy_operations_lists)
+def test_copies(lazy_operations: List[PortedLazyOperation]) -> None:
+    operations = [copy.deepcopy(lazy_operation.operation)
+                  for lazy_operation in lazy_operations]
+
+    try:
+        prefetch(lazy_operations,
+                 map_=copying_map)
+    except ValueError:
+        return
+
+    for operation in operations:
+        operation.run()
+    assert [lazy_operation.operation.resultant
+            for lazy_operation in lazy_operations] == [
+               operation.resultant for operation in operations]
+    assert [lazy_operation.operation.vertices_indices
+            for lazy_operation in lazy_operations] == [
+               operation.vertices_indices for operation in operations]
+
+
+Domain = TypeVar('Domain')
+Range = TypeVar('Range')
+
+
+def copying_map(function: Callable[[Domain], Range],
+                arguments: Iterable[Domain]) -> Iterator[Range]:
+    # runs function on copies of arguments like worker processes do
+    return map(function, map(copy.deepcopy, arguments))
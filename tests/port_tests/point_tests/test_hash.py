@@ -0,0 +1,17 @@
+from hypothesis import given
+
+from tests.port_tests.hints import PortedPoint
+from tests.utils import implication
+from . import strategies
+
+
+@given(strategies.points)
+def test_basic(point: PortedPoint) -> None:
+    assert isinstance(hash(point), int)
+
+
+@given(strategies.points, strategies.points)
+def test_connection_with_equality(first_point: PortedPoint,
+                                  second_point: PortedPoint) -> None:
+    assert implication(first_point == second_point,
+                       hash(first_point) == hash(second_point))
@@ -0,0 +1,43 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from tests.port_tests.hints import PortedPolygon
+from . import strategies
+
+
+@given(strategies.polygons_pairs)
+def test_basic(polygons_pair: Tuple[PortedPolygon, PortedPolygon]) -> None:
+    first_polygon, second_polygon = polygons_pair
+
+    results = [first_polygon.add(contour)
+               for contour in second_polygon.contours]
+
+    assert all(result is None for result in results)
+
+
+@given(strategies.polygons_pairs)
+def test_properties(polygons_pair: Tuple[PortedPolygon, PortedPolygon]
+                    ) -> None:
+    first_polygon, second_polygon = polygons_pair
+    contours = first_polygon.contours[:]
+
+    for contour in second_polygon.contours:
+        first_polygon.add(contour)
+
+    assert first_polygon.contours == contours + second_polygon.contours
+
+
+@given(strategies.polygons_pairs)
+def test_metadata(polygons_pair: Tuple[PortedPolygon, PortedPolygon]) -> None:
+    first_polygon, second_polygon = polygons_pair
+    vertices_count = first_polygon.vertices_count
+    first_polygon.bounding_box
+
+    for contour in second_polygon.contours:
+        first_polygon.add(contour)
+
+    assert first_polygon.vertices_count == (vertices_count
+                                            + second_polygon.vertices_count)
+    assert first_polygon.bounding_box == PortedPolygon(
+            first_polygon.contours).bounding_box
@@ -0,0 +1,15 @@
+from hypothesis import given
+
+from tests.port_tests.hints import PortedPolygon
+from . import strategies
+
+
+@given(strategies.polygons)
+def test_basic(polygon: PortedPolygon) -> None:
+    result = polygon.area
+
+    assert result == sum(abs(contour.signed_area)
+                         if contour.is_external
+                         else -abs(contour.signed_area)
+                         for contour in polygon.contours
+                         if contour.points)
@@ -3,7 +3,8 @@ from typing import Tuple
 
 from hypothesis import given
 
-from tests.port_tests.hints import PortedPolygon
+from tests.port_tests.hints import (PortedPoint,
+                                    PortedPolygon)
 from . import strategies
 
 
@@ -42,3 +43,32 @@ def test_elements(polygons_pair: Tuple[PortedPolygon, PortedPolygon]) -> None:
                for first_contour, second_contour
                in zip(first_polygon.contours[-len(second_polygon.contours):],
                       second_polygon.contours))
+
+
+@given(strategies.polygons_pairs)
+def test_metadata(polygons_pair: Tuple[PortedPolygon, PortedPolygon]) -> None:
+    first_polygon, second_polygon = polygons_pair
+
+    vertices_count = first_polygon.vertices_count
+    first_polygon.bounding_box
+
+    first_polygon.join(second_polygon)
+
+    assert first_polygon.vertices_count == (vertices_count
+                                            + second_polygon.vertices_count)
+    assert first_polygon.bounding_box == PortedPolygon(
+            first_polygon.contours).bounding_box
+
+
+@given(strategies.polygons_pairs, strategies.points)
+def test_modification(polygons_pair: Tuple[PortedPolygon, PortedPolygon],
+                      point: PortedPoint) -> None:
+    first_polygon, second_polygon = polygons_pair
+
+    original_second_polygon = copy.deepcopy(second_polygon)
+
+    first_polygon.join(second_polygon)
+    for contour in first_polygon.contours:
+        contour.add(point)
+
+    assert second_polygon == original_second_polygon
@@ -0,0 +1,61 @@
+import copy
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedPoint,
+                                    PortedPolygon)
+from . import strategies
+
+
+@given(strategies.polygons)
+def test_basic(polygon: PortedPolygon) -> None:
+    result = polygon.share()
+
+    assert isinstance(result, PortedPolygon)
+    assert result is not polygon
+    assert result == polygon
+
+
+@given(strategies.polygons)
+def test_metadata(polygon: PortedPolygon) -> None:
+    result = polygon.share()
+
+    assert result.vertices_count == polygon.vertices_count
+    assert result.bounding_box == polygon.bounding_box
+
+
+@given(strategies.polygons, strategies.points)
+def test_modification(polygon: PortedPolygon, point: PortedPoint) -> None:
+    original = copy.deepcopy(polygon)
+
+    result = polygon.share()
+    for contour in result.contours:
+        contour.add(point)
+        contour.clear_holes()
+
+    assert polygon == original
+
+
+@given(strategies.polygons, strategies.points)
+def test_original_modification(polygon: PortedPolygon,
+                               point: PortedPoint) -> None:
+    result = polygon.share()
+    original_result = copy.deepcopy(result)
+
+    for contour in polygon.contours:
+        contour.add(point)
+        contour.clear_holes()
+
+    assert result == original_result
+
+
+@given(strategies.polygons, strategies.points)
+def test_storage_modification(polygon: PortedPolygon,
+                              point: PortedPoint) -> None:
+    original = copy.deepcopy(polygon)
+
+    result = polygon.share()
+    for contour in result.contours:
+        contour.points.append(point)
+
+    assert polygon == original
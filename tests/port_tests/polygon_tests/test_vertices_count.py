@@ -0,0 +1,12 @@
+from hypothesis import given
+
+from tests.port_tests.hints import PortedPolygon
+from . import strategies
+
+
+@given(strategies.polygons)
+def test_basic(polygon: PortedPolygon) -> None:
+    result = polygon.vertices_count
+
+    assert isinstance(result, int)
+    assert result == sum(len(contour.points) for contour in polygon.contours)
@@ -0,0 +1,19 @@
+from typing import List
+
+from hypothesis import strategies
+
+from tests.port_tests.hints import PortedSweepLine
+from tests.utils import identity
+
+
+def to_sweep_line(values: List[int]) -> PortedSweepLine:
+    result = PortedSweepLine(identity)
+    for value in values:
+        result.add(value)
+    return result
+
+
+values = strategies.integers()
+values_lists = strategies.lists(values)
+sweep_lines = values_lists.map(to_sweep_line)
+non_empty_sweep_lines = values_lists.filter(bool).map(to_sweep_line)
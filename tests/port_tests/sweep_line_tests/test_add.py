@@ -0,0 +1,39 @@
+from hypothesis import given
+
+from tests.port_tests.hints import PortedSweepLine
+from . import strategies
+
+
+@given(strategies.sweep_lines, strategies.values)
+def test_basic(sweep_line: PortedSweepLine, value: int) -> None:
+    values = set(sweep_line)
+
+    result = sweep_line.add(value)
+
+    assert result.value == value
+    assert list(sweep_line) == sorted(values | {value})
+    assert len(sweep_line) == len(values | {value})
+
+
+@given(strategies.sweep_lines, strategies.values)
+def test_neighbours(sweep_line: PortedSweepLine, value: int) -> None:
+    result = sweep_line.add(value)
+
+    assert (result.predecessor is None
+            or result.predecessor.value < value
+            and result.predecessor.successor is result)
+    assert (result.successor is None
+            or value < result.successor.value
+            and result.successor.predecessor is result)
+
+
+@given(strategies.non_empty_sweep_lines)
+def test_equivalent(sweep_line: PortedSweepLine) -> None:
+    value = next(iter(sweep_line))
+    node = sweep_line.add(value)
+    size = len(sweep_line)
+
+    result = sweep_line.add(value)
+
+    assert result is node
+    assert len(sweep_line) == size
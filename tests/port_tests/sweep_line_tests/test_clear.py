@@ -0,0 +1,33 @@
+from hypothesis import given
+
+from tests.port_tests.hints import PortedSweepLine
+from . import strategies
+
+
+@given(strategies.sweep_lines)
+def test_basic(sweep_line: PortedSweepLine) -> None:
+    result = sweep_line.clear()
+
+    assert result is None
+    assert not len(sweep_line)
+    assert not list(sweep_line)
+
+
+@given(strategies.non_empty_sweep_lines)
+def test_nodes(sweep_line: PortedSweepLine) -> None:
+    nodes = [sweep_line.add(value) for value in list(sweep_line)]
+
+    sweep_line.clear()
+
+    assert all(node.parent is node.left is node.right is node.predecessor
+               is node.successor is None
+               for node in nodes)
+
+
+@given(strategies.sweep_lines, strategies.values)
+def test_reuse(sweep_line: PortedSweepLine, value: int) -> None:
+    sweep_line.clear()
+
+    sweep_line.add(value)
+
+    assert list(sweep_line) == [value]
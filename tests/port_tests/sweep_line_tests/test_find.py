@@ -0,0 +1,23 @@
+from hypothesis import given
+
+from tests.port_tests.hints import PortedSweepLine
+from . import strategies
+
+
+@given(strategies.non_empty_sweep_lines)
+def test_basic(sweep_line: PortedSweepLine) -> None:
+    value = next(iter(sweep_line))
+
+    result = sweep_line.find(value)
+
+    assert result is sweep_line.add(value)
+    assert result.value == value
+
+
+@given(strategies.sweep_lines, strategies.values)
+def test_removed(sweep_line: PortedSweepLine, value: int) -> None:
+    sweep_line.remove(sweep_line.add(value))
+
+    result = sweep_line.find(value)
+
+    assert result is None
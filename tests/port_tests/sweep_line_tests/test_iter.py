@@ -0,0 +1,12 @@
+from hypothesis import given
+
+from tests.port_tests.hints import PortedSweepLine
+from . import strategies
+
+
+@given(strategies.sweep_lines)
+def test_basic(sweep_line: PortedSweepLine) -> None:
+    result = list(sweep_line)
+
+    assert result == sorted(set(result))
+    assert len(result) == len(sweep_line)
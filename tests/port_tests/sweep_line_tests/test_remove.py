@@ -0,0 +1,29 @@
+from hypothesis import given
+
+from tests.port_tests.hints import PortedSweepLine
+from . import strategies
+
+
+@given(strategies.non_empty_sweep_lines, strategies.values)
+def test_basic(sweep_line: PortedSweepLine, value: int) -> None:
+    values = set(sweep_line) | {value}
+    node = sweep_line.add(value)
+    predecessor, successor = node.predecessor, node.successor
+
+    sweep_line.remove(node)
+
+    assert list(sweep_line) == sorted(values - {value})
+    assert len(sweep_line) == len(values) - 1
+    assert predecessor is None or predecessor.successor is successor
+    assert successor is None or successor.predecessor is predecessor
+
+
+@given(strategies.non_empty_sweep_lines)
+def test_all(sweep_line: PortedSweepLine) -> None:
+    nodes = [sweep_line.add(value) for value in list(sweep_line)]
+
+    for node in nodes:
+        sweep_line.remove(node)
+
+    assert not len(sweep_line)
+    assert not list(sweep_line)
@@ -1,11 +1,22 @@
-from tests.port_tests.factories import (scalars_to_ported_points_triplets,
+from functools import partial
+
+from hypothesis import strategies
+
+from tests.port_tests.factories import (scalars_to_ported_points_lists,
+                                        scalars_to_ported_points_triplets,
                                         scalars_to_ported_segments)
-from tests.strategies import (single_precision_scalars_strategies
+from tests.strategies import (booleans,
+                              single_precision_scalars_strategies
                               as scalars_strategies)
 from tests.utils import (identity,
                          to_pairs)
 
+booleans = booleans
+booleans_lists = strategies.lists(booleans)
 points_triplets = scalars_strategies.flatmap(scalars_to_ported_points_triplets)
 segments_strategies = scalars_strategies.map(scalars_to_ported_segments)
 segments = segments_strategies.flatmap(identity)
 segments_pairs = segments_strategies.flatmap(to_pairs)
+points_lists = scalars_strategies.flatmap(
+        partial(scalars_to_ported_points_lists,
+                min_size=2))
@@ -0,0 +1,35 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from martinez.utilities import (find_intersections,
+                                find_intersections_by_endpoints)
+from tests.port_tests.hints import PortedSegment
+from . import strategies
+
+
+@given(strategies.segments_pairs)
+def test_basic(segments_pair: Tuple[PortedSegment, PortedSegment]) -> None:
+    first_segment, second_segment = segments_pair
+
+    result = find_intersections_by_endpoints(
+            first_segment.source, first_segment.target,
+            second_segment.source, second_segment.target)
+
+    assert result == find_intersections(first_segment, second_segment)
+
+
+@given(strategies.segments)
+def test_same_segment(segment: PortedSegment) -> None:
+    result = find_intersections_by_endpoints(segment.source, segment.target,
+                                             segment.source, segment.target)
+
+    assert result == find_intersections(segment, segment)
+
+
+@given(strategies.segments)
+def test_reversed_segment(segment: PortedSegment) -> None:
+    result = find_intersections_by_endpoints(segment.source, segment.target,
+                                             segment.target, segment.source)
+
+    assert result == find_intersections(segment, segment.reversed)
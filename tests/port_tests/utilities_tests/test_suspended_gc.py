@@ -0,0 +1,37 @@
+import gc
+
+from hypothesis import given
+
+from martinez.utilities import suspended_gc
+from . import strategies
+
+
+@given(strategies.booleans)
+def test_basic(is_enabled: bool) -> None:
+    was_enabled = gc.isenabled()
+    (gc.enable if is_enabled else gc.disable)()
+    try:
+        with suspended_gc():
+            is_enabled_inside = gc.isenabled()
+        is_enabled_after = gc.isenabled()
+    finally:
+        (gc.enable if was_enabled else gc.disable)()
+
+    assert not is_enabled_inside
+    assert is_enabled_after is is_enabled
+
+
+def test_nested() -> None:
+    was_enabled = gc.isenabled()
+    gc.enable()
+    try:
+        with suspended_gc():
+            with suspended_gc():
+                pass
+            is_enabled_between = gc.isenabled()
+        is_enabled_after = gc.isenabled()
+    finally:
+        (gc.enable if was_enabled else gc.disable)()
+
+    assert not is_enabled_between
+    assert is_enabled_after
@@ -0,0 +1,37 @@
+from typing import List
+
+from hypothesis import given
+
+from martinez.segment import points_key
+from martinez.utilities import (to_monotone_chains,
+                                to_segments)
+from tests.port_tests.hints import PortedPoint
+from . import strategies
+
+
+@given(strategies.points_lists)
+def test_basic(points: List[PortedPoint]) -> None:
+    result = to_monotone_chains(points)
+
+    assert isinstance(result, list)
+    assert all(isinstance(chain, list) and chain for chain in result)
+
+
+@given(strategies.points_lists)
+def test_segments(points: List[PortedPoint]) -> None:
+    result = to_monotone_chains(points)
+
+    segments = to_segments(points)
+    chains_segments = [segment for chain in result for segment in chain]
+    assert len(chains_segments) == len(segments)
+    assert all(segment in chains_segments for segment in segments)
+
+
+@given(strategies.points_lists)
+def test_monotonicity(points: List[PortedPoint]) -> None:
+    result = to_monotone_chains(points)
+
+    assert all(points_key(chain[index].min) < points_key(chain[index + 1].min)
+               and chain[index].max == chain[index + 1].min
+               for chain in result
+               for index in range(len(chain) - 1))
@@ -0,0 +1,33 @@
+import gc
+from typing import (Iterator,
+                    List)
+
+from hypothesis import given
+
+from martinez.utilities import with_suspended_gc
+from . import strategies
+
+
+@given(strategies.booleans_lists)
+def test_basic(values: List[bool]) -> None:
+    was_enabled = gc.isenabled()
+    gc.enable()
+    try:
+        are_enabled_inside, are_enabled_outside = [], []
+        for _ in with_suspended_gc(to_gc_states(values, are_enabled_inside)):
+            are_enabled_outside.append(gc.isenabled())
+        is_enabled_after = gc.isenabled()
+    finally:
+        (gc.enable if was_enabled else gc.disable)()
+
+    assert not any(are_enabled_inside)
+    assert all(are_enabled_outside)
+    assert len(are_enabled_outside) == len(values)
+    assert is_enabled_after
+
+
+def to_gc_states(values: List[bool], states: List[bool]) -> Iterator[bool]:
+    for value in values:
+        states.append(gc.isenabled())
+        yield value
+    states.append(gc.isenabled())
@@ -52,6 +52,20 @@ def to_non_overlapping_ported_contours_list(contours: List[PortedContour]
     return result
 
 
+def to_packed_ported_contour(contour: PortedContour,
+                              typecode: str = 'd') -> PortedContour:
+    return PortedContour.from_coordinates(contour.coordinates,
+                                          list(contour.holes),
+                                          contour.is_external,
+                                          typecode=typecode)
+
+
+def to_packed_ported_polygon(polygon: PortedPolygon,
+                             typecode: str = 'd') -> PortedPolygon:
+    return PortedPolygon([to_packed_ported_contour(contour, typecode)
+                          for contour in polygon.contours])
+
+
 def to_ported_segments(points: List[PortedPoint]) -> Sequence[PortedSegment]:
     return [PortedSegment(points[index], points[(index + 1) % len(points)])
             for index in range(len(points))]
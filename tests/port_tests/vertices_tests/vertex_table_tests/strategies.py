@@ -0,0 +1,8 @@
+from tests.port_tests.factories import (scalars_to_ported_contours,
+                                        scalars_to_ported_points_lists,
+                                        scalars_to_ported_polygons)
+from tests.strategies import scalars_strategies
+
+points_lists = scalars_strategies.flatmap(scalars_to_ported_points_lists)
+contours = scalars_strategies.flatmap(scalars_to_ported_contours)
+polygons = scalars_strategies.flatmap(scalars_to_ported_polygons)
@@ -0,0 +1,8 @@
+from tests.port_tests.hints import PortedVertexTable
+
+
+def test_basic() -> None:
+    result = PortedVertexTable()
+
+    assert result.vertices == []
+    assert len(result) == 0
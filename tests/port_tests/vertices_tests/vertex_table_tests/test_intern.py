@@ -0,0 +1,31 @@
+from typing import List
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedPoint,
+                                    PortedVertexTable)
+from . import strategies
+
+
+@given(strategies.points_lists)
+def test_basic(points: List[PortedPoint]) -> None:
+    table = PortedVertexTable()
+
+    result = [table.intern(point) for point in points]
+
+    assert all(table.vertices[index] == point
+               for index, point in zip(result, points))
+
+
+@given(strategies.points_lists)
+def test_deduplication(points: List[PortedPoint]) -> None:
+    table = PortedVertexTable()
+
+    result = [table.intern(point) for point in points]
+
+    assert len(table) == len(set(result))
+    assert all(first_point != second_point
+               for index, first_point in enumerate(table.vertices)
+               for second_point in table.vertices[index + 1:])
+    assert [table.intern(PortedPoint(point.x, point.y))
+            for point in points] == result
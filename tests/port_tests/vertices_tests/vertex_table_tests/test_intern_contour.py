@@ -0,0 +1,27 @@
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedContour,
+                                    PortedVertexTable)
+from . import strategies
+
+
+@given(strategies.contours)
+def test_basic(contour: PortedContour) -> None:
+    table = PortedVertexTable()
+
+    result, indices = table.intern_contour(contour)
+
+    assert result == contour
+    assert [table.vertices[index] for index in indices] == contour.points
+
+
+@given(strategies.contours)
+def test_sharing(contour: PortedContour) -> None:
+    table = PortedVertexTable()
+
+    result, _ = table.intern_contour(contour)
+    other_result, _ = table.intern_contour(
+            PortedContour(contour.points[::-1], [], contour.is_external))
+
+    assert all(any(point is vertex for vertex in table.vertices)
+               for point in result.points + other_result.points)
@@ -0,0 +1,20 @@
+import copy
+
+from hypothesis import given
+
+from tests.port_tests.hints import (PortedPolygon,
+                                    PortedVertexTable)
+from . import strategies
+
+
+@given(strategies.polygons)
+def test_basic(polygon: PortedPolygon) -> None:
+    original = copy.deepcopy(polygon)
+    table = PortedVertexTable()
+
+    result = table.intern_polygon(polygon)
+
+    assert polygon == original
+    assert len(result) == len(polygon.contours)
+    assert all([table.vertices[index] for index in indices] == contour.points
+               for indices, contour in zip(result, polygon.contours))